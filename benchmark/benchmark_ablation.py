@@ -1,14 +1,16 @@
 # flake8: noqa
 """Ablation study for GraphQLer.
 
-Runs four configurations of GraphQLer on each API to isolate the contribution of
-(a) the dependency graph and (b) the objects bucket to operation coverage.
+Runs five configurations of GraphQLer on each API to isolate the contribution of
+(a) the dependency graph, (b) the objects bucket and (c) coverage-guided chain
+scheduling to operation coverage.
 
 Configurations per API:
   1. baseline   — USE_DEPENDENCY_GRAPH=False, USE_OBJECTS_BUCKET=False
   2. graph_only — USE_DEPENDENCY_GRAPH=True,  USE_OBJECTS_BUCKET=False
   3. bucket_only— USE_DEPENDENCY_GRAPH=False, USE_OBJECTS_BUCKET=True
   4. full       — USE_DEPENDENCY_GRAPH=True,  USE_OBJECTS_BUCKET=True  (full GraphQLer)
+  5. full_scheduled — full, with CHAIN_SCHEDULING="coverage"
 
 Results are written to ablation_results.csv alongside this script.
 """
@@ -23,6 +25,7 @@ from graphqler.__main__ import run_compile_mode, run_fuzz_mode
 from graphqler.compiler.compiler import Compiler
 from graphqler.fuzzer import Fuzzer
 from graphqler import config
+from graphqler.utils.run_context import RunContext
 
 # ------------------------------------------------------------------
 # APIs to evaluate
@@ -50,25 +53,21 @@ SHARED_CONFIG = {
     "SKIP_MAXIMAL_PAYLOADS": True,
     "DEBUG": False,
     "MAX_TIME": TIME_BUDGET,
+    "CHAIN_SCHEDULING": "file",
 }
 
-# The four ablation configurations
+# The ablation configurations
 CONFIGURATIONS = [
     {"name": "baseline",     "USE_DEPENDENCY_GRAPH": False, "USE_OBJECTS_BUCKET": False},
     {"name": "graph_only",   "USE_DEPENDENCY_GRAPH": True,  "USE_OBJECTS_BUCKET": False},
     {"name": "bucket_only",  "USE_DEPENDENCY_GRAPH": False, "USE_OBJECTS_BUCKET": True},
     {"name": "full",         "USE_DEPENDENCY_GRAPH": True,  "USE_OBJECTS_BUCKET": True},
+    {"name": "full_scheduled", "USE_DEPENDENCY_GRAPH": True, "USE_OBJECTS_BUCKET": True, "CHAIN_SCHEDULING": "coverage"},
 ]
 
 OUTPUT_CSV = path.join(path.dirname(__file__), "ablation_results.csv")
 
 
-def _apply_config(cfg: dict):
-    """Apply a configuration dictionary to the global config module."""
-    for k, v in cfg.items():
-        setattr(config, k, v)
-
-
 def _read_stats_json(output_path: str) -> dict:
     """Read the machine-readable stats JSON produced by GraphQLer after a fuzz run."""
     stats_json_name = config.STATS_FILE_NAME.replace(".txt", ".json") if config.STATS_FILE_NAME.endswith(".txt") else config.STATS_FILE_NAME + ".json"
@@ -87,13 +86,14 @@ def run_single(api_url: str, base_path: str, cfg: dict) -> dict:
     cfg_name = cfg["name"]
     output_path = f"{base_path}{cfg_name}/"
 
-    _apply_config(SHARED_CONFIG)
-    _apply_config({k: v for k, v in cfg.items() if k != "name"})
+    # Each configuration gets its own config and stats, so it can't leak into the next one
+    run_context = RunContext(name=f"ablation-{cfg_name}", **SHARED_CONFIG, **{k: v for k, v in cfg.items() if k != "name"})
 
     start = time.time()
     try:
-        run_compile_mode(Compiler(output_path, api_url), output_path, api_url)
-        run_fuzz_mode(Fuzzer(output_path, api_url), output_path, api_url)
+        with run_context.activate():
+            run_compile_mode(Compiler(output_path, api_url), output_path, api_url)
+            run_fuzz_mode(Fuzzer(output_path, api_url), output_path, api_url)
         elapsed = time.time() - start
         stats = _read_stats_json(output_path)
         coverage = stats.get("operation_coverage", {})
@@ -119,7 +119,7 @@ def run_single(api_url: str, base_path: str, cfg: dict) -> dict:
 
 
 def run_api(api_url: str, base_path: str) -> list[dict]:
-    """Run all four ablation configurations for a single API sequentially."""
+    """Run all ablation configurations for a single API sequentially."""
     results = []
     for cfg in CONFIGURATIONS:
         print(f"[ablation] {api_url}  config={cfg['name']}")
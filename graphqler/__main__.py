@@ -8,6 +8,7 @@ import importlib.metadata
 
 from graphqler.compiler.compiler import Compiler
 from graphqler.fuzzer import Fuzzer
+from graphqler.fuzzer.distributed import merge_worker_results
 from graphqler.graph import GraphGenerator
 from graphqler.utils.stats import Stats
 from graphqler.utils.cli_utils import set_auth_token_constant, set_idor_auth_token_constant, is_compiled
@@ -75,17 +76,18 @@ def run_compile_chains_mode(compiler: Compiler, path: str, url: str):
     print("(C) Chain generation complete")
 
 
-def run_fuzz_mode(fuzzer: Fuzzer, path: str, url: str):
+def run_fuzz_mode(fuzzer: Fuzzer, path: str, url: str, resume: bool = False):
     """Runs the program in fuzz mode
 
     Args:
         fuzzer (Fuzzer): An instance of the Fuzzer class to run
         path (str): Directory for all compilation outputs to be saved to
         url (str): URL of the target
+        resume (bool, optional): Continue from the checkpoint of a previous, interrupted run. Defaults to False.
     """
     print("(F) Initializing stats file")
     stats = Stats()
-    stats.set_file_paths(path)
+    stats.set_file_paths(path, resume=resume)
 
     print("(F) Starting fuzzer")
     if not config.USE_OBJECTS_BUCKET:
@@ -95,7 +97,7 @@ def run_fuzz_mode(fuzzer: Fuzzer, path: str, url: str):
     if config.MAX_FUZZING_ITERATIONS != 1:
         print(f"(F) Running up to {config.MAX_FUZZING_ITERATIONS} chain iteration(s)")
 
-    fuzzer.run()
+    fuzzer.run(resume=resume)
 
     print("(F) Complete fuzzing phase")
 
@@ -115,19 +117,37 @@ def run_single_mode(path: str, url: str, name: str):
     Fuzzer(path, url).run_single(name)
 
 
+def run_merge_mode(path: str):
+    """Runs the coordinator of a distributed fuzzing run: waits for every worker's results in SHARED_DIR and merges
+    them into one set of stats and one detections tree in the path
+
+    Args:
+        path (str): The directory to write the merged results to
+    """
+    print(f"(M) Waiting for {config.NUM_WORKERS} worker(s) to report to {config.SHARED_DIR}")
+    stats = Stats()
+    stats.set_file_paths(path)
+    merge_worker_results(str(config.SHARED_DIR), config.NUM_WORKERS, config.WORKER_RESULTS_TIMEOUT)
+    stats.print_results()
+    stats.save()
+    stats.save_endpoint_results()
+    stats.save_eval_summary()
+    print("(M) Complete merging the workers' results")
+
+
 def main(args: dict):
     # Run either compilation or fuzzing mode
     if 'mode' not in args or not args['mode']:
         print("Please provide a mode to run the program in")
         sys.exit(1)
 
-    # compile-chains works from disk — URL not needed; all other modes require it
-    if args['mode'] != "compile-chains" and not args.get('url'):
+    # compile-chains and merge work from disk — URL not needed; all other modes require it
+    if args['mode'] not in ["compile-chains", "merge"] and not args.get('url'):
         print(f"--url is required for mode '{args['mode']}'")
         sys.exit(1)
 
     # If not compile mode, check if compiled directory exists
-    if args['mode'] not in ["compile", "compile-graph", "compile-chains", "run", "single", "idor"] and not is_compiled(args['path']):
+    if args['mode'] not in ["compile", "compile-graph", "compile-chains", "run", "single", "idor", "merge"] and not is_compiled(args['path']):
         print("(!) Compiled directory does not exist, please run in compile mode first")
         sys.exit(1)
 
@@ -244,6 +264,22 @@ def main(args: dict):
         config.DEBUG = True
         print("(P) Classic coverage mode enabled — all non-error responses count as successes")
 
+    if args.get('num_workers') is not None:
+        config.NUM_WORKERS = args['num_workers']
+    if args.get('worker_index') is not None:
+        config.WORKER_INDEX = args['worker_index']
+    if args.get('shared_dir'):
+        config.SHARED_DIR = args['shared_dir']
+    if config.NUM_WORKERS > 1 or args['mode'] == "merge":
+        if not 0 <= config.WORKER_INDEX < config.NUM_WORKERS:
+            print(f"(!) --worker-index must be between 0 and {config.NUM_WORKERS - 1}")
+            sys.exit(1)
+        if not config.SHARED_DIR:
+            print("(!) --shared-dir is required for distributed fuzzing")
+            sys.exit(1)
+        if args['mode'] != "merge":
+            print(f"(P) Distributed fuzzing: worker {config.WORKER_INDEX} of {config.NUM_WORKERS}, reporting to {config.SHARED_DIR}")
+
     # Persist the final resolved config (file defaults + CLI overrides) back to disk
     write_config_to_toml(f"{args['path']}/{config.CONFIG_FILE_NAME}")
 
@@ -258,7 +294,7 @@ def main(args: dict):
         run_compile_chains_mode(compiler, config.OUTPUT_DIRECTORY, args['url'])
     elif args['mode'] == "fuzz":
         fuzzer = Fuzzer(args['path'], args['url'])
-        run_fuzz_mode(fuzzer, config.OUTPUT_DIRECTORY, args['url'])
+        run_fuzz_mode(fuzzer, config.OUTPUT_DIRECTORY, args['url'], resume=bool(args.get('resume')))
     elif args['mode'] == "run":
         run_compile_mode(compiler, config.OUTPUT_DIRECTORY, args['url'])
         fuzzer = Fuzzer(args['path'], args['url'])
@@ -270,6 +306,8 @@ def main(args: dict):
             print("Please provide a node to run in single mode")
             sys.exit(1)
         run_single_mode(args['path'], args['url'], args['node'])
+    elif args['mode'] == "merge":
+        run_merge_mode(config.OUTPUT_DIRECTORY)
 
 
 # If running as a CLI
@@ -318,7 +356,7 @@ if __name__ == "__main__":
     parser.add_argument("--url", help="remote host URL (required for all modes except compile-chains)", required=False)
     parser.add_argument("--path", help=f"directory location for files to be saved-to/used-from. Defaults to {config.OUTPUT_DIRECTORY}", required=False)
     parser.add_argument("--config", help="TOML configuration file for the program", required=False)
-    parser.add_argument("--mode", help="mode to run the program in", choices=["compile", "compile-graph", "compile-chains", "fuzz", "idor", "run", "single"], required=True)
+    parser.add_argument("--mode", help="mode to run the program in", choices=["compile", "compile-graph", "compile-chains", "fuzz", "idor", "run", "single", "merge"], required=True)
     parser.add_argument("--auth", help="authentication token(s). Can be 'token' or 'profile=token'. Multiple allowed.", action="append", required=False)
     parser.add_argument("--idor-auth", help="secondary (attacker) auth token for chain-based IDOR testing. Example: 'Bearer secondtoken'", required=False)
     parser.add_argument("--proxy", help="proxy to use for requests (ie. http://127.0.0.1:8080)", required=False)
@@ -344,6 +382,10 @@ if __name__ == "__main__":
 
     parser.add_argument("--no-endpoint-results", help="skip writing per-endpoint result files to disk (useful when results are very large)", action="store_true", default=False)
     parser.add_argument("--classic-coverage", help="count responses with no data as successes (sets NO_DATA_COUNT_AS_SUCCESS=true)", action="store_true", default=False)
+    parser.add_argument("--resume", help="fuzz mode: continue from the checkpoint of a previous, interrupted fuzzing run instead of starting over", action="store_true", default=False)
+    parser.add_argument("--num-workers", help="distributed fuzzing: number of workers the chains and island nodes are sharded across (also used by merge mode)", type=int, required=False)
+    parser.add_argument("--worker-index", help="distributed fuzzing: this worker's shard, from 0 to --num-workers - 1", type=int, required=False)
+    parser.add_argument("--shared-dir", help="distributed fuzzing: directory shared by the workers and the merge mode coordinator", required=False)
     parser.add_argument("--debug", help="enable debug mode: runs the fuzzer in a thread instead of a subprocess so pdb/breakpoint() work", action="store_true", default=False)
 
     # MCP server flags (handled before argument parsing; registered here for --help visibility)
@@ -0,0 +1,234 @@
+"""Campaigns: compile and fuzz many targets in parallel
+
+A campaign is described by a TOML manifest listing the targets, each with its own output directory and config:
+
+  output = "campaign-output"      # Where the merged summary (and targets without a path) go
+  processes = 8                   # Targets compiled and fuzzed at once (defaults to CAMPAIGN_PROCESSES)
+  max_time = 21600                # Global time budget in seconds (defaults to CAMPAIGN_MAX_TIME)
+
+  [[targets]]
+  url = "http://users.internal/graphql"
+  path = "campaign-output/users"  # Optional: defaults to <output>/<name>
+  name = "users"                  # Optional: defaults to a slug of the URL
+  max_time = 1800                 # Optional: this target's fuzzing budget (defaults to its MAX_TIME)
+  [targets.config]                # Optional: config overrides for this target only
+  AUTHORIZATION = "Bearer ..."
+
+Targets run in a pool of worker processes, each in its own RunContext, so their config, stats and objects never
+mix. A target's fuzzing time is the smaller of its own budget and what remains of the global budget when it starts,
+and targets that haven't started when the global budget runs out are skipped. When every target is done, the
+results of all of them are written to ``<output>/campaign_summary.json``. Run a campaign with:
+
+  python -m graphqler.campaign <manifest.toml>
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+import tomllib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from graphqler import config
+from graphqler.core import compile_and_fuzz
+from graphqler.utils.run_context import RunContext
+
+
+@dataclass
+class CampaignTarget:
+    """One target of a campaign"""
+
+    url: str
+    path: str
+    name: str
+    max_time: int  # Seconds of fuzzing for this target
+    config: dict[str, Any] = field(default_factory=dict)  # Config overrides for this target
+
+
+@dataclass
+class Campaign:
+    """The targets of a campaign and its budget"""
+
+    targets: list[CampaignTarget]
+    output_directory: str
+    processes: int
+    max_time: int  # Global time budget in seconds
+
+
+def _slug(url: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", re.sub(r"^[a-z]+://", "", url)).strip("_") or "target"
+
+
+def load_campaign(manifest: str | dict) -> Campaign:
+    """Loads a campaign from its TOML manifest
+
+    Args:
+        manifest (str | dict): Path of the manifest, or the already parsed manifest
+
+    Raises:
+        ValueError: If a target has no URL, or two targets share a name or an output directory
+
+    Returns:
+        Campaign: The campaign
+    """
+    if isinstance(manifest, str):
+        with open(manifest, "rb") as f:
+            manifest = tomllib.load(f)
+
+    output_directory = manifest.get("output", "graphqler-campaign")
+    targets = []
+    for i, target in enumerate(manifest.get("targets", [])):
+        if not target.get("url"):
+            raise ValueError(f"Target {i} of the campaign has no url")
+        name = target.get("name") or _slug(target["url"])
+        target_config = dict(target.get("config", {}))
+        targets.append(CampaignTarget(
+            url=target["url"],
+            path=target.get("path") or str(Path(output_directory) / name),
+            name=name,
+            max_time=int(target.get("max_time", target_config.get("MAX_TIME", config.MAX_TIME))),
+            config=target_config,
+        ))
+
+    for attribute in ("name", "path"):
+        values = [getattr(target, attribute) for target in targets]
+        duplicates = sorted({value for value in values if values.count(value) > 1})
+        if duplicates:
+            raise ValueError(f"Campaign targets must have distinct {attribute}s, found duplicates: {duplicates}")
+
+    return Campaign(
+        targets=targets,
+        output_directory=output_directory,
+        processes=max(1, int(manifest.get("processes", config.CAMPAIGN_PROCESSES))),
+        max_time=int(manifest.get("max_time", config.CAMPAIGN_MAX_TIME)),
+    )
+
+
+def run_target(target: CampaignTarget, deadline: float) -> dict:
+    """Compiles and fuzzes one target in its own RunContext (runs in a campaign worker process)
+
+    Args:
+        target (CampaignTarget): The target
+        deadline (float): When the campaign's global budget runs out (a time.time() timestamp)
+
+    Returns:
+        dict: The target's summary
+    """
+    summary: dict[str, Any] = {"name": target.name, "url": target.url, "path": target.path}
+    start = time.time()
+    max_time = int(min(target.max_time, deadline - start))
+    if max_time <= 0:
+        return {**summary, "status": "skipped", "error": "The campaign's time budget ran out before this target started"}
+
+    # The target's own config may also set MAX_TIME / OUTPUT_DIRECTORY, which the campaign's values override
+    run_context = RunContext(name=target.name, **{**target.config, "OUTPUT_DIRECTORY": target.path, "MAX_TIME": max_time})
+    try:
+        with run_context.activate():
+            Path(target.path).mkdir(parents=True, exist_ok=True)
+            stats = compile_and_fuzz(target.path, target.url)["stats"]
+            covered, total, coverage_rate = stats.get_coverage_rate()
+            findings = [finding for nodes in stats.vulnerabilities.values() for finding in nodes.values()]
+            vulnerabilities = {
+                vulnerability_name: sorted(node for node, finding in nodes.items() if finding["is_vulnerable"] or finding["potentially_vulnerable"])
+                for vulnerability_name, nodes in stats.vulnerabilities.items()
+            }
+            confirmed = sum(bool(finding["is_vulnerable"]) for finding in findings)
+            potential = sum(bool(finding["potentially_vulnerable"] and not finding["is_vulnerable"]) for finding in findings)
+    except Exception as e:
+        return {**summary, "status": "error", "error": f"{type(e).__name__}: {e}", "elapsed_seconds": round(time.time() - start, 1)}
+
+    return {
+        **summary,
+        "status": "completed",
+        "max_time": max_time,
+        "elapsed_seconds": round(time.time() - start, 1),
+        "covered": covered,
+        "total": total,
+        "coverage_rate": coverage_rate,
+        "successes": stats.number_of_successes,
+        "failures": stats.number_of_failures,
+        "confirmed_vulnerabilities": confirmed,
+        "potential_vulnerabilities": potential,
+        "vulnerabilities": {name: nodes for name, nodes in vulnerabilities.items() if nodes},
+    }
+
+
+def run_campaign(campaign: Campaign) -> dict:
+    """Compiles and fuzzes the campaign's targets across a pool of campaign.processes worker processes, and writes
+    the merged summary
+
+    Args:
+        campaign (Campaign): The campaign
+
+    Returns:
+        dict: The merged summary, also written to <output>/campaign_summary.json
+    """
+    start = time.time()
+    deadline = start + campaign.max_time
+    print(f"(C) Running a campaign of {len(campaign.targets)} target(s) with {campaign.processes} process(es), budget {campaign.max_time}s")
+
+    target_summaries: dict[str, dict] = {}
+    with ProcessPoolExecutor(max_workers=campaign.processes) as executor:
+        futures = {executor.submit(run_target, target, deadline): target for target in campaign.targets}
+        for future in as_completed(futures):
+            target = futures[future]
+            try:
+                target_summary = future.result()
+            except Exception as e:  # e.g. the worker process died
+                target_summary = {"name": target.name, "url": target.url, "path": target.path, "status": "error", "error": f"{type(e).__name__}: {e}"}
+            target_summaries[target.name] = target_summary
+            print(f"(C) [{len(target_summaries)}/{len(campaign.targets)}] {target.name}: {target_summary['status']}"
+                  + (f" — coverage {target_summary['covered']}/{target_summary['total']}" if target_summary["status"] == "completed" else f" — {target_summary['error']}"))
+
+    # In manifest order, regardless of the order the targets finished in
+    ordered_summaries = [target_summaries[target.name] for target in campaign.targets]
+    completed = [target_summary for target_summary in ordered_summaries if target_summary["status"] == "completed"]
+    summary = {
+        "started": start,
+        "elapsed_seconds": round(time.time() - start, 1),
+        "processes": campaign.processes,
+        "max_time": campaign.max_time,
+        "totals": {
+            "targets": len(ordered_summaries),
+            "completed": len(completed),
+            "errors": sum(target_summary["status"] == "error" for target_summary in ordered_summaries),
+            "skipped": sum(target_summary["status"] == "skipped" for target_summary in ordered_summaries),
+            "covered": sum(target_summary["covered"] for target_summary in completed),
+            "total": sum(target_summary["total"] for target_summary in completed),
+            "confirmed_vulnerabilities": sum(target_summary["confirmed_vulnerabilities"] for target_summary in completed),
+            "potential_vulnerabilities": sum(target_summary["potential_vulnerabilities"] for target_summary in completed),
+        },
+        "targets": ordered_summaries,
+    }
+
+    summary_path = Path(campaign.output_directory) / config.CAMPAIGN_SUMMARY_FILE_NAME
+    summary_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(summary_path, "w") as f:
+        json.dump(summary, f, indent=2)
+    totals = summary["totals"]
+    print(f"(C) Campaign complete: {totals['completed']}/{totals['targets']} target(s) completed, coverage {totals['covered']}/{totals['total']}, "
+          f"{totals['confirmed_vulnerabilities']} confirmed and {totals['potential_vulnerabilities']} potential vulnerabilities — summary in {summary_path}")
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m graphqler.campaign", description="Compile and fuzz the targets of a campaign manifest in parallel")
+    parser.add_argument("manifest", help="TOML campaign manifest")
+    parser.add_argument("--processes", help="number of targets to run at once (overrides the manifest)", type=int, required=False)
+    parser.add_argument("--max-time", help="global time budget in seconds (overrides the manifest)", type=int, required=False)
+    args = parser.parse_args()
+
+    try:
+        campaign = load_campaign(args.manifest)
+    except (OSError, ValueError, tomllib.TOMLDecodeError) as e:
+        print(f"(!) Invalid campaign manifest: {e}")
+        sys.exit(1)
+    if args.processes is not None:
+        campaign.processes = max(1, args.processes)
+    if args.max_time is not None:
+        campaign.max_time = args.max_time
+    run_campaign(campaign)
@@ -2,6 +2,7 @@
 
 from .chain import Chain, ChainStep
 from .chain_generator import ChainGenerator
+from .prefix_trie import PrefixTrieNode, build_prefix_trie
 from .strategies.base_strategy import BaseChainStrategy
 from .strategies.topological_strategy import TopologicalChainStrategy
 from .strategies.dfs_strategy import DFSChainStrategy
@@ -12,6 +13,8 @@ __all__ = [
     "Chain",
     "ChainStep",
     "ChainGenerator",
+    "PrefixTrieNode",
+    "build_prefix_trie",
     "IDORChainStrategy",
     "UAFChainStrategy",
     "BaseChainStrategy",
@@ -16,6 +16,11 @@ class ChainStep:
         """Backward-compatible alias for profile_name."""
         return self.profile_name
 
+    @property
+    def key(self) -> tuple[str, str, str]:
+        """Hashable identity of the step: (graphql type, node name, profile name)."""
+        return (self.node.graphql_type, self.node.name, self.profile_name)
+
     def __repr__(self) -> str:
         return f"{self.node.name}[{self.profile_name}]"
 
@@ -51,6 +56,10 @@ class Chain:
         path = " -> ".join(repr(step) for step in self.steps)
         return f"Chain([{path}])"
 
+    def signature(self) -> tuple[tuple[str, str, str], ...]:
+        """Returns the chain's step sequence as a hashable key; chains with equal signatures run the same requests."""
+        return tuple(step.key for step in self.steps)
+
     def last_node(self) -> Node | None:
         """Returns the terminal (last) node in the chain, or None if the chain is empty."""
         if not self.steps:
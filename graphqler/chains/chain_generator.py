@@ -8,8 +8,10 @@ import yaml
 
 from graphqler import config
 from graphqler.chains.chain import Chain, ChainStep
+from graphqler.chains.prefix_trie import build_prefix_trie
 from graphqler.chains.strategies.base_strategy import BaseChainStrategy
 from graphqler.graph.node import Node
+from graphqler.utils.compiled_cache import read_compiled_yaml
 
 
 class ChainGenerator:
@@ -19,6 +21,11 @@ class ChainGenerator:
     decide which strategies to use and call :meth:`generate_with_strategy` once per strategy.
     Results accumulate across calls so that :meth:`save_to_yaml` writes all of them at once.
 
+    Chains are deduplicated as they are generated: a chain whose step sequence was already
+    produced (by the same or an earlier strategy) is dropped, and with ``config.DROP_PREFIX_CHAINS``
+    so is a chain whose steps are a strict prefix of another chain from the same strategy.
+    The number of removed chains is written at the top of each strategy's YAML file.
+
     Usage::
 
         generator = ChainGenerator()
@@ -29,7 +36,8 @@ class ChainGenerator:
 
     def __init__(self):
         self._chains: list[Chain] = []
-        self._results: list[tuple[BaseChainStrategy, list[Chain]]] = []
+        self._results: list[tuple[BaseChainStrategy, list[Chain], dict[str, int]]] = []
+        self._seen_signatures: set[tuple] = set()
 
     @property
     def chains(self) -> list[Chain]:
@@ -48,18 +56,47 @@ class ChainGenerator:
             *args: Arguments forwarded to ``strategy.generate``.
 
         Returns:
-            list[Chain]: The chains produced by this strategy call.
+            list[Chain]: The chains produced by this strategy call, after deduplication.
         """
-        chains = strategy.generate(*args)
-        self._results.append((strategy, chains))
+        chains, removed = self._deduplicate(strategy.generate(*args))
+        self._results.append((strategy, chains, removed))
         self._chains.extend(chains)
         return chains
 
+    def _deduplicate(self, chains: list[Chain]) -> tuple[list[Chain], dict[str, int]]:
+        """Drops chains already generated and, if enabled, chains subsumed by a longer chain.
+
+        Args:
+            chains (list[Chain]): The chains produced by one strategy call.
+
+        Returns:
+            tuple[list[Chain], dict[str, int]]: The kept chains (in their original order) and the
+            number of chains removed as ``{"duplicates": ..., "prefixes": ...}``.
+        """
+        kept: list[Chain] = []
+        for chain in chains:
+            signature = chain.signature()
+            if signature in self._seen_signatures:
+                continue
+            self._seen_signatures.add(signature)
+            kept.append(chain)
+        removed = {"duplicates": len(chains) - len(kept), "prefixes": 0}
+
+        if config.DROP_PREFIX_CHAINS:
+            # A chain ends at a trie node with children exactly when another chain continues past it
+            trie = build_prefix_trie(kept, [len(chain) for chain in kept])
+            subsumed = {id(chain) for trie_node in trie.iter_nodes() if trie_node.children for chain in trie_node.chains}
+            kept = [chain for chain in kept if id(chain) not in subsumed]
+            removed["prefixes"] = len(subsumed)
+
+        return kept, removed
+
     def save_to_yaml(self, save_path: str) -> None:
         """Persist each strategy's chains to its own YAML file under ``<save_path>/compiled/chains/``.
 
         The filename is taken from ``strategy.file_name``.
-        Regular chains are stored as a list of steps, each with a node name and a profile name.
+        Each file holds the number of chains removed by deduplication (``removed_chains``) and the
+        chains themselves (``chains``), each stored as a list of steps with a node name and a profile name.
 
         Args:
             save_path (str): Root output directory.
@@ -67,8 +104,8 @@ class ChainGenerator:
         chains_dir = Path(save_path) / config.CHAINS_DIR_NAME
         chains_dir.mkdir(parents=True, exist_ok=True)
 
-        for strategy, chains in self._results:
-            data = []
+        for strategy, chains, removed in self._results:
+            entries = []
             for chain in chains:
                 entry: dict = {
                     "id": chain.id,
@@ -76,7 +113,8 @@ class ChainGenerator:
                     "confidence": round(chain.confidence, 4),
                     "reason": chain.reason,
                 }
-                data.append(entry)
+                entries.append(entry)
+            data = {"removed_chains": removed, "chains": entries}
             with open(chains_dir / strategy.file_name, "w") as f:
                 yaml.dump(data, f, default_flow_style=False, sort_keys=False)
 
@@ -99,8 +137,10 @@ class ChainGenerator:
         chains: list[Chain] = []
 
         for chain_file in sorted(chains_dir.glob("*.yml")):
-            with open(chain_file, "r") as f:
-                data = yaml.safe_load(f) or []
+            data = read_compiled_yaml(chain_file) or []
+            # Files written before deduplication was added are a bare list of chains
+            if isinstance(data, dict):
+                data = data.get("chains") or []
             for entry in data:
                 steps = []
                 # Handle new format (list of steps)
@@ -0,0 +1,62 @@
+"""Prefix trie over chain steps, used to execute the common prefix of many chains only once."""
+
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from graphqler.chains.chain import Chain, ChainStep
+
+
+@dataclass(eq=False)
+class PrefixTrieNode:
+    """A node of the prefix trie.
+
+    The path from the root to a node is a step sequence shared by every chain in its subtree.
+    ``chains`` holds the chains whose shareable prefix ends exactly at this node; they continue
+    with their own remaining steps from here.
+    """
+
+    step: ChainStep | None = None  # None for the root
+    depth: int = 0  # Number of steps from the root, i.e. the index of the next step of the chains below
+    children: dict[tuple[str, str, str], "PrefixTrieNode"] = field(default_factory=dict)
+    chains: list[Chain] = field(default_factory=list)
+
+    def iter_nodes(self) -> Iterator["PrefixTrieNode"]:
+        """Yields this node and every node below it."""
+        yield self
+        for child in self.children.values():
+            yield from child.iter_nodes()
+
+    def iter_chains(self) -> Iterator[Chain]:
+        """Yields every chain in this node's subtree."""
+        yield from self.chains
+        for child in self.children.values():
+            yield from child.iter_chains()
+
+    def num_chains(self) -> int:
+        """Returns the number of chains in this node's subtree."""
+        return sum(1 for _ in self.iter_chains())
+
+
+def build_prefix_trie(chains: list[Chain], prefix_lengths: list[int]) -> PrefixTrieNode:
+    """Builds a prefix trie over the first ``prefix_lengths[i]`` steps of ``chains[i]``.
+
+    Only the part of a chain that behaves identically regardless of what follows it should be
+    shared, so the caller decides how many leading steps of each chain may go in the trie.
+
+    Args:
+        chains (list[Chain]): The chains.
+        prefix_lengths (list[int]): For each chain, the number of leading steps that can be shared.
+
+    Returns:
+        PrefixTrieNode: The root of the trie.
+    """
+    root = PrefixTrieNode()
+    for chain, prefix_length in zip(chains, prefix_lengths):
+        trie_node = root
+        for step in chain.steps[:prefix_length]:
+            key = step.key
+            if key not in trie_node.children:
+                trie_node.children[key] = PrefixTrieNode(step=step, depth=trie_node.depth + 1)
+            trie_node = trie_node.children[key]
+        trie_node.chains.append(chain)
+    return root
@@ -1,6 +1,6 @@
 """Topological chain generation strategy."""
 
-from typing import cast
+from typing import Iterator
 
 import networkx
 
@@ -29,11 +29,15 @@ class TopologicalChainStrategy(BaseChainStrategy):
 
     For every node N in topological order:
 
-    1. Compute ``networkx.ancestors(graph, N)`` — all transitive predecessors.
+    1. Take all transitive predecessors of N (its ancestors).
     2. Remove ancestors whose ``mutation_type`` is in *filter_mutation_type*.
-    3. Build a subgraph view from ``valid_ancestors U {N}`` — the original edges
-       between those nodes are preserved automatically by NetworkX.
-    4. Topological-sort the subgraph using SCC condensation (handles cycles gracefully).
+    3. Order ``valid_ancestors U {N}`` by a single global topological order of the graph.
+
+    Ancestor sets are computed once per graph (see :meth:`_build_ancestor_index`) with a
+    dynamic program over the SCC condensation: each node gets an integer bitset over its
+    position in the global order, so filtering is a mask and a chain is the set bits read
+    in ascending order.  This replaces a ``networkx.ancestors`` call plus a condensation
+    of the ancestor subgraph for every node in every pass.
 
     **Cycle handling:** Real-world GraphQL APIs produce cycles in the dependency graph
     (e.g. a ``restaurant`` query both *returns* and *requires* a ``Restaurant`` object).
@@ -42,6 +46,7 @@ class TopologicalChainStrategy(BaseChainStrategy):
     into a single node, topological-sorts the resulting DAG, then expands each SCC back
     to its member nodes sorted by type priority (Mutation → Object → Query).  This
     ensures that CREATE mutations in the same SCC run before the objects they produce.
+    Every chain is a subsequence of this one global order.
 
     The resulting chain is **fully self-sufficient**: running it on a truly empty
     :class:`~graphqler.fuzzer.utils.objects_bucket.ObjectsBucket` will succeed
@@ -76,17 +81,21 @@ class TopologicalChainStrategy(BaseChainStrategy):
         def merge(p):
             return list(set(p) | set(filter_mutation_type or []))
 
+        # The ancestor index only depends on the graph, so all passes share it
+        ancestor_index = self._build_ancestor_index(graph)
+
         if config.DISABLE_MUTATIONS:
-            return self._generate_with_filter(graph, starter_nodes, source_chains, filter_mutation_type=merge(_ALL_MUTATION_TYPES))
+            return self._generate_with_filter(graph, starter_nodes, source_chains, filter_mutation_type=merge(_ALL_MUTATION_TYPES), ancestor_index=ancestor_index)
 
-        pass1 = self._generate_with_filter(graph, starter_nodes, source_chains, filter_mutation_type=merge(["UPDATE", "DELETE", "UNKNOWN"]))
-        pass2 = self._generate_with_filter(graph, starter_nodes, source_chains, filter_mutation_type=merge(["DELETE", "UNKNOWN"]))
-        pass3 = self._generate_with_filter(graph, starter_nodes, source_chains, filter_mutation_type=merge([]))
+        pass1 = self._generate_with_filter(graph, starter_nodes, source_chains, filter_mutation_type=merge(["UPDATE", "DELETE", "UNKNOWN"]), ancestor_index=ancestor_index)
+        pass2 = self._generate_with_filter(graph, starter_nodes, source_chains, filter_mutation_type=merge(["DELETE", "UNKNOWN"]), ancestor_index=ancestor_index)
+        pass3 = self._generate_with_filter(graph, starter_nodes, source_chains, filter_mutation_type=merge([]), ancestor_index=ancestor_index)
         return pass1 + pass2 + pass3
 
     def _generate_with_filter(self, graph: networkx.DiGraph, starter_nodes: list[Node],
                                source_chains: list[Chain] | None = None,
-                               filter_mutation_type: list[str] | None = None) -> list[Chain]:
+                               filter_mutation_type: list[str] | None = None,
+                               ancestor_index: tuple[list[Node], dict[Node, int]] | None = None) -> list[Chain]:
         """Generate one self-sufficient chain per non-filtered node.
 
         Args:
@@ -94,41 +103,59 @@ class TopologicalChainStrategy(BaseChainStrategy):
             starter_nodes (list[Node]): Accepted for interface compatibility; not used.
             source_chains (list[Chain] | None): Accepted for interface compatibility; not used.
             filter_mutation_type (list[str] | None): Mutation types to exclude.
+            ancestor_index (tuple[list[Node], dict[Node, int]] | None): A precomputed :meth:`_build_ancestor_index`
+                of *graph*; built here if not given.
 
         Returns:
             list[Chain]: One chain per non-filtered node in stable order.
         """
         excluded = set(filter_mutation_type) if filter_mutation_type else set()
-        chains: list[Chain] = []
+        order, ancestor_masks = ancestor_index if ancestor_index is not None else self._build_ancestor_index(graph)
+
+        excluded_mask = 0
+        for position, node in enumerate(order):
+            if node.mutation_type in excluded:
+                excluded_mask |= 1 << position
 
-        for node in self._safe_topo_sort(graph):
+        chains: list[Chain] = []
+        for position, node in enumerate(order):
             if node.mutation_type in excluded:
                 continue
+            chain_mask = (ancestor_masks[node] & ~excluded_mask) | (1 << position)
+            steps = [ChainStep(node=order[i]) for i in _iter_set_bits(chain_mask)]
+            chains.append(Chain(steps=steps))
 
-            ancestors = cast(set[Node], networkx.ancestors(graph, node))
-            valid_ancestors: set[Node] = {
-                a for a in ancestors
-                if a.mutation_type not in excluded
-            }
+        return chains
 
-            chain_node_set = valid_ancestors | {node}
-            subgraph = cast(networkx.DiGraph, graph.subgraph(chain_node_set))
-            sorted_nodes = self._safe_topo_sort(subgraph)
+    def _build_ancestor_index(self, graph: networkx.DiGraph) -> tuple[list[Node], dict[Node, int]]:
+        """Computes a global topological order of the graph and every node's ancestor set in one pass.
 
-            steps = [ChainStep(node=n) for n in sorted_nodes]
-            chains.append(Chain(steps=steps))
+        Cycles are handled via SCC condensation: SCCs are visited in topological order and their
+        members are sorted by :meth:`_node_sort_key`.  The ancestors of an SCC are the union of its
+        predecessors' ancestors and members, so each SCC's set is computed once from its predecessors.
 
-        return chains
+        Args:
+            graph (networkx.DiGraph): The dependency graph.
 
-    def _safe_topo_sort(self, graph: networkx.DiGraph) -> list[Node]:
-        """Topological sort that handles cycles via SCC condensation."""
+        Returns:
+            tuple[list[Node], dict[Node, int]]: The global order, and for each node a bitset of its
+            ancestors where bit ``i`` stands for ``order[i]``.
+        """
         condensation = networkx.condensation(graph)
-        result: list[Node] = []
+        order: list[Node] = []
+        reachable_masks: dict[int, int] = {}  # SCC -> bitset of its members and all their ancestors
         for cond_node in networkx.topological_sort(condensation):
-            members: set[Node] = condensation.nodes[cond_node]["members"]
-            ordered = sorted(members, key=self._node_sort_key)
-            result.extend(ordered)
-        return result
+            mask = 0
+            for member in sorted(condensation.nodes[cond_node]["members"], key=self._node_sort_key):
+                mask |= 1 << len(order)
+                order.append(member)
+            for predecessor in condensation.predecessors(cond_node):
+                mask |= reachable_masks[predecessor]
+            reachable_masks[cond_node] = mask
+
+        scc_of_node: dict[Node, int] = condensation.graph["mapping"]
+        ancestor_masks = {node: reachable_masks[scc_of_node[node]] & ~(1 << position) for position, node in enumerate(order)}
+        return order, ancestor_masks
 
     @staticmethod
     def _node_sort_key(node: Node) -> tuple[int, str]:
@@ -138,3 +165,11 @@ class TopologicalChainStrategy(BaseChainStrategy):
         else:
             key = _NODE_PRIORITY.get(node.graphql_type, 1)
         return (key, node.name)
+
+
+def _iter_set_bits(mask: int) -> Iterator[int]:
+    """Yields the positions of the set bits of *mask* in ascending order."""
+    while mask:
+        lowest_bit = mask & -mask
+        yield lowest_bit.bit_length() - 1
+        mask ^= lowest_bit
@@ -16,6 +16,7 @@ EXTRACTED_DIR_NAME = "extracted"
 COMPILED_DIR_NAME = "compiled"
 EVAL_DIR_NAME = "eval"
 ENDPOINT_RESULTS_DIR_NAME = "endpoint_results"
+ENDPOINT_RESULTS_LOG_FILE_NAME = "endpoint_results.jsonl"
 DETECTIONS_DIR_NAME = "detections"
 
 INTROSPECTION_RESULT_FILE_NAME = "introspection_result.json"
@@ -24,6 +25,8 @@ CONFIG_FILE_NAME = "config.toml"
 """Pickle files -- mainly for cross-process communication"""
 OBJECTS_BUCKET_PICKLE_FILE_NAME = "objects_bucket.pkl"
 STATS_PICKLE_FILE_NAME = "stats.pkl"
+CHECKPOINT_FILE_NAME = "checkpoint.pkl"  # Progress of the last fuzzing run, used by --resume
+COMPILED_CACHE_DIR_NAME = ".cache"  # Binary copies of the compiled / extracted YAML files (next to them), invalidated by a content hash of the YAML
 
 QUERY_PARAMETER_FILE_NAME = f"{EXTRACTED_DIR_NAME}/query_parameter_list.yml"
 MUTATION_PARAMETER_FILE_NAME = f"{EXTRACTED_DIR_NAME}/mutation_parameter_list.yml"
@@ -39,6 +42,7 @@ COMPILED_MUTATIONS_FILE_NAME = f"{COMPILED_DIR_NAME}/compiled_mutations.yml"
 COMPILED_QUERIES_FILE_NAME = f"{COMPILED_DIR_NAME}/compiled_queries.yml"
 COMPILED_SUBSCRIPTIONS_FILE_NAME = f"{COMPILED_DIR_NAME}/compiled_subscriptions.yml"
 CHAINS_DIR_NAME = f"{COMPILED_DIR_NAME}/chains"
+DEPENDENCY_GRAPH_FILE_NAME = f"{COMPILED_DIR_NAME}/dependency_graph.pkl"
 
 """For clairvoyance"""
 WORDLIST_PATH = ""
@@ -77,6 +81,7 @@ MAX_OBJECT_CYCLES = 5
 MAX_OUTPUT_SELECTOR_DEPTH = 5
 HARD_CUTOFF_DEPTH = 20
 MAX_INPUT_DEPTH = 20
+USE_GRAPHQL_VARIABLES: bool = False  # Send regular / maximal payloads as a cached parameterized document, with the inputs in the request's variables
 
 """For loggers"""
 FUZZER_LOG_FILE_PATH = "logs/fuzzer.log"
@@ -87,6 +92,8 @@ CHAIN_LOGS_DIR_NAME = "logs/chain_logs"
 
 """For stats"""
 SAVE_ENDPOINT_RESULTS: bool = True  # Set False to skip writing per-endpoint result files (can be huge)
+STATS_SAVE_INTERVAL: float = 5.0  # Seconds between batched stats flushes to disk (also flushed on phase changes and at exit); 0 saves on every update
+CHECKPOINT_INTERVAL: float = 60.0  # Seconds between fuzzing checkpoints used by --resume (also saved on phase changes and when terminated at MAX_TIME); 0 disables checkpoints
 STATS_FILE_NAME = "stats.txt"
 OBJECTS_BUCKET_TEXT_FILE_NAME = "objects_bucket.txt"
 UNIQUE_RESPONSES_FILE_NAME = "unique_responses.txt"
@@ -99,10 +106,15 @@ USE_OBJECTS_BUCKET: bool = True  # This mode is for when we want to use the obje
 USE_DEPENDENCY_GRAPH: bool = True  # This mode is for when we want to use DFS through the dependency graph
 NO_DATA_COUNT_AS_SUCCESS: bool = False  # This mode is for when we want to count no data in the data object as a success or failure
 DISABLE_MUTATIONS: bool = False  # When True, only Query chains are generated — all Mutation nodes are excluded from fuzzing
+DROP_PREFIX_CHAINS: bool = False  # When True, chain generation also drops chains whose steps are a strict prefix of another chain from the same strategy
 
 """For fuzzing"""
 ALLOW_DELETION_OF_OBJECTS: bool = False  # This mode is for when we want to allow the deletion of objects from the objects bucket when coming across a DELETE mutation success
 MAX_FUZZING_ITERATIONS: int = 1  # Number of complete sweeps through all chains; increase for more coverage depth
+MAX_CONCURRENT_CHAINS: int = 1  # Number of independent chains executed in parallel (thread pool); 1 runs chains sequentially
+CHAIN_SCHEDULING: str = "file"  # Order of the chains in each iteration: "file" (compiled order) or "coverage" (chains with uncovered, cheap targets first; see fuzzer/chain_scheduler.py)
+CHAIN_SATURATION_COUNT: int = 3  # With coverage scheduling, chains whose target succeeded (or kept failing the same way) this many times run last
+SHARE_CHAIN_PREFIXES: bool = False  # Run the setup steps shared by several chains once and fork the bucket where they diverge (fewer requests)
 MAX_TIME: int = 3600  # in seconds
 SKIP_MAXIMAL_PAYLOADS: bool = False  # This mode is for when we want to skip the maximal payloads
 SKIP_DOS_ATTACKS: bool = True  # This mode is for when we want to skip the DoS check
@@ -112,14 +124,30 @@ SKIP_SUBSCRIPTIONS: bool = True  # Subscriptions require WebSocket transport; di
 SUBSCRIPTION_TIMEOUT: int = 1  # Seconds to wait for events when executing a subscription
 SUBSCRIPTION_PROTOCOL: str = "graphql-transport-ws"  # WebSocket sub-protocol: "graphql-transport-ws" (modern) or "subscriptions-transport-ws" (legacy Apollo)
 
+"""For distributed fuzzing (see fuzzer/distributed.py)"""
+NUM_WORKERS: int = 1  # Number of workers the chains and island nodes are sharded across; 1 fuzzes everything in one process
+WORKER_INDEX: int = 0  # This worker's shard (0 to NUM_WORKERS - 1); worker 0 also runs the API-level detections
+SHARED_DIR: str | None = None  # Directory every worker and the coordinator can reach, where workers put their results for the coordinator to merge
+WORKER_RESULTS_TIMEOUT: float = 7200.0  # Seconds the coordinator waits for every worker to finish before merging what it has
+
+"""For campaigns: many targets compiled and fuzzed in parallel (see campaign.py)"""
+CAMPAIGN_PROCESSES: int = 4  # Number of targets compiled and fuzzed at once
+CAMPAIGN_MAX_TIME: int = 28800  # Global time budget of a campaign in seconds; targets not started by then are skipped
+CAMPAIGN_SUMMARY_FILE_NAME = "campaign_summary.json"
+
 """For NoSQL blind extraction"""
 NOSQLI_BLIND_EXTRACTION: bool = False  # When True, attempt char-by-char data extraction after a potential NoSQLi is detected
 NOSQLI_EXTRACTION_CHARSET: str = "0123456789abcdef-"  # Charset to iterate during blind extraction (default covers hex IDs)
 NOSQLI_MAX_EXTRACTION_LENGTH: int = 64  # Maximum number of characters to extract before stopping
+NOSQLI_EXTRACTION_STRATEGY: str = "linear"  # "linear" (try each charset character in turn) or "binary" (binary-search each position with $regex character classes)
+NOSQLI_EXTRACTION_CONCURRENCY: int = 1  # Extraction probes sent at once (through the async transport's concurrent sender when REQUEST_TRANSPORT = "async", else threads)
 
 """For time-based SQL blind injection"""
 TIME_BASED_SQL_SLEEP_SECONDS = 3  # Seconds to sleep in time-based SQL payloads (pg_sleep / SLEEP / WAITFOR)
 TIME_BASED_SQL_THRESHOLD_RATIO = 0.8  # Response time >= sleep * ratio is treated as confirmed time-based SQLi
+TIME_BASED_SQL_BASELINE_SAMPLES: int = 1  # Benign requests timed (concurrently) for the baseline; their median is the baseline and their MAD its noise
+TIME_BASED_SQL_MAD_FACTOR: float = 3.0  # A delay must also exceed this many (scaled) MADs of the baseline samples to be reported
+TIME_BASED_SQL_PARALLEL_PROBES: int = 0  # Time-based SQLi detections run in the background at once while fuzzing goes on (0 = run inline)
 
 """For field charset fuzzing and ID enumeration (GraphQLMap GRAPHQL_CHARSET / GRAPHQL_INCREMENT equivalent)"""
 SKIP_ENUMERATION_ATTACKS: bool = True  # Disabled by default (sends many requests per node — opt-in)
@@ -131,10 +159,16 @@ FIELD_RESPONSE_LENGTH_VARIANCE_THRESHOLD = 0.5  # Flag if (max-min)/avg response
 ID_ENUMERATION_COUNT: int = 10  # Number of integer IDs to probe (1 .. N)
 ID_ENUMERATION_SUCCESS_THRESHOLD = 2  # Min distinct IDs that must return data to flag IDOR
 ID_ENUMERATION_SCOPE_HEURISTIC: bool = True  # Classify endpoint scope (private/public) before running enumeration; skip public endpoints to avoid false positives
+ENUMERATION_ALIAS_BATCH_SIZE: int = 1  # Probes packed into one aliased document by the charset / ID enumeration detectors (rejected batches are split, down to single requests); 1 sends one request per probe
 
 """For each request"""
 REQUEST_TIMEOUT: int = 120  # in seconds
 TIME_BETWEEN_REQUESTS: float = 0.001  # in seconds
+REQUEST_TRANSPORT: str = "sync"  # HTTP transport: "sync" (requests, one blocking session) or "async" (asyncio/httpx with a pooled client)
+ASYNC_MAX_CONNECTIONS: int = 100  # Async transport only: max open connections in the shared connection pool
+ASYNC_MAX_CONNECTIONS_PER_HOST: int = 20  # Async transport only: max in-flight requests to a single host
+USE_PERSISTED_QUERIES: bool = False  # Automatic Persisted Queries: send only the sha256 hash of documents the target has already registered
+PERSISTED_QUERIES_MAX_HASHES: int = 10000  # Persisted query hashes remembered per target; the least recently used are forgotten (and re-registered when sent again)
 
 """For custom skipping nodes"""
 SKIP_NODES = []
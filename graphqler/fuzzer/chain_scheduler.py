@@ -0,0 +1,116 @@
+"""Coverage-guided chain scheduling (CHAIN_SCHEDULING = "coverage")
+
+By default, every chain iteration runs the chains in the order they were compiled, even after most of their targets
+are covered. Under a fixed MAX_TIME, the coverage gained per second is higher if each iteration runs first the chains
+that can still cover something, cheapest first. The scheduler ranks chains by the stats gathered so far:
+
+1. Chains whose target (last primary node) hasn't succeeded yet
+2. The same, but the target was blocked by unmet hard dependencies in a previous attempt
+3. Chains whose target already succeeded, fewer than CHAIN_SATURATION_COUNT times
+4. Chains whose target succeeded CHAIN_SATURATION_COUNT times or more, or failed that many times always with the same
+   status code and errors (it keeps failing the same way)
+
+Within a rank, chains are ordered by their estimated cost (the mean time of each of their steps so far), and ties
+keep the compiled order. The order only changes between iterations, so all chains still run while time allows.
+"""
+
+from graphqler import config
+from graphqler.chains import Chain
+from graphqler.graph import Node
+from graphqler.utils.stats import Stats
+
+# Ranks, in scheduling order
+UNCOVERED = 0
+UNCOVERED_DEP_BLOCKED = 1
+COVERED = 2
+SATURATED = 3
+
+DEFAULT_STEP_COST = 1.0  # Estimated seconds of a step that has never been timed, when nothing has been timed yet
+
+
+def _node_key(node: Node) -> str:
+    return f"{node.graphql_type}|{node.name}"
+
+
+def get_chain_target(chain: Chain) -> Node | None:
+    """Gets the node a chain is for: its last primary step, which is the one fuzzed and checked for vulnerabilities
+
+    Args:
+        chain (Chain): The chain
+
+    Returns:
+        Node | None: The target node, or None if the chain has no primary step
+    """
+    for step in reversed(chain.steps):
+        if step.profile_name == "primary":
+            return step.node
+    return None
+
+
+def get_chain_rank(chain: Chain, stats: Stats, dep_blocked_nodes: set[Node]) -> int:
+    """Gets the scheduling rank of a chain (lower runs first)
+
+    Args:
+        chain (Chain): The chain
+        stats (Stats): The stats of the run so far
+        dep_blocked_nodes (set[Node]): Nodes that failed because of unmet hard dependencies
+
+    Returns:
+        int: One of UNCOVERED, UNCOVERED_DEP_BLOCKED, COVERED or SATURATED
+    """
+    target = get_chain_target(chain)
+    if target is None:
+        return COVERED
+    key = _node_key(target)
+    successes = stats.successful_nodes.get(key, 0)
+    if successes >= config.CHAIN_SATURATION_COUNT:
+        return SATURATED
+    if successes > 0:
+        return COVERED
+    if stats.failed_nodes.get(key, 0) >= config.CHAIN_SATURATION_COUNT and len(stats.failure_signatures.get(key, ())) <= 1:
+        return SATURATED
+    if target in dep_blocked_nodes:
+        return UNCOVERED_DEP_BLOCKED
+    return UNCOVERED
+
+
+def get_chain_cost(chain: Chain, stats: Stats, default_step_cost: float) -> float:
+    """Estimates how long a chain takes to run from the mean time of each of its steps so far
+
+    Args:
+        chain (Chain): The chain
+        stats (Stats): The stats of the run so far
+        default_step_cost (float): The cost of a step that has never been timed
+
+    Returns:
+        float: The estimated cost in seconds
+    """
+    cost = 0.0
+    for step in chain.steps:
+        if step.node.graphql_type == "Object":
+            continue  # Objects don't send a request
+        timings = stats.node_timings.get(_node_key(step.node))
+        cost += sum(timings) / len(timings) if timings else default_step_cost
+    return cost
+
+
+def schedule_chains(chains: list[Chain], stats: Stats, dep_blocked_nodes: set[Node]) -> list[Chain]:
+    """Orders the chains for the next iteration according to CHAIN_SCHEDULING
+
+    Args:
+        chains (list[Chain]): The chains, in compiled order
+        stats (Stats): The stats of the run so far
+        dep_blocked_nodes (set[Node]): Nodes that failed because of unmet hard dependencies
+
+    Returns:
+        list[Chain]: The chains in the order to run them
+    """
+    if config.CHAIN_SCHEDULING != "coverage":
+        return list(chains)
+
+    # Steps that were never timed are assumed to take as long as an average step
+    all_timings = [timing for timings in stats.node_timings.values() for timing in timings]
+    default_step_cost = sum(all_timings) / len(all_timings) if all_timings else DEFAULT_STEP_COST
+
+    # sorted() is stable, so chains with the same rank and cost keep their compiled order
+    return sorted(chains, key=lambda chain: (get_chain_rank(chain, stats, dep_blocked_nodes), get_chain_cost(chain, stats, default_step_cost)))
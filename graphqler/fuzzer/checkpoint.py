@@ -0,0 +1,140 @@
+"""Checkpoints for resuming an interrupted fuzzing run (``--resume``)
+
+``Fuzzer.run()`` runs the fuzzing phases in a child process that is terminated at MAX_TIME, so a long campaign that
+gets interrupted would otherwise start over at the first chain. While fuzzing, the fuzzer periodically records how far
+it got, along with everything a later run needs to carry on from there:
+
+- the phase (``chains`` | ``islands`` | ``dep_retry`` | ``detections`` | ``done``), the chain iteration and the index
+  of the next chain / node of the phase to run (in the order the chains were scheduled for the iteration)
+- the nodes that were blocked by unmet hard dependencies (re-run in the dep_retry phase)
+- the detections already run by the DEngine (``nodes_ran``), and the ones still running (e.g. in the background),
+  which are run again on resume since the progress may already be past their nodes
+- the global objects bucket and the stats
+
+The checkpoint is stamped with a digest of the chains it was taken with, so it is ignored if the chains were
+recompiled in the meantime.
+"""
+
+import hashlib
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import cloudpickle as pickle
+
+from graphqler import config
+from graphqler.chains import Chain
+
+CHECKPOINT_FORMAT_VERSION = 3
+
+
+@dataclass
+class Checkpoint:
+    """How far a fuzzing run got, and the state needed to continue it"""
+
+    chains_digest: str  # See get_chains_digest
+    phase: str = "chains"  # "chains" | "islands" | "dep_retry" | "detections" | "done"
+    iteration: int = 0  # 0-based chain iteration
+    chain_order: list[str] = field(default_factory=list)  # Ids of the chains in the order the current iteration runs them
+    chain_index: int = 0  # Chains before this index (in chain_order) are complete for the current iteration
+    phase_nodes: list[tuple[str, str]] = field(default_factory=list)  # (graphql_type, name) of the nodes the islands / dep_retry phase runs
+    node_index: int = 0  # Number of phase_nodes already run
+    dep_blocked_nodes: list[tuple[str, str]] = field(default_factory=list)  # (graphql_type, name)
+    nodes_ran: dict[str, dict[str, bool]] = field(default_factory=dict)  # DEngine.nodes_ran
+    pending_detections: list[tuple[str, str]] = field(default_factory=list)  # (node_name, detection_name) still running, see DEngine.get_running_detections
+    objects_bucket: Any = None
+    stats: dict | None = None  # Stats.snapshot()
+    version: int = CHECKPOINT_FORMAT_VERSION
+
+
+def get_checkpoint_path() -> Path:
+    """Gets the path of the checkpoint file
+
+    Returns:
+        Path: The checkpoint file
+    """
+    return Path(config.OUTPUT_DIRECTORY) / config.SERIALIZED_DIR_NAME / config.CHECKPOINT_FILE_NAME
+
+
+def get_chains_digest(chains: list[Chain]) -> str:
+    """Gets a digest identifying a list of chains, so a checkpoint is only resumed against the chains it was taken with
+
+    Args:
+        chains (list[Chain]): The chains
+
+    Returns:
+        str: The SHA-256 hex digest
+    """
+    digest = hashlib.sha256()
+    for chain in chains:
+        digest.update(repr((chain.id, chain.signature())).encode())
+    return digest.hexdigest()
+
+
+def save_checkpoint(checkpoint: Checkpoint, path: Path | None = None):
+    """Saves the checkpoint atomically, so a run killed mid-write keeps the previous checkpoint
+
+    Args:
+        checkpoint (Checkpoint): The checkpoint
+        path (Path | None, optional): The checkpoint file. Defaults to get_checkpoint_path().
+    """
+    path = path or get_checkpoint_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(checkpoint, f)
+    tmp_path.replace(path)
+
+
+def load_checkpoint(path: Path | None = None) -> Checkpoint | None:
+    """Loads the checkpoint
+
+    Args:
+        path (Path | None, optional): The checkpoint file. Defaults to get_checkpoint_path().
+
+    Returns:
+        Checkpoint | None: The checkpoint, or None if there is none or it can't be read
+    """
+    path = path or get_checkpoint_path()
+    if not path.exists():
+        return None
+    try:
+        with open(path, "rb") as f:
+            checkpoint = pickle.load(f)
+    except Exception:
+        return None
+    if not isinstance(checkpoint, Checkpoint) or checkpoint.version != CHECKPOINT_FORMAT_VERSION:
+        return None
+    return checkpoint
+
+
+class ChainProgress:
+    """Tracks the progress of one chain iteration as the index below which every chain has completed.
+
+    Chains complete out of order when they run concurrently, so a chain only moves the index once every chain
+    before it has completed as well. Resuming from the index may re-run a few chains that had already finished,
+    but never skips one that hadn't.
+    """
+
+    def __init__(self, chains: list[Chain], start_index: int = 0):
+        self._indices = {id(chain): i for i, chain in enumerate(chains)}
+        self._completed: set[int] = set()
+        self._lock = threading.Lock()
+        self.index = start_index
+
+    def complete(self, chain: Chain) -> int:
+        """Marks a chain as completed
+
+        Args:
+            chain (Chain): The chain
+
+        Returns:
+            int: The index below which every chain has completed
+        """
+        with self._lock:
+            self._completed.add(self._indices[id(chain)])
+            while self.index in self._completed:
+                self._completed.discard(self.index)
+                self.index += 1
+            return self.index
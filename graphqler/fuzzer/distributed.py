@@ -0,0 +1,206 @@
+"""Distributed fuzzing: workers sharded by chain, and a coordinator that merges their results
+
+A campaign can be spread over several processes or machines that fuzz the same compiled output. Each worker is started
+in fuzz mode with its own ``--path`` and ``--worker-index i --num-workers n --shared-dir <dir>``, and only runs its
+shard of the chains and of the island nodes (every n-th one, starting at i). Worker 0 also runs the API-level
+detections. A worker puts a report in the shared directory when it starts fuzzing, and its final one when it finishes
+(or is stopped at MAX_TIME):
+
+  <shared dir>/workers/worker-<i>-of-<n>.pkl
+
+holding its stats (results, status codes, vulnerabilities, ...) and its detections tree. The coordinator (``--mode
+merge``) waits until every worker has exited (finished or stopped), then merges them into one set of stats and one detections tree in its own
+output directory. Reports written before the coordinator started are left over from an earlier campaign in the same
+shared directory and are ignored, so the coordinator is started before (or together with) the workers. The shared directory can be any directory every process can reach (e.g. a local directory, or an
+NFS mount for several machines); reports are written atomically, so a half-written report is never read.
+"""
+
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Sequence, TypeVar
+
+import cloudpickle as pickle
+
+from graphqler import config
+from graphqler.utils.stats import Stats
+
+T = TypeVar("T")
+
+WORKER_REPORTS_DIR_NAME = "workers"
+CONFIRMED_MARKER = b"Status        : CONFIRMED"  # How detection_writer marks a confirmed finding in summary.txt
+
+
+@dataclass
+class WorkerReport:
+    """The results of one worker"""
+
+    worker_index: int
+    num_workers: int
+    chains_digest: str  # Workers must have fuzzed the same chains for their shards to add up
+    finished: bool  # False if the worker was stopped (e.g. at MAX_TIME) before finishing its shard
+    stats: dict  # Stats.snapshot()
+    detections: dict[str, bytes] = field(default_factory=dict)  # Path relative to the detections directory -> file contents
+    exited: bool = True  # Whether this is the worker's final report (it finished or was stopped), so no newer one will come
+    written_at: float = 0.0  # When the report was written, to tell this campaign's reports from an earlier one's
+
+
+def is_distributed() -> bool:
+    """Returns whether this process is one of several distributed fuzzing workers"""
+    return config.NUM_WORKERS > 1
+
+
+def shard(items: Sequence[T]) -> list[T]:
+    """Gets this worker's share of the items: every NUM_WORKERS-th item, starting at WORKER_INDEX
+
+    Every worker must see the items in the same order, so the shards don't overlap and cover all items.
+
+    Args:
+        items (Sequence[T]): The items (chains or nodes), in the same order on every worker
+
+    Returns:
+        list[T]: This worker's items (all of them when not distributed)
+    """
+    if not is_distributed():
+        return list(items)
+    return list(items[config.WORKER_INDEX::config.NUM_WORKERS])
+
+
+def get_worker_report_path(shared_dir: str | Path, worker_index: int, num_workers: int) -> Path:
+    """Gets the path of a worker's report in the shared directory
+
+    Args:
+        shared_dir (str | Path): The shared directory
+        worker_index (int): The worker's index
+        num_workers (int): The number of workers
+
+    Returns:
+        Path: The report file
+    """
+    return Path(shared_dir) / WORKER_REPORTS_DIR_NAME / f"worker-{worker_index}-of-{num_workers}.pkl"
+
+
+def write_worker_report(stats: Stats, chains_digest: str, finished: bool, exited: bool = True):
+    """Writes this worker's report to the shared directory (SHARED_DIR)
+
+    Args:
+        stats (Stats): This worker's stats
+        chains_digest (str): Digest of the chains this worker sharded (see checkpoint.get_chains_digest)
+        finished (bool): Whether the worker finished its shard
+        exited (bool, optional): Whether this is the worker's final report. Defaults to True.
+
+    Raises:
+        ValueError: If SHARED_DIR isn't set
+    """
+    detections_dir = Path(config.OUTPUT_DIRECTORY) / config.DETECTIONS_DIR_NAME
+    detections = {}
+    if detections_dir.exists():
+        detections = {str(path.relative_to(detections_dir)): path.read_bytes() for path in sorted(detections_dir.rglob("*")) if path.is_file()}
+    report = WorkerReport(
+        worker_index=config.WORKER_INDEX,
+        num_workers=config.NUM_WORKERS,
+        chains_digest=chains_digest,
+        finished=finished,
+        stats=stats.snapshot(),
+        detections=detections,
+        exited=exited,
+        written_at=time.time(),
+    )
+
+    if config.SHARED_DIR is None:
+        raise ValueError("SHARED_DIR must be set for distributed fuzzing")
+    path = get_worker_report_path(config.SHARED_DIR, config.WORKER_INDEX, config.NUM_WORKERS)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(report, f)
+    tmp_path.replace(path)
+
+
+def read_worker_reports(
+    shared_dir: str | Path, num_workers: int, timeout: float, poll_interval: float = 1.0, since: float = 0.0
+) -> dict[int, WorkerReport]:
+    """Waits until every worker has exited, whether it finished its shard or was stopped (e.g. at MAX_TIME), or until
+    the timeout
+
+    Args:
+        shared_dir (str | Path): The shared directory
+        num_workers (int): The number of workers
+        timeout (float): Seconds to wait for the workers to finish
+        poll_interval (float, optional): Seconds between checks of the shared directory. Defaults to 1.0.
+        since (float, optional): Ignore reports written before this time (left over from an earlier campaign). Defaults to 0.0.
+
+    Returns:
+        dict[int, WorkerReport]: The latest report of each worker that reported, by worker index
+    """
+    deadline = time.time() + timeout
+    reports: dict[int, WorkerReport] = {}
+    while True:
+        for worker_index in range(num_workers):
+            path = get_worker_report_path(shared_dir, worker_index, num_workers)
+            if path.exists() and not (worker_index in reports and reports[worker_index].exited):
+                with open(path, "rb") as f:
+                    report = pickle.load(f)
+                if report.written_at >= since:
+                    reports[worker_index] = report
+        if all(worker_index in reports and reports[worker_index].exited for worker_index in range(num_workers)):
+            return reports
+        if time.time() >= deadline:
+            return reports
+        time.sleep(poll_interval)
+
+
+def merge_detections(reports: list[WorkerReport], detections_dir: Path):
+    """Merges the workers' detections trees into one
+
+    ``raw_log.txt`` files (one entry per detection event) are concatenated. For other files (e.g. ``summary.txt``),
+    a confirmed finding is kept over a potential one, and otherwise the last worker's copy wins.
+
+    Args:
+        reports (list[WorkerReport]): The workers' reports, in worker order
+        detections_dir (Path): The merged detections directory
+    """
+    for report in reports:
+        for relative_path, contents in report.detections.items():
+            path = detections_dir / relative_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if path.name == "raw_log.txt":
+                with open(path, "ab") as f:
+                    f.write(contents)
+            elif not (path.exists() and CONFIRMED_MARKER in path.read_bytes() and CONFIRMED_MARKER not in contents):
+                path.write_bytes(contents)
+
+
+def merge_worker_results(shared_dir: str | Path, num_workers: int, timeout: float, since: float | None = None) -> Stats:
+    """Runs the coordinator: waits for the workers' reports and merges them into this process's Stats and detections
+
+    Args:
+        shared_dir (str | Path): The shared directory
+        num_workers (int): The number of workers
+        timeout (float): Seconds to wait for the workers to finish
+        since (float | None, optional): Ignore reports written before this time. Defaults to None (now, when the
+                                        coordinator starts).
+
+    Raises:
+        ValueError: If the workers fuzzed different chains
+
+    Returns:
+        Stats: The merged stats
+    """
+    reports = read_worker_reports(shared_dir, num_workers, timeout, since=time.time() if since is None else since)
+    missing = [i for i in range(num_workers) if i not in reports]
+    unfinished = [i for i, report in reports.items() if not report.finished]
+    if missing:
+        print(f"(M) No results from worker(s) {missing} — their shards are missing from the merged results")
+    if unfinished:
+        print(f"(M) Worker(s) {unfinished} stopped before finishing their shard — merging their partial results")
+
+    ordered_reports = [reports[i] for i in sorted(reports)]
+    if len({report.chains_digest for report in ordered_reports}) > 1:
+        raise ValueError("The workers fuzzed different chains — compile once and give every worker the same compiled output")
+
+    stats = Stats()
+    for report in ordered_reports:
+        stats.merge(report.stats)
+    merge_detections(ordered_reports, Path(config.OUTPUT_DIRECTORY) / config.DETECTIONS_DIR_NAME)
+    return stats
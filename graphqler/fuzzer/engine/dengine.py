@@ -1,8 +1,12 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import graphqler.config as config
 from graphqler.graph.node import Node
 from graphqler.utils.api import API
 from graphqler.utils.logging_utils import Logger
 from graphqler.utils.objects_bucket import ObjectsBucket
+from graphqler.utils.run_context import in_current_context
 
 from .detectors import api_detectors, injection_detectors, misc_detectors, enumeration_detectors
 from .detectors.detector import Detector
@@ -22,6 +26,11 @@ class DEngine:
         self.api = api
         self.logger = Logger().get_detector_logger()
         self.nodes_ran: dict[str, dict[str, bool]] = {}  # {node_name: {detection_name: True/False}}
+        self._running_detections: set[tuple[str, str]] = set()  # {(node_name, detection_name)} claimed by a chain thread
+        self._nodes_ran_lock = threading.Lock()
+        self._background_executor: ThreadPoolExecutor | None = None
+        self._background_detections: list[Future] = []
+        self._background_lock = threading.Lock()
 
     def run_detections_on_api(self):
         """Run detections on the API
@@ -30,14 +39,9 @@ class DEngine:
         for api_detector in api_detectors:
             node = Node(graphql_type='misc', name=self.api.url, body={})  # Create a dummy node object for the API
             detector = api_detector(api=self.api, node=node, objects_bucket=ObjectsBucket(self.api), graphql_type="")
-            if not self.__should_run_detection(detector, self.api.url):
+            if not self.__claim_detection(detector, self.api.url):
                 continue
-            try:
-                is_vulnerable, potentially_vulnerable = detector.detect()
-                self.logger.info(f"Detector {detector.DETECTION_NAME} finished detecting - is_vulnerable: {is_vulnerable} - potentially_vulnerable: {potentially_vulnerable}")
-                self.__add_ran_node(self.api.url, detector.DETECTION_NAME)
-            except Exception as e:
-                self.logger.error(f"Detector {detector.DETECTION_NAME} failed with error: {e}")
+            self.__run_detection(detector, self.api.url)
 
     def run_detections_on_graphql_object(self, node: Node, objects_bucket: ObjectsBucket, graphql_type: str):
         """Runs all detectors on a specific GraphQL object (either QUERY or MUTATION)
@@ -66,14 +70,9 @@ class DEngine:
         """
         for misc_detector in misc_detectors:
             detector = misc_detector(api=self.api, node=node, objects_bucket=objects_bucket, graphql_type=graphql_type)
-            if not self.__should_run_detection(detector, node.name):
+            if not self.__claim_detection(detector, node.name):
                 continue
-            try:
-                is_vulnerable, potentially_vulnerable = detector.detect()
-                self.logger.info(f"Detector {detector.DETECTION_NAME} finished detecting - is_vulnerable: {is_vulnerable} - potentially_vulnerable: {potentially_vulnerable}")
-                self.__add_ran_node(node.name, detector.DETECTION_NAME)
-            except Exception as e:
-                self.logger.error(f"Detector {detector.DETECTION_NAME} failed with error: {e}")
+            self.__run_detection(detector, node.name)
 
     def __run_injection_detections(self, node: Node, objects_bucket: ObjectsBucket, graphql_type: str):
         """Runs injection detections
@@ -85,14 +84,9 @@ class DEngine:
         """
         for injection_detector in injection_detectors:
             detector = injection_detector(api=self.api, node=node, objects_bucket=objects_bucket, graphql_type=graphql_type)
-            if not self.__should_run_detection(detector, node.name):
+            if not self.__claim_detection(detector, node.name):
                 continue
-            try:
-                is_vulnerable, potentially_vulnerable = detector.detect()
-                self.logger.info(f"Detector {detector.DETECTION_NAME} finished detecting - is_vulnerable: {is_vulnerable} - potentially_vulnerable: {potentially_vulnerable}")
-                self.__add_ran_node(node.name, detector.DETECTION_NAME)
-            except Exception as e:
-                self.logger.error(f"Detector {detector.DETECTION_NAME} failed with error: {e}")
+            self.__run_detection(detector, node.name)
 
     def __run_enumeration_detections(self, node: Node, objects_bucket: ObjectsBucket, graphql_type: str):
         """Runs field enumeration detections (charset fuzzing and ID enumeration / IDOR).
@@ -104,28 +98,109 @@ class DEngine:
         """
         for enum_detector in enumeration_detectors:
             detector = enum_detector(api=self.api, node=node, objects_bucket=objects_bucket, graphql_type=graphql_type)
-            if not self.__should_run_detection(detector, node.name):
+            if not self.__claim_detection(detector, node.name):
                 continue
-            try:
-                is_vulnerable, potentially_vulnerable = detector.detect()
-                self.logger.info(f"Detector {detector.DETECTION_NAME} finished detecting - is_vulnerable: {is_vulnerable} - potentially_vulnerable: {potentially_vulnerable}")
-                self.__add_ran_node(node.name, detector.DETECTION_NAME)
-            except Exception as e:
-                self.logger.error(f"Detector {detector.DETECTION_NAME} failed with error: {e}")
+            self.__run_detection(detector, node.name)
 
-    def __add_ran_node(self, name: str, detection_name: str):
-        """Adds the node to the ran nodes list
+    def run_detection_on_graphql_object(self, node: Node, objects_bucket: ObjectsBucket, graphql_type: str, detection_name: str):
+        """Runs one of the node detections on a GraphQL object, e.g. one that was still running when a checkpoint was taken
+
+        Args:
+            node (Node): The node object
+            objects_bucket (ObjectsBucket): The objects bucket
+            graphql_type (str): The GraphQL type
+            detection_name (str): The detector's DETECTION_NAME
+        """
+        for node_detector in [*injection_detectors, *misc_detectors, *enumeration_detectors]:
+            detector = node_detector(api=self.api, node=node, objects_bucket=objects_bucket, graphql_type=graphql_type)
+            if detector.DETECTION_NAME != detection_name:
+                continue
+            if self.__claim_detection(detector, node.name):
+                self.__run_detection(detector, node.name)
+            return
+
+    def get_running_detections(self) -> list[tuple[str, str]]:
+        """Gets the detections that were claimed but haven't finished yet (e.g. still running in the background)
+
+        Returns:
+            list[tuple[str, str]]: (node_name, detection_name) pairs
+        """
+        with self._nodes_ran_lock:
+            return sorted(self._running_detections)
+
+    def get_nodes_ran(self) -> dict[str, dict[str, bool]]:
+        """Gets a copy of the detections that finished, e.g. for a checkpoint (detections still running aren't in it)
+
+        Returns:
+            dict[str, dict[str, bool]]: {node_name: {detection_name: True}}
+        """
+        with self._nodes_ran_lock:
+            return {name: dict(detections) for name, detections in self.nodes_ran.items()}
+
+    def wait_for_background_detections(self):
+        """Waits for the detections running in the background (see Detector.runs_in_background) to finish"""
+        with self._background_lock:
+            executor, self._background_executor = self._background_executor, None
+            pending = sum(not future.done() for future in self._background_detections)
+            self._background_detections = []
+        if executor is None:
+            return
+        if pending:
+            self.logger.info(f"Waiting for {pending} background detection(s) to finish")
+        executor.shutdown(wait=True)
+
+    def __run_detection(self, detector: Detector, name: str):
+        """Runs the detector on the node, or hands it to the background pool if it runs in the background
 
         Args:
+            detector (Detector): The detector object
             name (str): The name of the node
-            detection_name (str): The name of the detection
         """
-        if name not in self.nodes_ran:
-            self.nodes_ran[name] = {}
-        self.nodes_ran[name][detection_name] = True
+        if not detector.runs_in_background:
+            self.__release_detection(detector, name, self.__detect(detector))
+            return
+
+        # The detection stays claimed (so the node isn't scheduled again) until it finishes, and only then is it marked
+        # as ran, so a checkpoint taken meanwhile doesn't count it. It works on a private copy of the objects bucket
+        # since the chain keeps changing it
+        detector.objects_bucket = detector.objects_bucket.clone(shared=False)
+        with self._background_lock:
+            if self._background_executor is None:
+                # Time-based SQLi is the only detector that runs in the background
+                self._background_executor = ThreadPoolExecutor(max_workers=max(1, config.TIME_BASED_SQL_PARALLEL_PROBES), thread_name_prefix="detection")
+            self._background_detections = [future for future in self._background_detections if not future.done()]
+            self._background_detections.append(self._background_executor.submit(in_current_context(self.__run_background_detection), detector, name))
+
+    def __run_background_detection(self, detector: Detector, name: str):
+        """Runs a detector handed to the background pool, and releases its claim on the node
+
+        Args:
+            detector (Detector): The detector object
+            name (str): The name of the node
+        """
+        self.__release_detection(detector, name, self.__detect(detector))
 
-    def __should_run_detection(self, detector: Detector, name: str) -> bool:
-        """Whether the detection should be ran
+    def __detect(self, detector: Detector) -> bool:
+        """Runs the detector
+
+        Args:
+            detector (Detector): The detector object
+
+        Returns:
+            bool: Whether the detection ran without errors
+        """
+        try:
+            is_vulnerable, potentially_vulnerable = detector.detect()
+            self.logger.info(f"Detector {detector.DETECTION_NAME} finished detecting - is_vulnerable: {is_vulnerable} - potentially_vulnerable: {potentially_vulnerable}")
+            return True
+        except Exception as e:
+            self.logger.error(f"Detector {detector.DETECTION_NAME} failed with error: {e}")
+            return False
+
+    def __claim_detection(self, detector: Detector, name: str) -> bool:
+        """Whether the detection should be ran, claiming it if so: chains run in parallel threads, so the check and
+        the claim happen under one lock or two chains reaching the same node would both run its once-only detections.
+        A claimed detection must be released with __release_detection
 
         Args:
             detector (Detector): The detector object
@@ -134,14 +209,44 @@ class DEngine:
         Returns:
             bool: Whether the detection should be ran
         """
-        # First, check if the detector should be ran only once on the node
-        if detector.detect_only_once_for_node:
-            if name in self.nodes_ran and detector.DETECTION_NAME in self.nodes_ran[name]:
-                return False
-
-        # Next, check if the detector should be run only once on the API
-        if detector.detect_only_once_for_api:
-            for node in self.nodes_ran:
-                if detector.DETECTION_NAME in self.nodes_ran[node]:
+        with self._nodes_ran_lock:
+            # First, check if the detector should be ran only once on the node
+            if detector.detect_only_once_for_node:
+                if detector.DETECTION_NAME in self.nodes_ran.get(name, {}) or (name, detector.DETECTION_NAME) in self._running_detections:
+                    return False
+
+            # Next, check if the detector should be run only once on the API
+            if detector.detect_only_once_for_api:
+                if any(detector.DETECTION_NAME in detections for detections in self.nodes_ran.values()):
+                    return False
+                if any(detection_name == detector.DETECTION_NAME for _, detection_name in self._running_detections):
                     return False
-        return True
+
+            if detector.detect_only_once_for_node or detector.detect_only_once_for_api:
+                self._running_detections.add((name, detector.DETECTION_NAME))
+            return True
+
+    def __release_detection(self, detector: Detector, name: str, ran: bool):
+        """Releases a detection claimed with __claim_detection, marking it as ran if it ran without errors
+        (a failed detection can be claimed again)
+
+        Args:
+            detector (Detector): The detector object
+            name (str): The name of the node
+            ran (bool): Whether the detection ran without errors
+        """
+        with self._nodes_ran_lock:
+            self._running_detections.discard((name, detector.DETECTION_NAME))
+            if ran:
+                self.__add_ran_node(name, detector.DETECTION_NAME)
+
+    def __add_ran_node(self, name: str, detection_name: str):
+        """Adds the node to the ran nodes list
+
+        Args:
+            name (str): The name of the node
+            detection_name (str): The name of the detection
+        """
+        if name not in self.nodes_ran:
+            self.nodes_ran[name] = {}
+        self.nodes_ran[name][detection_name] = True
@@ -41,6 +41,12 @@ class Detector(ABC):
         """Whether the detector should be run only once on the node"""
         return True
 
+    @property
+    def runs_in_background(self) -> bool:
+        """Whether DEngine should run the detector in the background while the fuzzer carries on
+        (for detectors that mostly wait on the server, like time-based ones)"""
+        return False
+
     @property
     @abstractmethod
     def materializer(self) -> Type[Materializer]:
@@ -0,0 +1,197 @@
+"""Alias-batched probing for the field-fuzzing detectors
+
+The enumeration detectors send many probes that only differ in one input value. With ENUMERATION_ALIAS_BATCH_SIZE > 1,
+up to that many probes are packed into a single document, each under its own alias:
+
+  query { probe_0: user(id: 1) { id } probe_1: user(id: 2) { id } ... }
+
+and the response is split back into one response per probe (``data.probe_i`` and the errors whose path starts with
+``probe_i``), as if the probe had been sent on its own. When the server rejects a batch (no data at all):
+
+- because of a complexity / cost / depth limit, the batch is split in two and each half is sent again, down to single
+  requests
+- for any other reason (e.g. aliases are refused), batching is given up for that operation of that target: the
+  remaining probes, and those of later calls, are sent one per request
+"""
+
+import json
+import re
+import threading
+from dataclasses import dataclass
+
+from graphql import FieldNode, NameNode, OperationDefinitionNode, SelectionSetNode, parse, print_ast
+
+from graphqler.utils import plugins_handler
+from graphqler.utils.logging_utils import Logger
+from graphqler.utils.stats import Stats
+
+# Errors of a batch that is only rejected for its size, which smaller batches can get through
+_LIMIT_ERROR_PATTERN = re.compile(r"complex|cost|depth|limit|too (many|large|big)|exceed", re.IGNORECASE)
+
+aliases_refused: set[tuple[str, str]] = set()  # (url, operation name) of the operations whose aliased batches were refused
+_aliases_refused_lock = threading.Lock()
+
+
+@dataclass
+class ProbeResponse:
+    """The response to a single probe
+
+    Attributes:
+        graphql_response (dict): The probe's GraphQL response ({"data": {<name>: ...}, "errors": [...]} for aliased probes)
+        status_code (int): The HTTP status code of the request the probe was sent in
+        response_length (int): Length of the probe's response, comparable across the probes of one send_probes call
+    """
+
+    graphql_response: dict
+    status_code: int
+    response_length: int
+
+
+def get_probe_alias(index: int) -> str:
+    return f"probe_{index}"
+
+
+def build_aliased_payload(payloads: list[str]) -> str:
+    """Merges single-field operations into one operation, the top-level field of payloads[i] aliased as probe_i
+
+    Args:
+        payloads (list[str]): The probes' payloads, all of the same operation type
+
+    Raises:
+        ValueError: If a payload isn't a single operation with a single top-level field, or the operation types differ
+
+    Returns:
+        str: The aliased payload
+    """
+    operations = []
+    selections = []
+    for index, payload in enumerate(payloads):
+        definitions = parse(payload).definitions
+        operation = definitions[0] if len(definitions) == 1 else None
+        if not isinstance(operation, OperationDefinitionNode) or len(operation.selection_set.selections) != 1 or not isinstance(operation.selection_set.selections[0], FieldNode):
+            raise ValueError("Only payloads with a single operation and top-level field can be aliased")
+        field = operation.selection_set.selections[0]
+        operations.append(operation)
+        selections.append(FieldNode(
+            alias=NameNode(value=get_probe_alias(index)),
+            name=field.name,
+            arguments=field.arguments,
+            directives=field.directives,
+            selection_set=field.selection_set,
+        ))
+    if len({operation.operation for operation in operations}) != 1:
+        raise ValueError("Only payloads of the same operation type can be aliased")
+    return print_ast(OperationDefinitionNode(
+        operation=operations[0].operation,
+        variable_definitions=(),
+        directives=(),
+        selection_set=SelectionSetNode(selections=tuple(selections)),
+    ))
+
+
+def split_aliased_response(graphql_response: dict, name: str, count: int) -> list[dict]:
+    """Splits the response to an aliased payload into one response per probe
+
+    Args:
+        graphql_response (dict): The response to the aliased payload
+        name (str): The name of the probed query or mutation
+        count (int): The number of probes in the payload
+
+    Returns:
+        list[dict]: The response of each probe, keyed by the operation's name instead of the alias
+    """
+    data = graphql_response.get("data") or {}
+    errors = [error for error in graphql_response.get("errors") or [] if isinstance(error, dict)]
+    responses = []
+    for index in range(count):
+        alias = get_probe_alias(index)
+        response: dict = {"data": {name: data.get(alias)}}
+        probe_errors = [{**error, "path": [name, *error["path"][1:]]} for error in errors if error.get("path") and error["path"][0] == alias]
+        if probe_errors:
+            response["errors"] = probe_errors
+        responses.append(response)
+    return responses
+
+
+def send_probes(url: str, name: str, payloads: list[str], batch_size: int) -> list[ProbeResponse | None]:
+    """Sends the probes, batch_size probes per aliased payload (one request per probe if batch_size <= 1)
+
+    Args:
+        url (str): The url of the endpoint
+        name (str): The name of the probed query or mutation
+        payloads (list[str]): The probes' payloads
+        batch_size (int): The max number of probes per request
+
+    Returns:
+        list[ProbeResponse | None]: The response of each probe, in order (None if its request failed)
+    """
+    responses: list[ProbeResponse | None] = [None] * len(payloads)
+    for start in range(0, len(payloads), max(batch_size, 1)):
+        indices = list(range(start, min(start + max(batch_size, 1), len(payloads))))
+        with _aliases_refused_lock:
+            is_refused = (url, name) in aliases_refused
+        if is_refused:
+            for index in indices:
+                _send_batch(url, name, payloads, [index], batch_size > 1, responses)
+        else:
+            _send_batch(url, name, payloads, indices, batch_size > 1, responses)
+    return responses
+
+
+def reset_aliases_refused() -> None:
+    """Forget which operations refused aliased batches"""
+    with _aliases_refused_lock:
+        aliases_refused.clear()
+
+
+def _is_limit_error(graphql_response: dict | None) -> bool:
+    """Whether a rejected batch's errors say it exceeded a complexity / cost / depth limit"""
+    errors = graphql_response.get("errors") if isinstance(graphql_response, dict) else None
+    if not isinstance(errors, list):
+        return False
+    return any(isinstance(error, dict) and _LIMIT_ERROR_PATTERN.search(str(error.get("message", ""))) for error in errors)
+
+
+def _send_batch(url: str, name: str, payloads: list[str], indices: list[int], aliased: bool, responses: list[ProbeResponse | None]):
+    """Sends the probes at indices together, splitting the batch in two while the server rejects it"""
+    logger = Logger().get_detector_logger()
+    request_utils = plugins_handler.get_request_utils()
+    if len(indices) == 1:
+        try:
+            graphql_response, request_response = request_utils.send_graphql_request(url, payloads[indices[0]])
+        except Exception as e:
+            logger.debug(f"[{name}] Probe {indices[0]} failed: {e}")
+            return
+        Stats().add_http_status_code(name, request_response.status_code)
+        response_length = len(json.dumps(graphql_response)) if aliased else len(request_response.text)
+        responses[indices[0]] = ProbeResponse(graphql_response, request_response.status_code, response_length)
+        return
+
+    graphql_response = None
+    try:
+        aliased_payload = build_aliased_payload([payloads[index] for index in indices])
+        graphql_response, request_response = request_utils.send_graphql_request(url, aliased_payload)
+        Stats().add_http_status_code(name, request_response.status_code)
+        is_rejected = request_response.status_code != 200 or not isinstance(graphql_response.get("data"), dict)
+    except Exception as e:
+        logger.debug(f"[{name}] Aliased batch of {len(indices)} probes failed: {e}")
+        is_rejected = True
+
+    if is_rejected and graphql_response is not None and not _is_limit_error(graphql_response):
+        # Smaller batches would be refused too: send these probes, and the next ones, one per request
+        logger.debug(f"[{name}] Aliased batch of {len(indices)} probes refused, sending probes one per request")
+        with _aliases_refused_lock:
+            aliases_refused.add((url, name))
+        for index in indices:
+            _send_batch(url, name, payloads, [index], aliased, responses)
+        return
+
+    if is_rejected:
+        middle = len(indices) // 2
+        logger.debug(f"[{name}] Aliased batch of {len(indices)} probes rejected, retrying in batches of {middle} and {len(indices) - middle}")
+        _send_batch(url, name, payloads, indices[:middle], aliased, responses)
+        _send_batch(url, name, payloads, indices[middle:], aliased, responses)
+        return
+
+    for index, probe_response in zip(indices, split_aliased_response(graphql_response, name, len(indices))):
+        responses[index] = ProbeResponse(probe_response, request_response.status_code, len(json.dumps(probe_response)))
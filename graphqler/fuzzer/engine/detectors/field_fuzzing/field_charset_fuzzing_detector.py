@@ -10,7 +10,8 @@ Explanation:
 Detection logic
 ---------------
 For each String field (up to MAX_CHARSET_FUZZ_FIELDS per node):
-  1. Send one request per character in FIELD_CHARSET.
+  1. Send one request per character in FIELD_CHARSET (or, with ENUMERATION_ALIAS_BATCH_SIZE > 1,
+     aliased batches of characters — see alias_batching).
   2. Record the response text length for each.
   3. Compute relative spread:  (max_len - min_len) / avg_len
   4. If spread > FIELD_RESPONSE_LENGTH_VARIANCE_THRESHOLD → field is enumerable.
@@ -29,6 +30,7 @@ from graphqler.utils.stats import Stats
 from graphqler.fuzzer.engine.materializers.getter import Getter
 from graphqler.fuzzer.engine.materializers.regular_payload_materializer import RegularPayloadMaterializer
 from graphqler.fuzzer.engine.detectors.detector import Detector
+from graphqler.fuzzer.engine.detectors.field_fuzzing.alias_batching import send_probes
 from graphqler.fuzzer.engine.detectors.field_fuzzing.scalar_utils import _resolve_scalar_type
 
 
@@ -159,8 +161,21 @@ class FieldCharsetFuzzingDetector(Detector):
         except (ConnectionError, TimeoutError, OSError, AttributeError):
             return 0
 
+    def _get_response_lengths_aliased(self, field_name: str) -> list[int]:
+        payloads = [self._build_payload(field_name, char) for char in config.FIELD_CHARSET]
+        probed = [i for i, payload in enumerate(payloads) if payload]
+        responses = send_probes(self.api.url, self.name, [payloads[i] for i in probed], config.ENUMERATION_ALIAS_BATCH_SIZE)
+        lengths = [0] * len(payloads)
+        for i, response in zip(probed, responses):
+            if response is not None:
+                lengths[i] = response.response_length
+        return lengths
+
     def _field_shows_variance(self, field_name: str) -> bool:
-        lengths = [self._get_response_length(field_name, char) for char in config.FIELD_CHARSET]
+        if config.ENUMERATION_ALIAS_BATCH_SIZE > 1:
+            lengths = self._get_response_lengths_aliased(field_name)
+        else:
+            lengths = [self._get_response_length(field_name, char) for char in config.FIELD_CHARSET]
         non_zero = [x for x in lengths if x > 0]
         if len(non_zero) < 2:
             return False
@@ -13,7 +13,8 @@ For each Int or ID field (first match per node):
      - "public"  → skip (catalogue endpoints trivially return all items).
      - "unknown" → skip (conservative default to avoid false positives).
      - "private" → proceed.
-  2. Send ID_ENUMERATION_COUNT requests with values 1, 2, … N.
+  2. Send ID_ENUMERATION_COUNT requests with values 1, 2, … N (or, with
+     ENUMERATION_ALIAS_BATCH_SIZE > 1, aliased batches of probes — see alias_batching).
   3. Count how many responses contain non-null data.
   4. If count >= ID_ENUMERATION_SUCCESS_THRESHOLD → flag as IDOR potential.
 
@@ -38,6 +39,7 @@ from graphqler.utils.response_utils import is_non_empty_result
 from graphqler.fuzzer.engine.materializers.getter import Getter
 from graphqler.fuzzer.engine.materializers.regular_payload_materializer import RegularPayloadMaterializer
 from graphqler.fuzzer.engine.detectors.detector import Detector
+from graphqler.fuzzer.engine.detectors.field_fuzzing.alias_batching import send_probes
 from graphqler.fuzzer.engine.detectors.field_fuzzing.endpoint_classifier import EndpointPrivacyClassifier
 from graphqler.fuzzer.engine.detectors.field_fuzzing.scalar_utils import _resolve_scalar_type
 
@@ -197,15 +199,15 @@ class IDEnumerationDetector(Detector):
 
     def _probe_ids(self, field_name: str) -> tuple[int, list[str]]:
         """Send ID_ENUMERATION_COUNT requests; return (success_count, list_of_payloads)."""
+        if config.ENUMERATION_ALIAS_BATCH_SIZE > 1:
+            return self._probe_ids_aliased(field_name)
+
         success_count = 0
         payloads_used: list[str] = []
 
         for i in range(1, config.ID_ENUMERATION_COUNT + 1):
-            mat = _FixedIntMaterializer(api=self.api, target_field=field_name, value=i, max_depth=3)
-            try:
-                payload, _ = mat.get_payload(self.name, self.objects_bucket, self.graphql_type)
-            except Exception as e:
-                self.detector_logger.debug(f"Payload generation failed for ID {i}: {e}")
+            payload = self._build_payload(field_name, i)
+            if not payload:
                 continue
 
             payloads_used.append(payload)
@@ -214,22 +216,41 @@ class IDEnumerationDetector(Detector):
                     self.api.url, payload
                 )
                 Stats().add_http_status_code(self.name, request_response.status_code)
-                if request_response.status_code == 200 and isinstance(graphql_response.get("data"), dict):
-                    data = graphql_response["data"]
-                    field_result = data.get(self.name)
-
-                    is_hit = (
-                        is_non_empty_result(field_result)
-                        if self.name in data
-                        else any(is_non_empty_result(v) for v in data.values())
-                    )
-                    if is_hit:
-                        success_count += 1
+                if request_response.status_code == 200 and self._is_hit(graphql_response):
+                    success_count += 1
             except Exception as e:
                 self.detector_logger.debug(f"Request failed for ID {i}: {e}")
 
         return success_count, payloads_used
 
+    def _probe_ids_aliased(self, field_name: str) -> tuple[int, list[str]]:
+        """Same as _probe_ids, with up to ENUMERATION_ALIAS_BATCH_SIZE IDs probed per request."""
+        payloads_used = [payload for payload in (self._build_payload(field_name, i) for i in range(1, config.ID_ENUMERATION_COUNT + 1)) if payload]
+        responses = send_probes(self.api.url, self.name, payloads_used, config.ENUMERATION_ALIAS_BATCH_SIZE)
+        success_count = sum(
+            1 for response in responses
+            if response is not None and response.status_code == 200 and self._is_hit(response.graphql_response)
+        )
+        return success_count, payloads_used
+
+    def _build_payload(self, field_name: str, value: int) -> str:
+        mat = _FixedIntMaterializer(api=self.api, target_field=field_name, value=value, max_depth=3)
+        try:
+            payload, _ = mat.get_payload(self.name, self.objects_bucket, self.graphql_type)
+        except Exception as e:
+            self.detector_logger.debug(f"Payload generation failed for ID {value}: {e}")
+            return ""
+        return payload
+
+    def _is_hit(self, graphql_response: dict) -> bool:
+        """Whether a probe's response contains non-null data."""
+        data = graphql_response.get("data")
+        if not isinstance(data, dict):
+            return False
+        if self.name in data:
+            return is_non_empty_result(data.get(self.name))
+        return any(is_non_empty_result(v) for v in data.values())
+
     # Not used (detect() is fully overridden) but required by ABC
     def _is_vulnerable(self, graphql_response: dict, request_response: requests.Response) -> bool:
         raise NotImplementedError
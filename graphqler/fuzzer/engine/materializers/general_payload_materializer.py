@@ -29,11 +29,12 @@ class GeneralPayloadMaterializer(Materializer):
     def __init__(self, api: API, fail_on_hard_dependency_not_met: bool = True):
         super().__init__(api, fail_on_hard_dependency_not_met)
         self.logger = Logger().get_fuzzer_logger().getChild(__name__)
-        self._regular = RegularPayloadMaterializer(api, fail_on_hard_dependency_not_met)
+        self._regular = RegularPayloadMaterializer(api, fail_on_hard_dependency_not_met, use_variables=config.USE_GRAPHQL_VARIABLES)
         self._llm = LLMPayloadMaterializer(api, fail_on_hard_dependency_not_met)
 
-    def get_payload(self, name: str, objects_bucket: ObjectsBucket, graphql_type: str) -> tuple[str, dict]:
-        """Return a ``(payload_string, used_objects)`` tuple.
+    def get_payload(self, name: str, objects_bucket: ObjectsBucket, graphql_type: str) -> tuple[str | dict, dict]:
+        """Return a ``(payload_string, used_objects)`` tuple (the payload is a request body with variables
+        when ``config.USE_GRAPHQL_VARIABLES`` is enabled for the regular materializer).
 
         Uses ``LLMPayloadMaterializer`` when ``config.USE_LLM`` is enabled,
         falling back to ``RegularPayloadMaterializer`` on any error.
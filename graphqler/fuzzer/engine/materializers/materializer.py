@@ -3,7 +3,9 @@ Base class for a regular materializer
 """
 
 from ..exceptions.hard_dependency_not_met_exception import HardDependencyNotMetException
-from .utils.materialization_utils import is_valid_object_materialization, clean_output_selectors
+from .utils.materialization_utils import is_valid_object_materialization, clean_output_selectors, get_type_string, prettify_graphql_payload, scalar_literal_to_value
+from .utils.operation_document_cache import get_operation_document_cache
+from .utils.selection_set_cache import CachedSelectionSet, get_selection_set_cache
 from .getter import Getter
 from graphqler.utils.logging_utils import Logger
 from graphqler.utils.parser_utils import get_base_oftype, is_simple_scalar
@@ -11,6 +13,8 @@ from graphqler.utils.objects_bucket import ObjectsBucket
 from graphqler.utils.api import API
 from graphqler import config
 
+NO_VALUE = object()  # What materialize_input_value_recursive returns for an input it couldn't materialize
+
 
 class Materializer:
     def __init__(self, api: API, fail_on_hard_dependency_not_met: bool = True, max_depth: int = 5, getter: Getter = Getter()):
@@ -41,6 +45,50 @@ class Materializer:
         """
         return ("", {})
 
+    def get_variables_payload(self,
+                              name: str,
+                              objects_bucket: ObjectsBucket,
+                              graphql_type: str,
+                              max_input_depth: int,
+                              max_output_depth: int,
+                              minimal_materialization: bool) -> tuple[dict, dict]:
+        """Materializes the payload as a parameterized operation document and the variables to send with it
+           (USE_GRAPHQL_VARIABLES). The document is cached per operation, materializer and selection set, so only
+           the variables are materialized again for each payload
+
+        Args:
+            name (str): The name of the query or mutation
+            objects_bucket (ObjectsBucket): The bucket of objects that have already been created
+            graphql_type (str): The type of the graphql operation (Query or Mutation)
+            max_input_depth (int): The maximum depth of the inputs
+            max_output_depth (int): The maximum depth of the output selectors
+            minimal_materialization (bool): Whether to materialize only the minimal fields
+
+        Returns:
+            tuple[dict, dict]: The request body ({"query": ..., "variables": ...}), and the used objects list
+        """
+        operator_info = self.api.queries[name] if graphql_type == "Query" else self.api.mutations[name]
+        variable_types, variables = self.materialize_variables(operator_info, operator_info["inputs"], objects_bucket, max_depth=max_input_depth)
+        self._selection_has_arguments = False
+        output = self.materialize_output(operator_info, operator_info["output"], objects_bucket, max_depth=max_output_depth, minimal_materialization=minimal_materialization)
+
+        cache = get_operation_document_cache(self.api)
+        cache_key = (graphql_type, name, type(self).__name__, tuple(variable_types.items()), output)
+        document = cache.get(cache_key)
+        if document is None:
+            definitions = ", ".join(f"${variable_name}: {variable_type}" for variable_name, variable_type in variable_types.items())
+            arguments = ", ".join(f"{variable_name}: ${variable_name}" for variable_name in variable_types)
+            document = prettify_graphql_payload(f"""
+            {graphql_type.lower()} {f"({definitions})" if definitions else ""} {{
+                {name} {f"({arguments})" if arguments else ""}
+                {output}
+            }}
+            """)
+            # Field arguments of the selection set are inlined, so those documents are never seen twice
+            if not self._selection_has_arguments:
+                cache.put(cache_key, document)
+        return {"query": document, "variables": variables}, self.used_objects
+
     def materialize_output(self,
                            operator_info: dict,
                            output: dict,
@@ -49,6 +97,8 @@ class Materializer:
                            minimal_materialization: bool = False) -> str:
         """Materializes the output. If returns empty string,
            then tries to get at least something, bypassing the max depth until the hard cutoff.
+           Selection sets are memoized per API (see selection_set_cache), so the type tree is only
+           walked again when the selection contains field arguments.
 
         Args:
             operator_info (dict): The operator information
@@ -62,8 +112,17 @@ class Materializer:
         Returns:
             str: The otput selectors
         """
+        selection_set_cache = get_selection_set_cache(self.api)
+        cache_key = selection_set_cache.make_key(output, max_depth, minimal_materialization)
+        cached_selection_set = selection_set_cache.get(cache_key)
+        if cached_selection_set is not None:
+            if cached_selection_set.selectors is not None:
+                return cached_selection_set.selectors
+            # Field arguments depend on the objects bucket, so only skip straight to the depth that worked last time
+            max_depth = cached_selection_set.depth
+
+        self._selection_has_arguments = False
         output_selectors = ""
-        max_depth = max_depth
         while output_selectors == "":
             # The initial call to materialize_output_recursive should not include the name and has no objects used yet
             output_selectors = self.materialize_output_recursive(
@@ -76,10 +135,11 @@ class Materializer:
                 max_depth=max_depth,
                 current_depth=0
             )
-            if max_depth > config.HARD_CUTOFF_DEPTH:
+            if output_selectors != "" or max_depth > config.HARD_CUTOFF_DEPTH:
                 break
             max_depth += 1
         cleaned_output_selectors = clean_output_selectors(output_selectors)
+        selection_set_cache.put(cache_key, CachedSelectionSet(None if self._selection_has_arguments else cleaned_output_selectors, max_depth))
         return cleaned_output_selectors
 
     def materialize_output_recursive(self,
@@ -117,6 +177,7 @@ class Materializer:
 
         # If there are arguments for this, materialize the arguments
         if "inputs" in output_field and len(output_field["inputs"]) != 0:
+            self._selection_has_arguments = True
             inputs = self.materialize_input_fields(operator_info, output_field["inputs"], objects_bucket, max_depth, current_depth)
             if inputs != "":
                 built_str += f"({inputs})"
@@ -250,6 +311,118 @@ class Materializer:
         """
         return self.materialize_input_fields(operator_info, inputs, objects_bucket, max_depth, current_depth=0)
 
+    def materialize_variables(self, operator_info: dict, inputs: dict, objects_bucket: ObjectsBucket, max_depth: int) -> tuple[dict[str, str], dict]:
+        """Materializes the inputs of the payload as variables: the same values as materialize_inputs, built directly as
+           JSON values instead of GraphQL literals
+
+        Args:
+            operator_info (dict): All information about the operator (either all QUERYs or all MUTATIONs) that we want to materialize
+            inputs (dict): The inputs of to be parsed
+            objects_bucket (dict): The dynamically available objects that are currently in circulation
+            max_depth (int): The maximum depth to proceed to when unravelling nested input objects
+
+        Returns:
+            tuple[dict[str, str], dict]: The type of each materialized input, and its value
+        """
+        variable_types, variables = {}, {}
+        if inputs is None or len(inputs) == 0 or type(inputs) is not dict or max_depth <= 0:
+            return variable_types, variables
+
+        for input_name, input_field in inputs.items():
+            value = self.materialize_input_value_recursive(operator_info, input_field, objects_bucket, input_name, True, max_depth, 1)
+            if value is not NO_VALUE:
+                variable_types[input_name] = get_type_string(input_field)
+                variables[input_name] = value
+        return variable_types, variables
+
+    def materialize_input_value_fields(self, operator_info: dict, inputs: dict, objects_bucket: ObjectsBucket, max_depth: int, current_depth: int = 0) -> dict:
+        """Goes through the fields of an input object, as materialize_input_fields does, building their JSON values
+
+        Args:
+            operator_info (dict): All information about the operator (either all QUERYs or all MUTATIONs) that we want to materialize
+            inputs (dict): The inputs of to be parsed
+            objects_bucket (dict): The dynamically available objects that are currently in circulation
+
+        Returns:
+            dict: The value of each materialized field
+        """
+        values: dict = {}
+        if inputs is None or len(inputs) == 0 or type(inputs) is not dict or current_depth >= max_depth:
+            return values
+
+        for input_name, input_field in inputs.items():
+            value = self.materialize_input_value_recursive(operator_info, input_field, objects_bucket, input_name, True, max_depth, current_depth + 1)
+            if value is not NO_VALUE:
+                values[input_name] = value
+        return values
+
+    def materialize_input_value_recursive(self,
+                                          operator_info: dict,
+                                          input_field: dict,
+                                          objects_bucket: ObjectsBucket,
+                                          input_name: str,
+                                          check_deps: bool,
+                                          max_depth: int,
+                                          current_depth: int):
+        """Materializes a single input field as its JSON value, the same way materialize_input_recursive materializes
+           it as a GraphQL literal
+
+        Args:
+            operator_info (dict): All information about the operator (either all QUERYs or all MUTATIONs) that we want to materialize
+            input_field (dict): The field for a mutation (has the)
+            objects_bucket (dict): The dynamically available objects that are currently in circulation
+            input_name (str): The input's name in the overall query (not to be confused with input_field["name"] - which is the field's name in the struct)
+            check_deps (bool): Whether to check the dependencies first or not
+
+        Returns:
+            Any: The JSON value of the materialized input field, or NO_VALUE
+        """
+        hard_dependencies: dict = operator_info.get("hardDependsOn", {})
+        soft_dependencies: dict = operator_info.get("softDependsOn", {})
+
+        if check_deps and input_field["name"] in hard_dependencies:
+            hard_dependency_object_name = hard_dependencies[input_field["name"]]
+            if objects_bucket.is_object_in_bucket(hard_dependency_object_name):
+                randomly_chosen_object_dependency_val = self.getter.get_closest_value_to_input(input_field["name"], hard_dependency_object_name, objects_bucket)
+                self.used_objects[hard_dependency_object_name] = randomly_chosen_object_dependency_val
+                value = str(randomly_chosen_object_dependency_val)
+                return [value] if self._input_has_list_type(input_field) else value
+            if hard_dependency_object_name == "UNKNOWN":
+                self.logger.info(f"Using UNKNOWN input for field: {input_field}")
+            elif self.fail_on_hard_dependency_not_met:
+                raise HardDependencyNotMetException(hard_dependency_object_name)
+            else:
+                self.logger.info("Hard dependency not met -- using random input")
+            return self.materialize_input_value_recursive(operator_info, input_field, objects_bucket, input_name, False, max_depth, current_depth)
+        if check_deps and input_field["name"] in soft_dependencies:
+            soft_depedency_name = soft_dependencies[input_field["name"]]
+            if objects_bucket.is_object_in_bucket(soft_depedency_name):
+                try:
+                    randomly_chosen_dependency_val = self.getter.get_closest_value_to_input(input_field["name"], soft_depedency_name, objects_bucket)
+                except Exception:
+                    randomly_chosen_dependency_val = objects_bucket.get_random_object_field_value(soft_depedency_name, input_field["name"])
+                self.used_objects[soft_depedency_name] = randomly_chosen_dependency_val
+                value = str(randomly_chosen_dependency_val)
+                return [value] if self._input_has_list_type(input_field) else value
+            return self.materialize_input_value_recursive(operator_info, input_field, objects_bucket, input_name, False, max_depth, current_depth)
+        if input_field["kind"] == "NON_NULL":
+            return self.materialize_input_value_recursive(operator_info, input_field["ofType"], objects_bucket, input_name, True, max_depth, current_depth)
+        if input_field["kind"] == "LIST":
+            value = self.materialize_input_value_recursive(operator_info, input_field["ofType"], objects_bucket, input_name, True, max_depth, current_depth)
+            return [] if value is NO_VALUE else [value]
+        if input_field["kind"] == "INPUT_OBJECT":
+            input_object = self.api.input_objects.get(input_field["type"])
+            if input_object is None:
+                return NO_VALUE
+            return self.materialize_input_value_fields(operator_info, input_object["inputFields"], objects_bucket, max_depth, current_depth)
+        if input_field["kind"] == "SCALAR":
+            literal = self.getter.get_random_scalar(input_name, input_field["type"], objects_bucket)
+            return scalar_literal_to_value(literal) if literal else NO_VALUE
+        if input_field["kind"] == "ENUM":
+            enum_values = self.api.enums.get(input_field["type"], {}).get("enumValues", [])
+            return self.getter.get_random_enum_value(enum_values) if enum_values else NO_VALUE
+        return NO_VALUE
+
     def materialize_input_fields(self, operator_info: dict, inputs: dict, objects_bucket: ObjectsBucket, max_depth: int, current_depth: int = 0) -> str:
         """Goes through the inputs of the payload
 
@@ -11,13 +11,14 @@ from graphqler.utils.objects_bucket import ObjectsBucket
 
 
 class RegularPayloadMaterializer(Materializer):
-    def __init__(self, api: API, fail_on_hard_dependency_not_met: bool = True):
+    def __init__(self, api: API, fail_on_hard_dependency_not_met: bool = True, use_variables: bool = False):
         self.getters = Getter()
         self.api = api
         self.fail_on_hard_dependency_not_met = fail_on_hard_dependency_not_met
+        self.use_variables = use_variables  # Send the inputs as variables of a cached operation document
         super().__init__(self.api, self.fail_on_hard_dependency_not_met, max_depth=MAX_OUTPUT_SELECTOR_DEPTH, getter=self.getters)
 
-    def get_payload(self, name: str, objects_bucket: ObjectsBucket, graphql_type: str) -> tuple[str, dict]:
+    def get_payload(self, name: str, objects_bucket: ObjectsBucket, graphql_type: str) -> tuple[str | dict, dict]:
         """Materializes the mutation with parameters filled in
            1. Make sure all dependencies are satisfied (hardDependsOn)
            2. Fill in the inputs ()
@@ -28,9 +29,17 @@ class RegularPayloadMaterializer(Materializer):
             graphql_type (str): The type of the graphql operation (Query or Mutation)
 
         Returns:
-            tuple[str, dict]: The string of the payload, and the used objects list
+            tuple[str | dict, dict]: The string of the payload (or the request body with its variables when
+                                     use_variables is set), and the used objects list
         """
         self.used_objects = {}  # Reset the used_objects list per run (from parent class)
+        if self.use_variables and graphql_type in ("Query", "Mutation"):
+            return self.get_variables_payload(name,
+                                              objects_bucket,
+                                              graphql_type,
+                                              max_input_depth=MAX_INPUT_DEPTH,
+                                              max_output_depth=MAX_OUTPUT_SELECTOR_DEPTH,
+                                              minimal_materialization=True)
         if graphql_type == "Query":
             return self._get_query_payload(name,
                                            objects_bucket,
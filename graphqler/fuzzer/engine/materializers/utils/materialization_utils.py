@@ -1,6 +1,8 @@
 """Utilities used on the output portion of the payload"""
 
 import re
+from typing import Any
+
 from graphql import parse, print_ast
 
 
@@ -87,3 +89,47 @@ def prettify_graphql_payload(payload: str) -> str:
     parsed_query = parse(payload)
     formatted_query = print_ast(parsed_query).strip()
     return formatted_query
+
+
+def get_type_string(field: dict) -> str:
+    """Gets the GraphQL type reference of a compiled input field, for declaring it as a variable
+       IE: NON_NULL > LIST > NON_NULL > SCALAR(ID) -> [ID!]!
+
+    Args:
+        field (dict): The compiled input field (with nested ofTypes)
+
+    Returns:
+        str: The type reference
+    """
+    if field["kind"] == "NON_NULL":
+        return f"{get_type_string(field['ofType'])}!"
+    if field["kind"] == "LIST":
+        return f"[{get_type_string(field['ofType'])}]"
+    return field["type"]
+
+
+def scalar_literal_to_value(literal: str) -> Any:
+    """Converts a scalar literal from a Getter to the JSON value sent in the variables of a request, without parsing
+       it: getters quote values as they are, so a string with a " or a newline isn't a valid GraphQL literal
+       IE: "abc" -> 'abc', "a\\"b" -> 'a"b', 12 -> 12, 1.5 -> 1.5, true -> True, null -> None, {} -> {}
+
+    Args:
+        literal (str): The scalar literal
+
+    Returns:
+        Any: The JSON value
+    """
+    if len(literal) >= 2 and literal[0] == '"' and literal[-1] == '"':
+        return re.sub(r'\\(["\\])', r"\1", literal[1:-1])
+    if literal == "null":
+        return None
+    if literal in ("true", "false"):
+        return literal == "true"
+    if literal == "{}":
+        return {}
+    for number_type in (int, float):
+        try:
+            return number_type(literal)
+        except ValueError:
+            pass
+    return literal
@@ -0,0 +1,47 @@
+"""Schema-level cache of parameterized operation documents
+
+With USE_GRAPHQL_VARIABLES, an operation's arguments are declared as variables and their values are sent in the
+``variables`` field of the request, so the document only depends on the operation, the materializer, the selection
+set and which arguments were materialized. Each document is built and prettified once, then reused by every payload
+of that operation: the server sees the same document again and again and can answer from its parse / validation cache.
+"""
+
+import threading
+import weakref
+
+
+class OperationDocumentCache:
+    """Operation documents of a single API, keyed by operation, materializer, variable definitions and selection set"""
+
+    def __init__(self):
+        self._entries: dict[tuple, str] = {}
+
+    def get(self, key: tuple) -> str | None:
+        return self._entries.get(key)
+
+    def put(self, key: tuple, document: str):
+        self._entries[key] = document
+
+    def clear(self):
+        self._entries.clear()
+
+
+_caches: "weakref.WeakKeyDictionary[object, OperationDocumentCache]" = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def get_operation_document_cache(api: object) -> OperationDocumentCache:
+    """Gets the operation document cache of an API, creating it on first use
+
+    Args:
+        api (API): The API
+
+    Returns:
+        OperationDocumentCache: The cache shared by every materializer of this API
+    """
+    with _caches_lock:
+        cache = _caches.get(api)
+        if cache is None:
+            cache = OperationDocumentCache()
+            _caches[api] = cache
+        return cache
@@ -0,0 +1,79 @@
+"""Schema-level cache of materialized output selection sets
+
+The output selectors of an operation only depend on the schema (the output type, the max depth and whether
+materialization is minimal), except for field arguments, which are materialized from the objects bucket on every
+payload. Selection sets without argument-bearing fields are cached as-is and reused by every materializer built on
+the same API. For selection sets with field arguments only the depth at which a non-empty selection was found is
+cached, so later payloads skip the ``max_depth += 1`` retries but still materialize their arguments.
+"""
+
+import json
+import threading
+import weakref
+from dataclasses import dataclass
+
+from graphqler import config
+
+
+@dataclass(frozen=True)
+class CachedSelectionSet:
+    """A cached selection set
+
+    Attributes:
+        selectors (str | None): The cleaned output selectors, or None if they contain field arguments and must be re-materialized
+        depth (int): The max depth at which the (non-empty) selectors were found
+    """
+
+    selectors: str | None
+    depth: int
+
+
+class SelectionSetCache:
+    """Selection sets of a single API, keyed by output type, max depth and minimal materialization"""
+
+    def __init__(self):
+        self._entries: dict[tuple, CachedSelectionSet] = {}
+
+    @staticmethod
+    def make_key(output: dict, max_depth: int, minimal_materialization: bool) -> tuple:
+        """Builds the cache key of an output selection (config values that change the selection are part of the key)
+
+        Args:
+            output (dict): The output field of the operation
+            max_depth (int): The requested max depth
+            minimal_materialization (bool): Whether only minimal fields are materialized
+
+        Returns:
+            tuple: The cache key
+        """
+        return (json.dumps(output, sort_keys=True, default=str), max_depth, minimal_materialization, config.MAX_OBJECT_CYCLES, config.HARD_CUTOFF_DEPTH)
+
+    def get(self, key: tuple) -> CachedSelectionSet | None:
+        return self._entries.get(key)
+
+    def put(self, key: tuple, entry: CachedSelectionSet):
+        self._entries[key] = entry
+
+    def clear(self):
+        self._entries.clear()
+
+
+_caches: "weakref.WeakKeyDictionary[object, SelectionSetCache]" = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def get_selection_set_cache(api: object) -> SelectionSetCache:
+    """Gets the selection set cache of an API, creating it on first use
+
+    Args:
+        api (API): The API
+
+    Returns:
+        SelectionSetCache: The cache shared by every materializer of this API
+    """
+    with _caches_lock:
+        cache = _caches.get(api)
+        if cache is None:
+            cache = SelectionSetCache()
+            _caches[api] = cache
+        return cache
@@ -6,8 +6,12 @@ rather, it's responsible for modifying the query / mutation to make it work. Sce
   In this scenario, we will need to remove the payer key from the mutation / query output fields
 - When USE_LLM is enabled, any error not handled by the heuristic strategies above is forwarded to the LLM,
   which rewrites the payload to address the server's error message.
+Payloads sent with GraphQL variables (USE_GRAPHQL_VARIABLES) are retried the same way: their document is rewritten, and
+the same variables are sent along with it.
 """
 
+import json
+
 from graphqler import config
 from graphqler.fuzzer.engine.retrier.utils import find_block_end, remove_lines_within_range
 from graphqler.utils import plugins_handler
@@ -48,7 +52,7 @@ class Retrier:
 
         Args:
             url (str): The url of the endpoint
-            payload (str): The payload (either a query or mutation)
+            payload (str | dict | list): The payload (either a query or mutation, or a {"query", "variables"} body)
             gql_response (dict): The GraphQL response containing the error
             retry_count (int): The number of times we've retried
 
@@ -57,7 +61,8 @@ class Retrier:
         """
         error = gql_response["errors"][0]
 
-        if isinstance(payload, dict) or isinstance(payload, list):
+        # Batched bodies aren't retried
+        if isinstance(payload, list) or (isinstance(payload, dict) and not isinstance(payload.get("query"), str)):
             return (gql_response, False)
 
         # If the error doesn't have a message, we can't do anything to fix it
@@ -68,8 +73,10 @@ class Retrier:
             if "locations" not in error:
                 return (gql_response, False)
             locations = error["locations"]
+            query = self._get_query(payload)
             for location in locations:
-                payload = self.get_new_payload_for_retry_non_null(payload, location)
+                query = self.get_new_payload_for_retry_non_null(query, location)
+            payload = self._with_query(payload, query)
             self.logger.debug(f"Retrying with new payload:\n {payload}")
             gql_response, request_response = plugins_handler.get_request_utils().send_graphql_request(url, payload)
             self.logger.info(f"Response: {gql_response}")
@@ -85,12 +92,20 @@ class Retrier:
                 return self._retry_with_llm(url, payload, gql_response, retry_count)
             return (gql_response, False)
 
-    def _retry_with_llm(self, url: str, payload: str, gql_response: dict, retry_count: int) -> tuple[dict, bool]:
+    def _get_query(self, payload: str | dict) -> str:
+        """Gets the document of a payload (the payload itself, or the query of a {"query", "variables"} body)"""
+        return payload["query"] if isinstance(payload, dict) else payload
+
+    def _with_query(self, payload: str | dict, query: str) -> str | dict:
+        """Gets the payload with its document replaced by query (keeping the variables of a {"query", "variables"} body)"""
+        return {**payload, "query": query} if isinstance(payload, dict) else query
+
+    def _retry_with_llm(self, url: str, payload: str | dict, gql_response: dict, retry_count: int) -> tuple[dict, bool]:
         """Uses the LLM to rewrite a failing payload based on the server's error message(s).
 
         Args:
             url (str): The endpoint URL.
-            payload (str): The GraphQL payload that failed.
+            payload (str | dict): The GraphQL payload that failed.
             gql_response (dict): The GraphQL response containing the errors.
             retry_count (int): Current retry depth (used to cap recursion).
 
@@ -102,19 +117,26 @@ class Retrier:
         errors = gql_response.get("errors", [])
         error_summary = "\n".join(f"- {e.get('message', str(e))}" for e in errors)
 
+        variables = payload.get("variables") if isinstance(payload, dict) else None
+        variables_prompt = (
+            f"It was sent with these variables, which will be sent again with the fixed payload "
+            f"(keep its variable definitions):\n```json\n{json.dumps(variables, default=str)}\n```\n\n"
+        ) if variables else ""
         user_prompt = (
             f"The following GraphQL payload was rejected by the server:\n\n"
-            f"```graphql\n{payload}\n```\n\n"
+            f"```graphql\n{self._get_query(payload)}\n```\n\n"
+            f"{variables_prompt}"
             f"Server error(s):\n{error_summary}\n\n"
             f"Return a fixed version of the payload that resolves the error(s)."
         )
 
         try:
             response = call_llm(_LLM_FIX_SYSTEM_PROMPT, user_prompt)
-            fixed_payload = response.get("payload", "").strip()
-            if not fixed_payload:
+            fixed_query = response.get("payload", "").strip()
+            if not fixed_query:
                 self.logger.debug("LLM retry returned an empty payload — giving up.")
                 return (gql_response, False)
+            fixed_payload = self._with_query(payload, fixed_query)
 
             self.logger.debug(f"LLM-fixed payload (attempt {retry_count + 1}):\n{fixed_payload}")
             gql_response, _ = plugins_handler.get_request_utils().send_graphql_request(url, fixed_payload)
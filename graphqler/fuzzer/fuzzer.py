@@ -9,19 +9,23 @@
 
 import logging
 import multiprocessing
+import os
+import signal
 import sys
 import threading
 import time
 
 import typing
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from graphqler import config
-from graphqler.chains import Chain, ChainGenerator, ChainStep
+from graphqler.chains import Chain, ChainGenerator, ChainStep, PrefixTrieNode, build_prefix_trie
 from graphqler.graph import GraphGenerator, Node
 from graphqler.utils.api import API
 from graphqler.utils.logging_utils import Logger
 from graphqler.utils.objects_bucket import ObjectsBucket
+from graphqler.utils.run_context import in_current_context
 from graphqler.utils.stats import Stats
 
 from .engine.fengine import FEngine
@@ -29,9 +33,23 @@ from .engine.dengine import DEngine
 from .engine.types import Result, ResultEnum
 from .engine.types.profile import RuntimeProfile
 from .engine.detectors import IDORChainDetector, UAFChainDetector
+from .chain_scheduler import schedule_chains
+from .checkpoint import Checkpoint, ChainProgress, get_chains_digest, load_checkpoint, save_checkpoint
+from .distributed import is_distributed, shard, write_worker_report
 from .reporters import LLMReporter
 
 
+class _ThreadFilter(logging.Filter):
+    """Logging filter that only accepts records emitted by a single thread."""
+
+    def __init__(self, thread_id: int):
+        super().__init__()
+        self.thread_id = thread_id
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.thread == self.thread_id
+
+
 class Fuzzer(object):
     def __init__(self, save_path: str, url: str, objects_bucket: typing.Optional[ObjectsBucket] = None):
         """Initializes the fuzzer, reading information from the compiled files
@@ -98,14 +116,23 @@ class Fuzzer(object):
         # re-run as standalone in the dep_retry phase after islands.
         self._dep_blocked_nodes: set[Node] = set()
 
-    def run(self):
-        """Main function to run the fuzzer"""
+        # Progress of the current run, saved periodically so an interrupted run can be resumed (set up in __run_fuzz)
+        self._checkpoint: typing.Optional[Checkpoint] = None
+        self._checkpoint_lock = threading.RLock()
+        self._last_checkpoint_time = 0.0
+
+    def run(self, resume: bool = False):
+        """Main function to run the fuzzer
+
+        Args:
+            resume (bool, optional): Continue from the checkpoint of a previous, interrupted run. Defaults to False.
+        """
         queue = multiprocessing.Queue()
         if config.DEBUG:
-            p = threading.Thread(target=self.__run_fuzz, args=(queue,))
+            p = threading.Thread(target=in_current_context(self.__run_fuzz), args=(queue, resume))
             p.daemon = True
         else:
-            p = multiprocessing.Process(target=self.__run_fuzz, args=(queue,))
+            p = multiprocessing.Process(target=self.__run_fuzz, args=(queue, resume))
         p.start()
         p.join(config.MAX_TIME)
 
@@ -141,9 +168,11 @@ class Fuzzer(object):
 
         self.stats.start_time = time.time()
         self.__run_nodes(node)
+        self.dengine.wait_for_background_detections()
         self.logger.info("Completed fuzzing")
         self.stats.print_results()
         self.stats.save()
+        self.stats.save_endpoint_results()
         self.stats.save_eval_summary()
         self.objects_bucket.save()
 
@@ -155,7 +184,7 @@ class Fuzzer(object):
         """
         queue = multiprocessing.Queue()
         if config.DEBUG:
-            p = threading.Thread(target=self.__run_idor_steps, args=(queue,))
+            p = threading.Thread(target=in_current_context(self.__run_idor_steps), args=(queue,))
             p.daemon = True
         else:
             p = multiprocessing.Process(target=self.__run_idor_steps, args=(queue,))
@@ -174,6 +203,7 @@ class Fuzzer(object):
 
     def __run_idor_steps(self, queue: multiprocessing.Queue):
         """Run only IDOR chains (no regular fuzzing, no island nodes, no API-level detections)."""
+        self.__flush_stats_on_terminate()
         self.stats.start_time = time.time()
 
         idor_chains = [c for c in self.chains if c.is_multi_profile]
@@ -188,12 +218,34 @@ class Fuzzer(object):
                 self.__run_chain(chain)
             self.logger.info("Completed IDOR chain phase")
 
+        self.dengine.wait_for_background_detections()
         self.logger.info("Completed IDOR-only run")
         self.stats.print_results()
         self.stats.save()
+        self.stats.save_endpoint_results()
         self.objects_bucket.save()
 
-    def __run_fuzz(self, queue: multiprocessing.Queue):
+    def __flush_stats_on_terminate(self):
+        """Flushes any batched stats when the fuzzer child process is terminated at MAX_TIME.
+
+        Stats are only written every STATS_SAVE_INTERVAL seconds, so without this the updates made
+        since the last flush would be lost when ``run()`` calls ``terminate()`` on the process.
+        Only installed in the child process (signal handlers can't be set from other threads).
+        """
+        if multiprocessing.parent_process() is None or threading.current_thread() is not threading.main_thread():
+            return
+
+        def _flush_and_terminate(signum, _frame):
+            if self._checkpoint is not None:
+                self.__update_checkpoint(force=True)
+            self.stats.flush()
+            self.__report_to_coordinator(finished=False)
+            signal.signal(signum, signal.SIG_DFL)
+            os.kill(os.getpid(), signum)
+
+        signal.signal(signal.SIGTERM, _flush_and_terminate)
+
+    def __run_fuzz(self, queue: multiprocessing.Queue, resume: bool = False):
         """Runs the fuzzer using pre-generated chains. Steps:
         1. Execute all chains up to MAX_FUZZING_ITERATIONS times (or until MAX_TIME)
         2. Run any nodes not covered by chains (island nodes) — once only
@@ -203,40 +255,69 @@ class Fuzzer(object):
         When USE_DEPENDENCY_GRAPH=False (ablation baseline), skip chain ordering entirely
         and run all nodes directly without any dependency guidance.
 
+        As a distributed fuzzing worker (NUM_WORKERS > 1), only this worker's shard of the chains and
+        uncovered nodes is run, and the results are reported to the coordinator in SHARED_DIR.
+
+        Progress is checkpointed every CHECKPOINT_INTERVAL seconds and on every phase change. When resuming,
+        finished phases are skipped and the current one continues from the checkpointed chain / node.
+
         Args:
             queue (multiprocessing.Queue): Queue for communicating back to the parent process
+            resume (bool, optional): Continue from the checkpoint of a previous run. Defaults to False.
         """
+        self.__flush_stats_on_terminate()
+        self.__start_checkpoint(resume)
+        checkpoint = typing.cast(Checkpoint, self._checkpoint)
         self.stats.start_time = time.time()
+        self.__report_to_coordinator(finished=False, exited=False)
 
         # Single background thread that refreshes the progress line for the entire run
         stop_progress = threading.Event()
         def _refresh_progress():
             while not stop_progress.is_set():
                 self.stats.print_running_stats()
+                self.stats.flush_if_due()
                 stop_progress.wait(1.0)
 
-        progress_thread = threading.Thread(target=_refresh_progress, daemon=True)
+        progress_thread = threading.Thread(target=in_current_context(_refresh_progress), daemon=True)
         progress_thread.start()
 
         try:
+            self.__resume_pending_detections()
             if not config.USE_DEPENDENCY_GRAPH:
                 self.logger.info("USE_DEPENDENCY_GRAPH=False: running all nodes directly (ablation mode — no chain ordering)")
                 uncovered_nodes = list(self.dependency_graph.nodes)
             elif self.chains:
                 max_iter = max(1, config.MAX_FUZZING_ITERATIONS)
-                self.stats.chains_total = len(self.chains)
+                worker_chains = shard(self.chains)
+                self.stats.chains_total = len(worker_chains)
                 self.stats.total_iterations = max_iter
-                self.logger.info(f"Running {len(self.chains)} pre-generated chains for up to {max_iter} iteration(s)")
-                for iteration in range(max_iter):
+                if is_distributed():
+                    self.logger.info(f"Worker {config.WORKER_INDEX}/{config.NUM_WORKERS}: running {len(worker_chains)} of {len(self.chains)} chains")
+                self.logger.info(f"Running {len(worker_chains)} pre-generated chains for up to {max_iter} iteration(s)")
+                for iteration in range(checkpoint.iteration, max_iter) if checkpoint.phase == "chains" else []:
                     if time.time() - self.stats.start_time >= config.MAX_TIME:
                         self.logger.info(f"MAX_TIME reached during iteration {iteration + 1} — stopping chain loop early")
                         break
+                    if iteration == checkpoint.iteration and checkpoint.chain_order:
+                        # Resuming this iteration: keep the order it was scheduled in
+                        order = {chain_id: i for i, chain_id in enumerate(checkpoint.chain_order)}
+                        chains = sorted(worker_chains, key=lambda chain: order.get(chain.id, len(order)))
+                        start_index = checkpoint.chain_index
+                    else:
+                        chains = schedule_chains(worker_chains, self.stats, self._dep_blocked_nodes)
+                        start_index = 0
                     self.stats.current_iteration = iteration + 1
-                    self.stats.chains_completed = 0
+                    self.stats.chains_completed = start_index
+                    self.__update_checkpoint(force=True, iteration=iteration, chain_order=[chain.id for chain in chains], chain_index=start_index)
                     self.logger.info(f"Chain iteration {iteration + 1}/{max_iter}")
-                    for chain in self.chains:
-                        self.__run_chain(chain)
-                        self.stats.chains_completed += 1
+                    if start_index > 0:
+                        self.logger.info(f"Resuming iteration {iteration + 1} at chain {start_index}/{len(chains)}")
+                    progress = ChainProgress(chains, start_index)
+                    self.__run_chains(
+                        chains[start_index:],
+                        on_chain_completed=lambda chain, progress=progress: self.__update_checkpoint(chain_index=progress.complete(chain)),
+                    )
                 self.logger.info("Completed all chain iterations")
 
                 chained_nodes: set[Node] = {node for chain in self.chains for node in chain.nodes}
@@ -255,17 +336,20 @@ class Fuzzer(object):
                 all_chain_primary_nodes: set[Node] = {step.node for chain in self.chains for step in chain.steps if step.profile_name == "primary"}
                 inner_only_nodes = all_chain_primary_nodes - last_primary_nodes
                 already_queued = set(uncovered_nodes)
-                uncovered_nodes.extend(node for node in inner_only_nodes if node not in already_queued)
+                # Sorted so every distributed worker queues them in the same order (sets of nodes aren't ordered)
+                uncovered_nodes.extend(sorted((node for node in inner_only_nodes if node not in already_queued), key=lambda node: (node.graphql_type, node.name)))
             else:
                 self.logger.warning("No chains found — falling back to running all nodes directly")
                 uncovered_nodes = list(self.dependency_graph.nodes)
+            uncovered_nodes = shard(uncovered_nodes)
 
-            if uncovered_nodes:
-                self.logger.info(f"Running {len(uncovered_nodes)} uncovered node(s)")
-                self.stats.phase = "islands"
+            if uncovered_nodes and self.__is_phase_pending("islands"):
+                remaining_nodes = self.__enter_checkpoint_phase("islands", uncovered_nodes)
+                self.logger.info(f"Running {len(remaining_nodes)} uncovered node(s)")
+                self.stats.set_phase("islands")
                 self.stats.islands_total = len(uncovered_nodes)
-                self.stats.islands_completed = 0
-                self.__run_nodes(uncovered_nodes)
+                self.stats.islands_completed = len(uncovered_nodes) - len(remaining_nodes)
+                self.__run_nodes(remaining_nodes, on_node_completed=self.__complete_checkpoint_node)
 
             # Dep-retry phase: re-run nodes that failed every chain attempt due to unmet hard
             # dependencies, now using the globally shared objects_bucket (populated by islands
@@ -275,12 +359,14 @@ class Fuzzer(object):
                 node for node in self._dep_blocked_nodes
                 if f"{node.graphql_type}|{node.name}" not in self.stats.successful_nodes
             ]
-            if dep_retry_nodes:
-                self.logger.info(f"Dep-retry phase: retrying {len(dep_retry_nodes)} node(s) that always had unmet hard dependencies")
-                self.stats.phase = "dep_retry"
-                self.stats.dep_retry_total = len(dep_retry_nodes)
-                self.stats.dep_retry_completed = 0
-                for node in dep_retry_nodes:
+            # When resuming this phase, the nodes to retry are the ones checkpointed when it started
+            if self.__is_phase_pending("dep_retry") and (dep_retry_nodes or checkpoint.phase == "dep_retry"):
+                remaining_nodes = self.__enter_checkpoint_phase("dep_retry", dep_retry_nodes)
+                self.logger.info(f"Dep-retry phase: retrying {len(remaining_nodes)} node(s) that always had unmet hard dependencies")
+                self.stats.set_phase("dep_retry")
+                self.stats.dep_retry_total = len(checkpoint.phase_nodes)
+                self.stats.dep_retry_completed = checkpoint.node_index
+                for node in remaining_nodes:
                     self.logger.info(f"[dep_retry] Running node: {node}")
                     node_start = time.time()
                     _response, result = self.fengine.run_minimal_payload(node.name, self.objects_bucket, node.graphql_type, check_hard_depends_on=False)
@@ -289,17 +375,26 @@ class Fuzzer(object):
                     self.fengine.run_maximal_payload(node.name, self.objects_bucket, node.graphql_type, check_hard_depends_on=False)
                     self.__detect_vulnerabilities_on_node(node, self.objects_bucket)
                     self.stats.dep_retry_completed += 1
+                    self.__complete_checkpoint_node()
+
+            # Node detections still running in the background (e.g. time-based SQLi) finish before the API-level ones
+            self.dengine.wait_for_background_detections()
 
             # Detections
-            self.stats.phase = "detections"
-            if not (config.SKIP_INJECTION_ATTACKS and config.SKIP_MISC_ATTACKS and config.SKIP_DOS_ATTACKS and config.SKIP_ENUMERATION_ATTACKS):
-                self.dengine.run_detections_on_api()
-                self.logger.info("Completed running detections on the overall API")
-
-            # LLM report (opt-in via config.LLM_ENABLE_REPORTER)
-            if config.LLM_ENABLE_REPORTER:
-                LLMReporter(self.save_path, self.url).generate()
+            if self.__is_phase_pending("detections"):
+                self.__enter_checkpoint_phase("detections", [])
+                self.stats.set_phase("detections")
+                # With distributed workers, only the first one runs the API-level detections
+                if config.WORKER_INDEX == 0 and not (config.SKIP_INJECTION_ATTACKS and config.SKIP_MISC_ATTACKS and config.SKIP_DOS_ATTACKS and config.SKIP_ENUMERATION_ATTACKS):
+                    self.dengine.run_detections_on_api()
+                    self.logger.info("Completed running detections on the overall API")
+
+                # LLM report (opt-in via config.LLM_ENABLE_REPORTER)
+                if config.LLM_ENABLE_REPORTER:
+                    LLMReporter(self.save_path, self.url).generate()
+            self.__enter_checkpoint_phase("done", [])
         finally:
+            self.dengine.wait_for_background_detections()
             stop_progress.set()
             progress_thread.join()
             if sys.stdout.isatty():
@@ -310,10 +405,294 @@ class Fuzzer(object):
         self.logger.info(f"Objects bucket: {self.objects_bucket}")
         self.stats.print_results()
         self.stats.save()
+        self.stats.save_endpoint_results()
         self.stats.save_eval_summary()
         self.objects_bucket.save()
+        self.__report_to_coordinator(finished=True)
+
+    def __report_to_coordinator(self, finished: bool, exited: bool = True):
+        """Writes this worker's results to SHARED_DIR for the coordinator to merge, when fuzzing as a distributed worker
+
+        Args:
+            finished (bool): Whether this worker finished its shard (False when it was stopped at MAX_TIME)
+            exited (bool, optional): Whether this is the worker's final report (False for the one written at the start,
+                                     which tells the coordinator to keep waiting for it). Defaults to True.
+        """
+        if not is_distributed() or config.SHARED_DIR is None or self._checkpoint is None:
+            return
+        try:
+            write_worker_report(self.stats, self._checkpoint.chains_digest, finished, exited=exited)
+        except Exception as e:
+            self.logger.warning(f"Failed to write the worker report to {config.SHARED_DIR}: {e}")
+
+    def __start_checkpoint(self, resume: bool):
+        """Starts the checkpoint of this run. When resuming, restores the state saved in the previous run's checkpoint
+        (progress, dep-blocked nodes, detections already run, objects bucket and stats), unless it was taken with
+        different chains.
+
+        Args:
+            resume (bool): Whether to continue from the previous run's checkpoint
+        """
+        chains_digest = get_chains_digest(self.chains)
+        self._checkpoint = Checkpoint(chains_digest=chains_digest)
+        self._last_checkpoint_time = time.time()
+        if not resume:
+            return
+
+        checkpoint = load_checkpoint()
+        if checkpoint is None:
+            print("(F) No checkpoint to resume from — starting a new run")
+            self.logger.warning("No checkpoint to resume from — starting a new run")
+            return
+        if checkpoint.chains_digest != chains_digest:
+            print("(F) The chains changed since the checkpoint was saved — starting a new run")
+            self.logger.warning("The chains changed since the checkpoint was saved — starting a new run")
+            return
+
+        self._checkpoint = checkpoint
+        nodes_by_key = {(node.graphql_type, node.name): node for node in self.dependency_graph.nodes}
+        self._dep_blocked_nodes = {nodes_by_key[key] for key in checkpoint.dep_blocked_nodes if key in nodes_by_key}
+        self.dengine.nodes_ran = checkpoint.nodes_ran
+        if checkpoint.objects_bucket is not None:
+            self.objects_bucket.__dict__.update(checkpoint.objects_bucket.__dict__)
+            self.objects_bucket.api = self.api
+        if checkpoint.stats is not None:
+            self.stats.restore(checkpoint.stats)
+
+        if checkpoint.phase == "done":
+            message = "The checkpointed run already completed — only writing its results"
+        elif checkpoint.phase == "chains":
+            message = f"Resuming from checkpoint: phase chains, iteration {checkpoint.iteration + 1}, chain {checkpoint.chain_index}"
+        else:
+            message = f"Resuming from checkpoint: phase {checkpoint.phase}, node {checkpoint.node_index}/{len(checkpoint.phase_nodes)}"
+        print(f"(F) {message}")
+        self.logger.info(message)
+
+    def __resume_pending_detections(self):
+        """Runs the detections that were still running (e.g. in the background) when the checkpoint was taken again:
+        the checkpoint's progress may already be past their nodes, so resuming the phase wouldn't run them
+        """
+        checkpoint = typing.cast(Checkpoint, self._checkpoint)
+        nodes_by_name = {node.name: node for node in self.dependency_graph.nodes if node.graphql_type in ("Query", "Mutation")}
+        for node_name, detection_name in checkpoint.pending_detections:
+            node = nodes_by_name.get(node_name)
+            if node is None:
+                continue
+            self.logger.info(f"Running detection {detection_name} on {node_name} again (it hadn't finished when the checkpoint was taken)")
+            self.dengine.run_detection_on_graphql_object(node, self.objects_bucket, node.graphql_type, detection_name)
+
+    def __is_phase_pending(self, phase: str) -> bool:
+        """Returns whether the phase still has to run, i.e. the checkpoint isn't past it
+
+        Args:
+            phase (str): The phase
+
+        Returns:
+            bool: True if the phase hasn't completed yet
+        """
+        phases = ["chains", "islands", "dep_retry", "detections", "done"]
+        return phases.index(typing.cast(Checkpoint, self._checkpoint).phase) <= phases.index(phase)
+
+    def __enter_checkpoint_phase(self, phase: str, nodes: list[Node]) -> list[Node]:
+        """Moves the checkpoint to a phase and saves it. If the checkpoint is already in that phase (the run is
+        resuming it), the phase continues with the nodes it hasn't run yet instead.
 
-    def __run_chain(self, chain: Chain):
+        Args:
+            phase (str): The phase
+            nodes (list[Node]): The nodes the phase runs, in order
+
+        Returns:
+            list[Node]: The nodes left to run
+        """
+        checkpoint = typing.cast(Checkpoint, self._checkpoint)
+        if checkpoint.phase == phase:
+            nodes_by_key = {(node.graphql_type, node.name): node for node in self.dependency_graph.nodes}
+            return [nodes_by_key[key] for key in checkpoint.phase_nodes[checkpoint.node_index:] if key in nodes_by_key]
+        self.__update_checkpoint(force=True, phase=phase, phase_nodes=[(node.graphql_type, node.name) for node in nodes], node_index=0)
+        return nodes
+
+    def __complete_checkpoint_node(self):
+        """Records that the next node of the current islands / dep_retry phase has run"""
+        checkpoint = typing.cast(Checkpoint, self._checkpoint)
+        self.__update_checkpoint(node_index=checkpoint.node_index + 1)
+
+    def __update_checkpoint(self, force: bool = False, **progress):
+        """Updates the checkpoint's progress, saving it if CHECKPOINT_INTERVAL seconds passed since the last save
+
+        Safe to call from chain worker threads.
+
+        Args:
+            force (bool, optional): Save the checkpoint regardless of the interval. Defaults to False.
+            **progress: Checkpoint fields to update
+        """
+        with self._checkpoint_lock:
+            checkpoint = typing.cast(Checkpoint, self._checkpoint)
+            for name, value in progress.items():
+                setattr(checkpoint, name, value)
+            if config.CHECKPOINT_INTERVAL <= 0:
+                return
+            if not force and time.time() - self._last_checkpoint_time < config.CHECKPOINT_INTERVAL:
+                return
+
+            checkpoint.dep_blocked_nodes = [(node.graphql_type, node.name) for node in self._dep_blocked_nodes.copy()]
+            # Running detections first: one finishing in between is then in both, rather than in neither
+            checkpoint.pending_detections = self.dengine.get_running_detections()
+            checkpoint.nodes_ran = self.dengine.get_nodes_ran()
+            checkpoint.objects_bucket = self.objects_bucket
+            checkpoint.stats = self.stats.snapshot()
+            try:
+                save_checkpoint(checkpoint)
+            except OSError as e:
+                self.logger.warning(f"Failed to save the checkpoint: {e}")
+            self._last_checkpoint_time = time.time()
+
+    def __run_chains(self, chains: list[Chain], on_chain_completed: typing.Optional[typing.Callable[[Chain], None]] = None):
+        """Executes the chains, running up to MAX_CONCURRENT_CHAINS of them in parallel.
+
+        Chains are independent by design (each one gets its own fresh ObjectsBucket), so
+        they can safely be spread over a thread pool.  With MAX_CONCURRENT_CHAINS <= 1 the
+        chains are run sequentially in file order.
+
+        Args:
+            chains (list[Chain]): The chains to execute.
+            on_chain_completed (Callable[[Chain], None], optional): Called with each chain once it has completed.
+        """
+        if config.SHARE_CHAIN_PREFIXES:
+            self.__run_chains_with_shared_prefixes(chains, on_chain_completed)
+            return
+
+        max_workers = max(1, config.MAX_CONCURRENT_CHAINS)
+        if max_workers == 1 or len(chains) <= 1:
+            for chain in chains:
+                self.__run_chain(chain)
+                self.stats.chains_completed += 1
+                if on_chain_completed:
+                    on_chain_completed(chain)
+            return
+
+        self.logger.info(f"Running {len(chains)} chain(s) with up to {max_workers} concurrent worker(s)")
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="chain") as executor:
+            run_chain = in_current_context(self.__run_chain)
+            futures = {executor.submit(run_chain, chain): chain for chain in chains}
+            for future in as_completed(futures):
+                future.result()
+                self.stats.chains_completed += 1
+                if on_chain_completed:
+                    on_chain_completed(futures[future])
+
+    def __run_chains_with_shared_prefixes(self, chains: list[Chain], on_chain_completed: typing.Optional[typing.Callable[[Chain], None]] = None):
+        """Executes the chains through a prefix trie (SHARE_CHAIN_PREFIXES): the shareable leading steps
+        common to several chains are run once, and the bucket is forked (copy-on-write clone) at every
+        branch point so each chain continues its own remaining steps from the state its prefix produced.
+
+        Subtrees of the trie's root are independent, so they are spread over up to MAX_CONCURRENT_CHAINS threads.
+
+        Args:
+            chains (list[Chain]): The chains to execute.
+            on_chain_completed (Callable[[Chain], None], optional): Called with each chain once it has completed.
+        """
+        root = build_prefix_trie(chains, [self._shareable_prefix_length(chain) for chain in chains])
+        self.logger.info(f"Running {len(chains)} chain(s) through a prefix trie with {len(root.children)} root branch(es)")
+
+        def _complete_chain(chain: Chain):
+            self.stats.add_completed_chain()
+            if on_chain_completed:
+                on_chain_completed(chain)
+
+        def _run_unshared_chain(chain: Chain):
+            self.__run_chain(chain)
+            _complete_chain(chain)
+
+        # Chains without a shareable prefix hang off the root and start from an empty bucket
+        units: list[typing.Callable[[], None]] = [lambda chain=chain: _run_unshared_chain(chain) for chain in root.chains]
+        units += [lambda child=child: self.__run_prefix_trie_node(child, self.__new_chain_bucket(), [], _complete_chain) for child in root.children.values()]
+
+        max_workers = max(1, config.MAX_CONCURRENT_CHAINS)
+        if max_workers == 1 or len(units) <= 1:
+            for unit in units:
+                unit()
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="chain") as executor:
+            futures = [executor.submit(in_current_context(unit)) for unit in units]
+            for future in as_completed(futures):
+                future.result()
+
+    def __run_prefix_trie_node(self, trie_node: PrefixTrieNode, bucket: ObjectsBucket, results: list[tuple[ChainStep, Result]],
+                               on_chain_completed: typing.Callable[[Chain], None]):
+        """Runs the shared step of a trie node once, then every chain that continues from this node and every child subtree
+
+        Args:
+            trie_node (PrefixTrieNode): The trie node (not the root)
+            bucket (ObjectsBucket): The bucket holding the state produced by the prefix leading to this node; owned by this call
+            results (list[tuple[ChainStep, Result]]): The results of the prefix leading to this node
+            on_chain_completed (Callable[[Chain], None]): Called with each chain once it has completed
+        """
+        step = typing.cast(ChainStep, trie_node.step)
+        node = step.node
+        if node.name not in config.SKIP_NODES:
+            self.logger.info(f"[chain-prefix] Running shared node ({trie_node.num_chains()} chain(s)): {node}")
+            node_start = time.time()
+            _next_paths, result = self.__evaluate(node, [node], objects_bucket=bucket)
+            self.stats.record_node_timing(node, time.time() - node_start)
+            self.stats.update_stats_from_result(node, result)
+            if result.result_enum == ResultEnum.HARD_DEPENDENCY_NOT_MET:
+                self._dep_blocked_nodes.add(node)
+            results = results + [(step, result)]
+
+            if not result.success:
+                self.logger.info(f"[chain-prefix] Node {node} failed — stopping every chain sharing this prefix")
+                for chain in trie_node.iter_chains():
+                    for future_step in chain.steps[trie_node.depth:]:
+                        if future_step.profile_name == "primary" and future_step.node.graphql_type != "Object":
+                            self._dep_blocked_nodes.add(future_step.node)
+                    # Nothing is left to execute, but the chain is still logged and analysed like any other
+                    self.__run_chain(chain, objects_bucket=bucket, prefix_results=results, start_index=len(chain.steps))
+                    on_chain_completed(chain)
+                return
+
+        # Every consumer of this node's state gets its own fork, except the last one which takes the bucket itself
+        consumers: list[typing.Callable[[ObjectsBucket], None]] = [
+            lambda forked_bucket, chain=chain: self.__run_chain(chain, objects_bucket=forked_bucket, prefix_results=results, start_index=trie_node.depth)
+            for chain in trie_node.chains
+        ]
+        consumers += [lambda forked_bucket, child=child: self.__run_prefix_trie_node(child, forked_bucket, results, on_chain_completed)
+                      for child in trie_node.children.values()]
+        for i, consumer in enumerate(consumers):
+            consumer(bucket if i == len(consumers) - 1 else bucket.clone())
+            if i < len(trie_node.chains):
+                on_chain_completed(trie_node.chains[i])
+
+    @staticmethod
+    def _shareable_prefix_length(chain: Chain) -> int:
+        """Returns how many leading steps of the chain can be shared with other chains: primary setup steps
+        that run the same way regardless of the rest of the chain.  This excludes the last primary step
+        (which is also fuzzed and checked for vulnerabilities), any step after a non-primary one, and a step
+        right before a post_delete step (the bucket is snapshotted before it).
+
+        Args:
+            chain (Chain): The chain
+
+        Returns:
+            int: The number of shareable leading steps
+        """
+        primary_indices = [i for i, s in enumerate(chain.steps) if s.profile_name == "primary"]
+        last_primary_index = primary_indices[-1] if primary_indices else -1
+        length = 0
+        for i, step in enumerate(chain.steps):
+            next_step = chain.steps[i + 1] if i + 1 < len(chain.steps) else None
+            if step.profile_name != "primary" or i >= last_primary_index or (next_step is not None and next_step.profile_name == "post_delete"):
+                break
+            length += 1
+        return length
+
+    def __new_chain_bucket(self) -> ObjectsBucket:
+        """Creates a fresh, isolated ObjectsBucket (bypassing the singleton) for a chain"""
+        bucket_cls = typing.cast(typing.Any, getattr(ObjectsBucket, "__wrapped__", ObjectsBucket))
+        return bucket_cls(self.api)
+
+    def __run_chain(self, chain: Chain, objects_bucket: typing.Optional[ObjectsBucket] = None,
+                    prefix_results: typing.Optional[list[tuple[ChainStep, Result]]] = None, start_index: int = 0):
         """Executes every step in the chain sequentially using a fresh, isolated ObjectsBucket.
 
         Each chain is fully self-sufficient, so its bucket starts completely empty.
@@ -326,10 +705,13 @@ class Fuzzer(object):
 
         Args:
             chain (Chain): The chain to execute.
+            objects_bucket (ObjectsBucket, optional): The bucket to continue from when the first *start_index*
+                steps were already run as a shared prefix. Defaults to a fresh, empty bucket.
+            prefix_results (list[tuple[ChainStep, Result]], optional): The results of the shared prefix steps.
+            start_index (int, optional): The index of the first step to execute. Defaults to 0.
         """
-        bucket_cls = typing.cast(typing.Any, getattr(ObjectsBucket, "__wrapped__", ObjectsBucket))
-        fresh_bucket: ObjectsBucket = bucket_cls(self.api)
-        results: list[tuple[ChainStep, Result]] = []
+        fresh_bucket: ObjectsBucket = objects_bucket if objects_bucket is not None else self.__new_chain_bucket()
+        results: list[tuple[ChainStep, Result]] = list(prefix_results or [])
         pre_delete_snapshot: typing.Optional[ObjectsBucket] = None
 
         # Index of the last primary step — fuzz/detect runs only on this step so that
@@ -361,16 +743,23 @@ class Fuzzer(object):
         chain_file_handler = logging.FileHandler(chain_log_path)
         formatter = logging.Formatter("[%(levelname)s][%(asctime)s][%(name)s]:%(message)s", datefmt="%Y-%m-%d %H:%M:%S")
         chain_file_handler.setFormatter(formatter)
+        # Only keep records emitted by the thread running this chain, so concurrently
+        # executing chains don't write into each other's fuzzer.log.
+        chain_file_handler.addFilter(_ThreadFilter(threading.get_ident()))
         fuzzer_logger = logging.getLogger("fuzzer")
         fuzzer_logger.addHandler(chain_file_handler)
 
         # Log the chain header as the first entry in the chain's fuzzer.log
         self.logger.info(f"=== Chain start: {chain_path_str} ===")
         self.logger.info(f"Running chain: {chain}")
+        if start_index > 0:
+            self.logger.info(f"Reusing {min(start_index, len(chain.steps))} step(s) already run as a shared prefix")
         try:
             if self.on_chain_start:
                 self.on_chain_start(chain)
             for i, step in enumerate(chain.steps):
+                if i < start_index:
+                    continue
                 node = step.node
                 if node.name in config.SKIP_NODES:
                     continue
@@ -465,11 +854,12 @@ class Fuzzer(object):
             fuzzer_logger.removeHandler(chain_file_handler)
             chain_file_handler.close()
 
-    def __run_nodes(self, nodes: list[Node]):
+    def __run_nodes(self, nodes: list[Node], on_node_completed: typing.Optional[typing.Callable[[], None]] = None):
         """Runs the nodes given in the list
 
         Args:
             nodes (list[Node]): List of nodes to run
+            on_node_completed (Callable[[], None], optional): Called after each node has run
 
         Raises:
             Exception: If the GraphQL type of the node is unknown
@@ -485,6 +875,8 @@ class Fuzzer(object):
             self.__fuzz(node, [node])
             self.__detect_vulnerabilities_on_node(node, self.objects_bucket)
             self.stats.islands_completed += 1
+            if on_node_completed:
+                on_node_completed()
 
     def __evaluate(self, node: Node, visit_path: list[Node], objects_bucket: typing.Optional[ObjectsBucket] = None) -> tuple[list[list[Node]], Result]:
         """Evaluates the node
@@ -5,17 +5,27 @@ The linker does the following:
 - Attach queries to the object node
 - Attach mutations related to the object node
 
+The graph is saved to compiled/dependency_graph.pkl along with a hash of the compiled YAML files it was built from
+(and a checksum of the pickle itself), so later runs reload it instead of rebuilding it as long as the compiled
+files haven't changed.
+
 !Note!: We decide to not link object-objects together here as it is not relevant for graph traversal
 """
 
+import hashlib
+import json
+import pickle
 from pathlib import Path
-from graphqler.utils.file_utils import read_yaml_to_dict
+from graphqler.utils.compiled_cache import read_compiled_yaml
 from graphqler import config
 from .node import Node
 from .utils import draw_graph
 
 import networkx
 
+# Bump when the graph / Node layout changes so older pickles are rebuilt
+DEPENDENCY_GRAPH_FORMAT_VERSION = 1
+
 
 class GraphGenerator:
     def __init__(self, save_path: str):
@@ -25,23 +35,83 @@ class GraphGenerator:
         self.compiled_mutations_save_path = Path(save_path) / config.COMPILED_MUTATIONS_FILE_NAME
         self.compiled_subscriptions_save_path = Path(save_path) / config.COMPILED_SUBSCRIPTIONS_FILE_NAME
         self.dependency_graph_visualization_save_path = Path(save_path) / config.GRAPH_VISUALIZATION_OUTPUT
+        self.dependency_graph_save_path = Path(save_path) / config.DEPENDENCY_GRAPH_FILE_NAME
 
-        self.compiled_queries = read_yaml_to_dict(self.compiled_queries_save_path)
-        self.compiled_objects = read_yaml_to_dict(self.compiled_objects_save_path)
-        self.compiled_mutations = read_yaml_to_dict(self.compiled_mutations_save_path)
-        self.compiled_subscriptions = read_yaml_to_dict(self.compiled_subscriptions_save_path)
+        self.compiled_queries = read_compiled_yaml(self.compiled_queries_save_path)
+        self.compiled_objects = read_compiled_yaml(self.compiled_objects_save_path)
+        self.compiled_mutations = read_compiled_yaml(self.compiled_mutations_save_path)
+        self.compiled_subscriptions = read_compiled_yaml(self.compiled_subscriptions_save_path)
 
         self.dependency_graph = networkx.DiGraph()
 
     def get_dependency_graph(self) -> networkx.DiGraph:
-        """Runs the graph generator and returns the graph
+        """Returns the dependency graph, reloading the saved graph if it was built from the current compiled files,
+           otherwise running the graph generator and saving the result
 
         Returns:
             networkx.DiGraph: The directed graph
         """
+        saved_graph = self.load_dependency_graph()
+        if saved_graph is not None:
+            self.dependency_graph = saved_graph
+            return self.dependency_graph
+
         self.run()
+        self.save_dependency_graph()
         return self.dependency_graph
 
+    def get_sources_digest(self) -> str:
+        """Hashes everything the graph is built from: the compiled YAML files and the config that changes the graph
+
+        Returns:
+            str: The hex digest
+        """
+        digest = hashlib.sha256()
+        for source_path in (self.compiled_queries_save_path, self.compiled_objects_save_path, self.compiled_mutations_save_path, self.compiled_subscriptions_save_path):
+            digest.update(source_path.read_bytes() if source_path.exists() else b"")
+            digest.update(b"\0")
+        digest.update(json.dumps({"version": DEPENDENCY_GRAPH_FORMAT_VERSION, "skip_subscriptions": config.SKIP_SUBSCRIPTIONS}).encode())
+        return digest.hexdigest()
+
+    def save_dependency_graph(self):
+        """Saves the dependency graph as a pickle, prefixed with a header line holding the sources digest and the pickle's checksum.
+           Saving is best-effort: the graph can always be rebuilt from the compiled files
+        """
+        payload = pickle.dumps(self.dependency_graph, protocol=pickle.HIGHEST_PROTOCOL)
+        header = {"sources": self.get_sources_digest(), "sha256": hashlib.sha256(payload).hexdigest()}
+        try:
+            self.dependency_graph_save_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.dependency_graph_save_path.with_name(f"{self.dependency_graph_save_path.name}.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(json.dumps(header).encode() + b"\n")
+                f.write(payload)
+            tmp_path.replace(self.dependency_graph_save_path)
+        except OSError:
+            pass
+
+    def load_dependency_graph(self) -> networkx.DiGraph | None:
+        """Loads the saved dependency graph if it passes the integrity checks: it must have been built from the current
+           compiled files, and the pickle must match its checksum
+
+        Returns:
+            networkx.DiGraph | None: The graph, or None if there is no valid saved graph
+        """
+        try:
+            with open(self.dependency_graph_save_path, "rb") as f:
+                header = json.loads(f.readline())
+                payload = f.read()
+        except (OSError, ValueError):
+            return None
+        if not isinstance(header, dict) or header.get("sources") != self.get_sources_digest():
+            return None
+        if header.get("sha256") != hashlib.sha256(payload).hexdigest():
+            return None
+        try:
+            graph = pickle.loads(payload)
+        except Exception:
+            return None
+        return graph if isinstance(graph, networkx.DiGraph) else None
+
     def draw_dependency_graph(self):
         """Draws the dependency graph based on the GRAPH_VISUALIZATION_OUTPUT constant"""
         draw_graph(self.dependency_graph, self.dependency_graph_visualization_save_path)
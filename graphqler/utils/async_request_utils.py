@@ -0,0 +1,292 @@
+"""Asyncio-based HTTP transport -- an alternative to ``request_utils`` for high request concurrency.
+
+``request_utils`` uses one blocking ``requests.Session`` and a module-level throttle, so every request in the
+process is serialised.  This module implements the same ``RequestUtilsProtocol`` on top of a single pooled
+``httpx.AsyncClient`` that lives on a background event loop:
+
+- the connection pool is bounded by ``config.ASYNC_MAX_CONNECTIONS``
+- in-flight requests per host are bounded by ``config.ASYNC_MAX_CONNECTIONS_PER_HOST``
+- ``config.TIME_BETWEEN_REQUESTS`` is enforced by an async throttle on request start times
+
+The synchronous functions (``send_graphql_request`` and friends) block the calling thread only, so FEngine,
+DEngine and the Retrier can use this module unchanged (select it with ``REQUEST_TRANSPORT = "async"``) while
+many threads share the same pool.  Code that wants many requests in flight at once can use
+``send_graphql_requests_concurrently`` or await the ``async_*`` coroutines via ``run_coroutine``.
+"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import os
+import threading
+import time
+from typing import Any, Awaitable, Callable, TypeVar
+from urllib.parse import urlsplit
+
+import httpx
+
+from graphqler import config
+from graphqler.utils.request_utils import get_headers, get_headers_with_overrides, get_persisted_query_body, get_persisted_query_fallback, get_proxies, parse_response
+
+_T = TypeVar("_T")
+
+# The last time a request was started so that we can wait between requests
+last_request_time = time.time()
+session: httpx.AsyncClient | None = None
+
+# Background event loop that owns the client and all asyncio primitives below
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_thread: threading.Thread | None = None
+_loop_lock = threading.Lock()
+
+# Only touched from the event loop thread
+_session_proxy: str | None = None
+_throttle_lock: asyncio.Lock | None = None
+_host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+
+def _reset_module_state() -> None:
+    """Forget the loop, client and asyncio primitives (they belong to a loop that may no longer be running)."""
+    global _loop, _loop_thread, session, _session_proxy, _throttle_lock, _host_semaphores, last_request_time
+    _loop = None
+    _loop_thread = None
+    session = None
+    _session_proxy = None
+    _throttle_lock = None
+    _host_semaphores = {}
+    last_request_time = time.time()
+
+
+# The fuzzer runs in a forked child process; the loop thread does not survive the fork
+os.register_at_fork(after_in_child=_reset_module_state)
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Gets the background event loop, starting it on first use
+
+    Returns:
+        asyncio.AbstractEventLoop: The running background event loop
+    """
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None or _loop_thread is None or not _loop_thread.is_alive():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="graphqler-async-transport", daemon=True)
+            thread.start()
+            _loop, _loop_thread = loop, thread
+        return _loop
+
+
+def run_coroutine(coro: Awaitable[_T]) -> _T:
+    """Runs a coroutine on the transport's event loop and blocks the calling thread until it finishes
+
+    Args:
+        coro (Awaitable[_T]): The coroutine to run
+
+    Returns:
+        _T: The coroutine's result
+    """
+    loop = _get_loop()
+    if threading.current_thread() is _loop_thread:
+        if asyncio.iscoroutine(coro):
+            coro.close()
+        raise RuntimeError("run_coroutine() cannot be called from the transport's event loop; await the coroutine instead")
+    # Like asyncio.run_coroutine_threadsafe, but the task runs in the caller's context (see RunContext) rather than
+    # the loop thread's, so the config it reads (headers, timeouts, ...) is the caller's run's
+    future: concurrent.futures.Future = concurrent.futures.Future()
+
+    def _start():
+        task = asyncio.ensure_future(coro)
+        task.add_done_callback(lambda done: _copy_task_outcome(done, future))
+
+    loop.call_soon_threadsafe(_start, context=contextvars.copy_context())
+    return future.result()
+
+
+def _copy_task_outcome(task: asyncio.Future, future: concurrent.futures.Future) -> None:
+    """Copies the outcome of a finished task to the future its caller is waiting on"""
+    if task.cancelled():
+        future.cancel()
+    elif task.exception() is not None:
+        future.set_exception(task.exception())
+    else:
+        future.set_result(task.result())
+
+
+def reset_session() -> None:
+    """Close the pooled client so new config (proxy, pool limits) takes effect on the next request."""
+    global session, last_request_time
+    client = session
+    session = None
+    last_request_time = time.time()
+    if client is not None and _loop is not None and _loop.is_running():
+        asyncio.run_coroutine_threadsafe(client.aclose(), _loop)
+
+
+def create_new_session() -> httpx.AsyncClient:
+    """Create a new pooled async client.
+       Headers are not bound to the client; they're computed per request so auth changes apply immediately.
+
+    Returns:
+        httpx.AsyncClient: The client
+    """
+    limits = httpx.Limits(
+        max_connections=config.ASYNC_MAX_CONNECTIONS,
+        max_keepalive_connections=config.ASYNC_MAX_CONNECTIONS,
+    )
+    if config.PROXY:
+        return httpx.AsyncClient(limits=limits, proxy=config.PROXY, verify=False, follow_redirects=True)
+    return httpx.AsyncClient(limits=limits, follow_redirects=True)
+
+
+def get_or_create_session() -> httpx.AsyncClient:
+    """Gets the existing client or creates a new one (also when the configured proxy changed)
+
+    Returns:
+        httpx.AsyncClient: The client
+    """
+    global session, _session_proxy
+    if session is None or session.is_closed or _session_proxy != config.PROXY:
+        session = create_new_session()
+        _session_proxy = config.PROXY
+    return session
+
+
+def _get_host_semaphore(url: str) -> asyncio.Semaphore:
+    """Gets the semaphore limiting in-flight requests for the URL's host"""
+    host = urlsplit(url).netloc
+    if host not in _host_semaphores:
+        _host_semaphores[host] = asyncio.Semaphore(max(1, config.ASYNC_MAX_CONNECTIONS_PER_HOST))
+    return _host_semaphores[host]
+
+
+async def _throttle() -> None:
+    """Waits until at least TIME_BETWEEN_REQUESTS has passed since the previous request was started"""
+    global last_request_time, _throttle_lock
+    if _throttle_lock is None:
+        _throttle_lock = asyncio.Lock()
+    async with _throttle_lock:
+        time_since_last_request = time.time() - last_request_time
+        if time_since_last_request < config.TIME_BETWEEN_REQUESTS:
+            await asyncio.sleep(config.TIME_BETWEEN_REQUESTS - time_since_last_request)
+        last_request_time = time.time()
+
+
+async def _post(url: str, payload: str | dict | list, headers: dict) -> tuple[dict, httpx.Response]:
+    """Posts the payload and parses the response"""
+    if isinstance(payload, str):
+        body = {"query": payload}
+    else:
+        body = payload
+
+    # Automatic Persisted Queries (USE_PERSISTED_QUERIES), with the registry shared with request_utils
+    request_body, query_hash = get_persisted_query_body(url, body)
+    async with _get_host_semaphore(url):
+        await _throttle()
+        client = get_or_create_session()
+        response = await client.post(url, json=request_body, headers=headers, timeout=config.REQUEST_TIMEOUT)
+        graphql_response = parse_response(response.text)
+        if query_hash is not None:
+            fallback_body = get_persisted_query_fallback(url, body, request_body, query_hash, graphql_response)
+            if fallback_body is not None and fallback_body is not body:
+                # The full document is sent again along with its hash, so the target registers it like a first request
+                response = await client.post(url, json=fallback_body, headers=headers, timeout=config.REQUEST_TIMEOUT)
+                graphql_response = parse_response(response.text)
+                fallback_body = get_persisted_query_fallback(url, body, fallback_body, query_hash, graphql_response)
+            if fallback_body is not None:
+                response = await client.post(url, json=fallback_body, headers=headers, timeout=config.REQUEST_TIMEOUT)
+                graphql_response = parse_response(response.text)
+    return graphql_response, response
+
+
+async def async_send_graphql_request(url: str, payload: str | dict | list) -> tuple[dict, httpx.Response]:
+    """Send GraphQL request to the specified endpoint (coroutine -- must run on the transport's event loop)
+
+    Args:
+        url (str): URL of the graphql server
+        payload (str | dict | list): The payload to send to the GraphQL API. If dict or string, must provide the query and variables keys
+
+    Returns:
+        tuple[dict, httpx.Response]: Dictionary of the graphql response, and the request's response
+    """
+    return await _post(url, payload, get_headers())
+
+
+async def async_send_graphql_request_with_headers(url: str, payload: str | dict | list, headers: dict[str, str]) -> tuple[dict, httpx.Response]:
+    """Send a GraphQL request with an explicit headers dict (coroutine -- must run on the transport's event loop)
+
+    Args:
+        url (str): URL of the GraphQL server.
+        payload (str | dict | list): GraphQL payload.
+        headers (dict[str, str]): Headers to include (merged on top of CUSTOM_HEADERS).
+
+    Returns:
+        tuple[dict, httpx.Response]: Parsed GraphQL response dict, raw HTTP response.
+    """
+    return await _post(url, payload, get_headers_with_overrides(headers))
+
+
+def send_graphql_request(url: str, payload: str | dict | list, next: Callable[[dict], dict] | None = None) -> tuple[dict, httpx.Response]:
+    """Send GraphQL request to the specified endpoint, blocking the calling thread until the response arrives
+
+    Args:
+        url (str): URL of the graphql server
+        payload (str | dict | list): The payload to send to the GraphQL API. If dict or string, must provide the query and variables keys
+        next (Callable[[dict], dict], optional): Unused, kept for compatibility with request_utils. Defaults to None.
+
+    Returns:
+        tuple[dict, httpx.Response]: Dictionary of the graphql response, and the request's response
+    """
+    return run_coroutine(async_send_graphql_request(url, payload))
+
+
+def send_graphql_request_with_headers(url: str, payload: str | dict | list, headers: dict[str, str]) -> tuple[dict, httpx.Response]:
+    """Send a GraphQL request with an explicit headers dict, blocking the calling thread until the response arrives.
+       Uses the same pooled client as ``send_graphql_request``; headers are sent per request.
+
+    Args:
+        url (str): URL of the GraphQL server.
+        payload (str | dict | list): GraphQL payload.
+        headers (dict[str, str]): Headers to include (merged on top of CUSTOM_HEADERS).
+
+    Returns:
+        tuple[dict, httpx.Response]: Parsed GraphQL response dict, raw HTTP response.
+    """
+    return run_coroutine(async_send_graphql_request_with_headers(url, payload, headers))
+
+
+def send_graphql_request_with_auth(url: str, payload: str | dict | list, auth_override: str) -> tuple[dict, httpx.Response]:
+    """Send a GraphQL request with a specific auth token (see ``request_utils.send_graphql_request_with_auth``)
+
+    Args:
+        url (str): URL of the GraphQL server.
+        payload (str | dict | list): GraphQL payload.
+        auth_override (str): The Authorization header value to use (e.g. "Bearer <token>").
+
+    Returns:
+        tuple[dict, httpx.Response]: Parsed GraphQL response dict, raw HTTP response.
+    """
+    return send_graphql_request_with_headers(url, payload, {"Authorization": auth_override} if auth_override else {})
+
+
+def send_graphql_requests_concurrently(url: str, payloads: list[Any], headers: dict[str, str] | None = None) -> list[tuple[dict, httpx.Response] | BaseException]:
+    """Send many GraphQL requests at once and wait for all of them.
+       Concurrency is still bounded by the pool and per-host limits.
+
+    Args:
+        url (str): URL of the GraphQL server.
+        payloads (list[Any]): The payloads to send.
+        headers (dict[str, str] | None, optional): Per-request headers; defaults to ``get_headers()``.
+
+    Returns:
+        list[tuple[dict, httpx.Response] | BaseException]: One entry per payload, in order. Failed requests
+        are returned as their exception rather than raised.
+    """
+    async def _gather():
+        if headers is None:
+            coros = [async_send_graphql_request(url, payload) for payload in payloads]
+        else:
+            coros = [async_send_graphql_request_with_headers(url, payload, headers) for payload in payloads]
+        return await asyncio.gather(*coros, return_exceptions=True)
+
+    return run_coroutine(_gather())
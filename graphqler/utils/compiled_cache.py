@@ -0,0 +1,111 @@
+"""Binary cache of the compiled / extracted YAML artifacts
+
+Parsing the compiled_*.yml and extracted/*.yml files with PyYAML takes seconds for large schemas, and they are read
+by the API, the GraphGenerator and the chain loader every time a run starts. Instead, each YAML file gets a pickled
+copy in a ``.cache`` directory next to it, stamped with the SHA-256 of the YAML source:
+
+  <dir>/<name>.yml
+  <dir>/.cache/<name>.yml.pickle
+
+The YAML file stays the source of truth: if its hash doesn't match the cache (e.g. it was recompiled or edited by
+hand), it is parsed again and the cache rewritten. Loaded artifacts are also kept in memory for the rest of the
+process, so the API, GraphGenerator and chain loader share a single load. Every call returns a fresh copy, so
+callers can't modify each other's data.
+"""
+
+import hashlib
+import pickle
+import threading
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from graphqler import config
+
+# {resolved yaml path: (sha256 of the yaml source, pickled data)}
+_memory_cache: dict[str, tuple[str, bytes]] = {}
+_memory_cache_lock = threading.Lock()
+
+
+def get_cache_path(yaml_path: Path) -> Path:
+    """Gets the path of the binary cache for a YAML file
+
+    Args:
+        yaml_path (Path): The YAML file
+
+    Returns:
+        Path: The cache file
+    """
+    return yaml_path.parent / config.COMPILED_CACHE_DIR_NAME / f"{yaml_path.name}.pickle"
+
+
+def _read_cache_file(cache_path: Path, digest: str) -> bytes | None:
+    """Reads the pickled data from the cache file, if it exists and was built from a YAML source with this digest"""
+    try:
+        with open(cache_path, "rb") as f:
+            cached_digest = f.readline().strip().decode()
+            pickled_data = f.read()
+    except OSError:
+        return None
+    if cached_digest != digest:
+        return None
+    return pickled_data
+
+
+def _write_cache_file(cache_path: Path, digest: str, pickled_data: bytes):
+    """Writes the cache file atomically. The cache is best-effort, so failures (e.g. a read-only directory) are ignored"""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(digest.encode() + b"\n")
+            f.write(pickled_data)
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass
+
+
+def read_compiled_yaml(yaml_path: Path | str) -> Any:
+    """Reads a compiled / extracted YAML file, going through the in-memory and on-disk binary caches
+
+    Args:
+        yaml_path (Path | str): Path of the yaml file
+
+    Returns:
+        Any: The YAML file contents (same as yaml.safe_load)
+    """
+    yaml_path = Path(yaml_path)
+    source = yaml_path.read_bytes()
+    digest = hashlib.sha256(source).hexdigest()
+    memory_key = str(yaml_path.resolve())
+
+    with _memory_cache_lock:
+        cached = _memory_cache.get(memory_key)
+    if cached is not None and cached[0] == digest:
+        return pickle.loads(cached[1])
+
+    cache_path = get_cache_path(yaml_path)
+    pickled_data = _read_cache_file(cache_path, digest)
+    data = None
+    if pickled_data is not None:
+        try:
+            data = pickle.loads(pickled_data)
+        except Exception:
+            # Corrupt cache file (e.g. killed mid-write by an older version) -- rebuild it from the YAML
+            pickled_data = None
+
+    if pickled_data is None:
+        data = yaml.safe_load(source)
+        pickled_data = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        _write_cache_file(cache_path, digest, pickled_data)
+
+    with _memory_cache_lock:
+        _memory_cache[memory_key] = (digest, pickled_data)
+    return data
+
+
+def clear_memory_cache():
+    """Clears the in-memory cache (the on-disk cache files are left untouched)"""
+    with _memory_cache_lock:
+        _memory_cache.clear()
@@ -3,6 +3,7 @@ from graphqler import config
 from pathlib import Path
 from graphqler.utils.singleton import singleton
 from graphqler.utils.file_utils import initialize_file
+from graphqler.utils.run_context import get_current_run_context
 
 
 @singleton
@@ -21,6 +22,7 @@ class Logger:
         self.compiler_log_path = Path(config.OUTPUT_DIRECTORY) / Path(config.COMPILER_LOG_FILE_PATH)
         self.detector_log_path = Path(config.OUTPUT_DIRECTORY) / Path(config.DETECTOR_LOG_FILE_PATH)
         self.idor_log_path = Path(config.OUTPUT_DIRECTORY) / Path(config.IDOR_LOG_FILE_PATH)
+        self._run_name: str | None = None  # Prefix of the loggers created for a run context, see close()
 
     def get_fuzzer_logger(self) -> logging.Logger:
         """Gets the fuzzer logger. Creates the logger if it doesn't exist, and creates the log file if it doesn't exist
@@ -123,6 +125,11 @@ class Logger:
         Returns:
             logging.Logger: The logger returned
         """
+        # Loggers are process-wide, so each run context gets its own
+        run_context = get_current_run_context()
+        if run_context is not None:
+            self._run_name = run_context.name
+            name = f"{run_context.name}.{name}"
         logger = logging.getLogger(name)
 
         # Avoid adding duplicate handlers when the same named logger is requested again
@@ -142,3 +149,21 @@ class Logger:
         logger.addHandler(handler)
 
         return logger
+
+    def close(self):
+        """Closes the log files of the run context's loggers and drops the loggers. Loggers are process-wide, so
+        without this every run would keep its log files open for the life of the process (e.g. the MCP server, which
+        runs each tool call in its own context). Called by the RunContext once it is no longer active
+        """
+        if self._run_name is None:
+            return
+        manager = logging.root.manager
+        run_logger_names = [name for name in list(manager.loggerDict) if name == self._run_name or name.startswith(f"{self._run_name}.")]
+        for name in run_logger_names:
+            logger = manager.loggerDict.pop(name, None)
+            if isinstance(logger, logging.Logger):
+                for handler in list(logger.handlers):
+                    logger.removeHandler(handler)
+                    handler.close()
+        self._run_name = None
+        self.fuzzer_logger = self.compiler_logger = self.detector_logger = self.idor_logger = None
@@ -27,6 +27,7 @@ except ImportError as exc:  # pragma: no cover
 
 from graphqler import config
 from graphqler.utils.cli_utils import is_compiled
+from graphqler.utils.run_context import RunContext
 
 # ---------------------------------------------------------------------------
 # Server definition
@@ -45,8 +46,8 @@ mcp = FastMCP(
     ),
 )
 
-# Global lock to serialise tool execution: compile/fuzz mutate global config state,
-# so concurrent HTTP/SSE requests must not run simultaneously.
+# Each tool call runs in its own RunContext (config and singletons), but the stdout capture
+# (redirect_stdout) is process-wide, so concurrent HTTP/SSE requests still run one at a time.
 _pipeline_lock = threading.Lock()
 
 
@@ -55,43 +56,15 @@ _pipeline_lock = threading.Lock()
 # ---------------------------------------------------------------------------
 
 
-def _reset_singletons() -> None:
-    """Clear cached singleton instances so each tool call starts with a clean state."""
-    from graphqler.utils.stats import Stats
-    from graphqler.utils.objects_bucket import ObjectsBucket
-
-    getattr(Stats, "reset")()
-    getattr(ObjectsBucket, "reset")()
-
-    # Best-effort reset of additional singletons used by compile/fuzz pipeline.
-    try:
-        from graphqler.utils.logging_utils import Logger
-
-        reset_fn = getattr(Logger, "reset", None)
-        if callable(reset_fn):
-            reset_fn()
-    except ImportError:
-        pass
-
-    try:
-        from graphqler.fuzzer.engine.fengine import FEngine
-
-        reset_fn = getattr(FEngine, "reset", None)
-        if callable(reset_fn):
-            reset_fn()
-    except ImportError:
-        pass
-
-
 def _set_output_directory(path: str) -> None:
-    """Set config.OUTPUT_DIRECTORY and keep derived config paths in sync."""
+    """Set config.OUTPUT_DIRECTORY (for the active run context) and keep derived config paths in sync."""
     config.OUTPUT_DIRECTORY = path
     if hasattr(config, "PLUGINS_PATH"):
         config.PLUGINS_PATH = f"{path}/plugins"
 
 
 def _apply_auth(auth: str | None) -> None:
-    """Apply an auth token to the global config, clearing any previous value when absent."""
+    """Apply an auth token to the config of the active run context, clearing any inherited value when absent."""
     if auth:
         from graphqler.utils.cli_utils import set_auth_token_constant
 
@@ -134,8 +107,7 @@ def compile(
     from graphqler.graph import GraphGenerator
     from graphqler.__main__ import run_compile_mode
 
-    with _pipeline_lock:
-        _reset_singletons()
+    with _pipeline_lock, RunContext().activate():
         _set_output_directory(path)
         _apply_auth(auth)
 
@@ -182,8 +154,8 @@ def fuzz(
             "Please run compile() first."
         )
 
-    with _pipeline_lock:
-        _reset_singletons()
+    run_context = RunContext()
+    with _pipeline_lock, run_context.activate():
         _set_output_directory(path)
         _apply_auth(auth)
 
@@ -198,7 +170,7 @@ def fuzz(
 
     # Build summary from stats — fuzzer.run() uses multiprocessing so stats are written to
     # disk by the child process; load them back into the parent-process singleton here.
-    stats_obj = Stats().load()
+    stats_obj = run_context.stats.load()
     lines = [
         "Fuzzing complete.",
         f"Successes: {stats_obj.number_of_successes}",
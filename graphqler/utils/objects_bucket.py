@@ -10,11 +10,12 @@ The class should have two functionalities
 3. Be able to return objects from the bucket if given a type and the object name
 """
 
-import copy
+import json
 import pathlib
 import pprint
 import random
-from typing import Self
+from collections.abc import Iterable, Sequence
+from typing import Any, Self
 
 import cloudpickle as pickle
 
@@ -26,16 +27,341 @@ from graphqler.utils.parser_utils import get_base_oftype, get_output_type_from_d
 from .singleton import singleton
 
 
+def _find_key_in_dict(dictionary: dict, key: str) -> tuple[str, str | int | float | bool | None]:
+    """Recursively searches for the key in a nested dictionary (see ``ObjectsBucket.find_key_in_dict``)"""
+    for k, v in dictionary.items():
+        if k == key:
+            return k, v
+        if isinstance(v, dict):
+            result = _find_key_in_dict(v, key)
+            if result is not None:
+                return result
+    return ("", None)
+
+
+class _FieldValuePool:
+    """The non-null values of one field across the objects of an ObjectStore, keyed by the owning object's canonical key.
+
+    Values are kept in a flat list so a random value can be sampled in O(1), and removals swap with the last entry.
+    """
+
+    def __init__(self):
+        self.values: list[Any] = []
+        self.keys: list[str] = []
+        self.positions: dict[str, int] = {}
+
+    def add(self, key: str, value: Any):
+        self.positions[key] = len(self.values)
+        self.values.append(value)
+        self.keys.append(key)
+
+    def copy(self) -> "_FieldValuePool":
+        new_pool = _FieldValuePool()
+        new_pool.values = list(self.values)
+        new_pool.keys = list(self.keys)
+        new_pool.positions = dict(self.positions)
+        return new_pool
+
+    def discard(self, key: str):
+        index = self.positions.pop(key, None)
+        if index is None:
+            return
+        last_key = self.keys.pop()
+        last_value = self.values.pop()
+        if index < len(self.values):
+            self.values[index] = last_value
+            self.keys[index] = last_key
+            self.positions[last_key] = index
+
+
+class ObjectStore(Sequence):
+    """Insertion-ordered store of the unique objects seen for a single object type.
+
+    Objects are keyed by a canonical JSON encoding, so duplicate checks and inserts are O(1) instead of a
+    linear scan with full dict comparisons, and a secondary index maps ``id`` / ``ID`` values to the objects
+    carrying them.  Per-field value pools (built on first lookup, then maintained incrementally) let
+    ``random_field_value`` sample a non-null field value in O(1).  It behaves like a read-only list (indexing, slicing, ``len``, iteration, ``in``), so
+    ``random.choice`` sampling works exactly as before.
+    """
+
+    def __init__(self, objects: Iterable[Any] = ()):
+        self._objects: list[Any] = []
+        self._keys: list[str] = []
+        self._positions: dict[str, int] = {}  # canonical key -> index in _objects
+        self._id_index: dict[Any, list[str]] = {}  # id / ID value -> canonical keys of the objects with that id
+        self._field_pools: dict[str, _FieldValuePool] = {}  # field name -> non-null values of that field, built on first lookup
+        for obj in objects:
+            self.add(obj)
+
+    @staticmethod
+    def canonical_key(obj: Any) -> str:
+        """Returns the canonical key of an object (equal objects always share the same key)"""
+        return json.dumps(obj, sort_keys=True, default=repr)
+
+    @staticmethod
+    def _id_values(obj: Any) -> list[Any]:
+        """Returns the id-like values of an object"""
+        if not isinstance(obj, dict):
+            return []
+        return [obj[id_field] for id_field in ("id", "ID") if obj.get(id_field) is not None]
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __getitem__(self, index):
+        return self._objects[index]
+
+    def __iter__(self):
+        return iter(self._objects)
+
+    def __contains__(self, obj: object) -> bool:
+        return self.canonical_key(obj) in self._positions
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ObjectStore):
+            return self._objects == other._objects
+        if isinstance(other, list):
+            return self._objects == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(self._objects)
+
+    def copy(self) -> "ObjectStore":
+        """Returns an independent copy of the store (the objects themselves are shared, they are never mutated in place)
+
+        Returns:
+            ObjectStore: The copy
+        """
+        new_store = type(self).__new__(type(self))
+        new_store._objects = list(self._objects)
+        new_store._keys = list(self._keys)
+        new_store._positions = dict(self._positions)
+        new_store._id_index = {id_value: list(keys) for id_value, keys in self._id_index.items()}
+        new_store._field_pools = {field_name: pool.copy() for field_name, pool in self._field_pools.items()}
+        return new_store
+
+    def add(self, obj: Any) -> bool:
+        """Adds the object if it isn't already in the store
+
+        Args:
+            obj (Any): The object
+
+        Returns:
+            bool: True if the object was added, False if it was a duplicate
+        """
+        key = self.canonical_key(obj)
+        if key in self._positions:
+            return False
+        self._positions[key] = len(self._objects)
+        self._objects.append(obj)
+        self._keys.append(key)
+        self._index_ids(obj, key)
+        self._index_fields(obj, key)
+        return True
+
+    def remove(self, obj: Any):
+        """Removes the object from the store
+
+        Args:
+            obj (Any): The object
+
+        Raises:
+            ValueError: If the object is not in the store
+        """
+        key = self.canonical_key(obj)
+        if key not in self._positions:
+            raise ValueError("object not in store")
+        self._remove_at(self._positions[key])
+
+    def replace(self, index: int, obj: Any):
+        """Replaces the object at *index* with *obj* (dropping the old entry if *obj* is already stored elsewhere)
+
+        Args:
+            index (int): The index of the object to replace
+            obj (Any): The new object
+        """
+        old_key = self._keys[index]
+        new_key = self.canonical_key(obj)
+        if new_key == old_key:
+            return
+        if new_key in self._positions:
+            self._remove_at(index)
+            return
+        self._unindex_ids(self._objects[index], old_key)
+        self._unindex_fields(old_key)
+        del self._positions[old_key]
+        self._objects[index] = obj
+        self._keys[index] = new_key
+        self._positions[new_key] = index
+        self._index_ids(obj, new_key)
+        self._index_fields(obj, new_key)
+
+    def index_of_id(self, id_value: Any) -> int | None:
+        """Returns the index of the first object whose ``id`` or ``ID`` equals *id_value*
+
+        Args:
+            id_value (Any): The id value
+
+        Returns:
+            int | None: The index, or None if no object has this id
+        """
+        try:
+            keys = self._id_index.get(id_value)
+        except TypeError:
+            # Unhashable id values aren't indexed — fall back to a scan
+            for i, obj in enumerate(self._objects):
+                if id_value in self._id_values(obj):
+                    return i
+            return None
+        if not keys:
+            return None
+        return min(self._positions[key] for key in keys)
+
+    def random_field_value(self, field_name: str) -> Any:
+        """Returns the value of *field_name* (searched for recursively) from a random object that has a non-null value for it
+
+        Args:
+            field_name (str): The field name
+
+        Returns:
+            Any: The field value, or None if no object has a non-null value for the field
+        """
+        pool = self._field_pools.get(field_name)
+        if pool is None:
+            pool = _FieldValuePool()
+            for key, obj in zip(self._keys, self._objects):
+                self._add_to_pool(pool, field_name, obj, key)
+            self._field_pools[field_name] = pool
+        if not pool.values:
+            return None
+        return random.choice(pool.values)
+
+    def _remove_at(self, index: int):
+        """Removes the object at *index*, keeping insertion order"""
+        key = self._keys[index]
+        self._unindex_ids(self._objects[index], key)
+        self._unindex_fields(key)
+        del self._positions[key]
+        del self._objects[index]
+        del self._keys[index]
+        for i in range(index, len(self._keys)):
+            self._positions[self._keys[i]] = i
+
+    def _index_ids(self, obj: Any, key: str):
+        for id_value in self._id_values(obj):
+            try:
+                keys = self._id_index.setdefault(id_value, [])
+            except TypeError:
+                continue
+            if key not in keys:
+                keys.append(key)
+
+    @staticmethod
+    def _add_to_pool(pool: _FieldValuePool, field_name: str, obj: Any, key: str):
+        if not isinstance(obj, dict):
+            return
+        _, value = _find_key_in_dict(obj, field_name)
+        if value is not None:
+            pool.add(key, value)
+
+    def _index_fields(self, obj: Any, key: str):
+        for field_name, pool in self._field_pools.items():
+            self._add_to_pool(pool, field_name, obj, key)
+
+    def _unindex_fields(self, key: str):
+        for pool in self._field_pools.values():
+            pool.discard(key)
+
+    def _unindex_ids(self, obj: Any, key: str):
+        for id_value in self._id_values(obj):
+            try:
+                keys = self._id_index.get(id_value)
+            except TypeError:
+                continue
+            if keys and key in keys:
+                keys.remove(key)
+                if not keys:
+                    del self._id_index[id_value]
+
+
+class ScalarPool:
+    """A set of scalar values backed by an array, so a uniformly random value can be sampled in O(1)
+    without converting the whole set to a list first.
+    """
+
+    def __init__(self, values: Iterable[Any] = ()):
+        self._values: list[Any] = []
+        self._positions: dict[Any, int] = {}
+        for value in values:
+            self.add(value)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._positions
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ScalarPool):
+            return self._positions.keys() == other._positions.keys()
+        if isinstance(other, (set, frozenset)):
+            return self._positions.keys() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(set(self._values))
+
+    def add(self, value: Any) -> bool:
+        """Adds the value if it isn't already in the pool
+
+        Args:
+            value (Any): The value
+
+        Returns:
+            bool: True if the value was added, False if it was a duplicate
+        """
+        if value in self._positions:
+            return False
+        self._positions[value] = len(self._values)
+        self._values.append(value)
+        return True
+
+    def random(self) -> Any:
+        """Returns a uniformly random value from the pool (the pool must not be empty)"""
+        return random.choice(self._values)
+
+    def copy(self) -> "ScalarPool":
+        new_pool = ScalarPool()
+        new_pool._values = list(self._values)
+        new_pool._positions = dict(self._positions)
+        return new_pool
+
+
 @singleton
 class ObjectsBucket:
+    # Names of the object stores / scalar entries this bucket shares with a clone. They are copied on the first
+    # write (copy-on-write), so cloning is O(number of types) instead of a deep copy of every object
+    _shared_objects: frozenset[str] = frozenset()
+    _shared_scalars: frozenset[str] = frozenset()
+    _shared_scalar_types: frozenset[str] = frozenset()
+
+    # Secondary index {scalar_type: ScalarPool} of every scalar value of that type, across all scalar names.
+    # Built lazily from self.scalars (e.g. for buckets loaded from older pickles), then maintained on put
+    _scalar_types: dict[str, ScalarPool] | None = None
+
     def __init__(self, api: API):
         self.api = api
 
-        # Stores {object_name: {type: str, results: dict}} where list is a result with the scalar fields of the object
-        self.objects: dict[str, list] = {}
+        # Stores {object_name: ObjectStore} where each entry is a unique object (dict of its fields) seen for that type
+        self.objects: dict[str, ObjectStore] = {}
 
-        # Stores the raw scalars {scalar_name: {type: str, values: set() }} where set() is a result with the scalar fields of the object
+        # Stores the raw scalars {scalar_name: {type: str, values: ScalarPool}} where the pool holds the unique values seen for that name
         self.scalars: dict[str, dict] = {}
+        self._scalar_types = {}
 
         # File paths
         self.pickle_save_path = pathlib.Path(config.OUTPUT_DIRECTORY) / config.SERIALIZED_DIR_NAME / config.OBJECTS_BUCKET_PICKLE_FILE_NAME
@@ -60,6 +386,11 @@ class ObjectsBucket:
     def __setstate__(self, state):
         # Restore the state from the pickled attributes
         self.__dict__.update(state)
+        # Buckets pickled before ObjectStore / ScalarPool existed hold plain lists and sets
+        self.objects = {name: objects if isinstance(objects, ObjectStore) else ObjectStore(objects) for name, objects in self.objects.items()}
+        for scalar in self.scalars.values():
+            if not isinstance(scalar["values"], ScalarPool):
+                scalar["values"] = ScalarPool(scalar["values"])
 
     def save(self):
         """Saves the objects bucket as a pickle file and as a text file"""
@@ -125,36 +456,22 @@ class ObjectsBucket:
         return random.choice(self.objects[object_name])
 
     def get_random_object_field_value(self, object_name: str, field_name: str) -> str | int | float | bool | None:
-        """Returns a random field from an object.
-           Retries up to 5 times to find a field value that isn't None
+        """Returns the field value of a random object that has a non-null value for the field.
+           Uses the object store's per-field value index, so sampling is O(1) after the first lookup of a field
 
         Args:
             object_name (str): The object name
             field_name (str): The field name
 
         Returns:
-            str | int | float | bool: The field value
+            str | int | float | bool: The field value, or None if no object has a non-null value for the field
         """
         if object_name not in self.objects:
             raise Exception("Object not found in bucket")
+        if not config.USE_OBJECTS_BUCKET:
+            return None
 
-        max_retries = 5
-        num_retries = 0
-        used_indices = []
-        while num_retries < max_retries:
-            length_of_objects = len(self.objects[object_name])
-            if len(used_indices) == length_of_objects:
-                return None
-            random_index = random.choice([i for i in range(length_of_objects) if i not in used_indices])
-            object_to_use = self.objects[object_name][random_index]
-            found_key, found_value = self.find_key_in_dict(object_to_use, field_name)
-
-            if found_value is not None:
-                return found_value
-            else:
-                num_retries += 1
-                used_indices.append(random_index)
-        return None
+        return self.objects[object_name].random_field_value(field_name)
 
     # ------------------- SETTERS -------------------
     def put_in_bucket(self, response_data: dict) -> bool:
@@ -313,9 +630,10 @@ class ObjectsBucket:
             object_info (dict): The object's info
         """
         if object_name not in self.objects:
-            self.objects[object_name] = []
-        if object_info not in self.objects[object_name]:
-            self.objects[object_name].append(object_info)
+            self.objects[object_name] = ObjectStore()
+        elif object_name in self._shared_objects and object_info in self.objects[object_name]:
+            return
+        self._writable_object_store(object_name).add(object_info)
 
     def parse_object_scalars(self, object_info: dict):
         """Parses each field of a dictionary as a scalar and parses it into the scalar components
@@ -335,26 +653,89 @@ class ObjectsBucket:
             data (str): The scalar's data
         """
         if name not in self.scalars:
-            self.scalars[name] = {"type": type, "values": {data}}
+            self.scalars[name] = {"type": type, "values": ScalarPool()}
+        elif data in self.scalars[name]["values"]:
+            return
+        elif name in self._shared_scalars:
+            self.scalars[name] = {"type": self.scalars[name]["type"], "values": self.scalars[name]["values"].copy()}
+            self._shared_scalars -= {name}
         self.scalars[name]["values"].add(data)
 
+        scalar_types = self._scalar_type_index()
+        if type not in scalar_types:
+            scalar_types[type] = ScalarPool()
+        elif data in scalar_types[type]:
+            return
+        elif type in self._shared_scalar_types:
+            scalar_types[type] = scalar_types[type].copy()
+            self._shared_scalar_types -= {type}
+        scalar_types[type].add(data)
+
+    def _scalar_type_index(self) -> dict[str, ScalarPool]:
+        """Returns the scalar type index, building it from the scalars if it doesn't exist yet
+
+        Returns:
+            dict[str, ScalarPool]: The pools of values for each scalar type
+        """
+        if self._scalar_types is None:
+            self._scalar_types = {}
+            for scalar in self.scalars.values():
+                pool = self._scalar_types.setdefault(scalar["type"], ScalarPool())
+                for value in scalar["values"]:
+                    pool.add(value)
+        return self._scalar_types
+
     # ------------------- CLONE -------------------
-    def clone(self) -> "ObjectsBucket":
+    def clone(self, shared: bool = True) -> "ObjectsBucket":
         """Creates an independent copy of this bucket, bypassing the singleton.
 
         Uses ``type(self)`` which resolves to the inner (unwrapped) class, so the
         new instance is allocated directly without going through the singleton
         ``getInstance`` wrapper.
+
+        The per-type object stores and scalar entries are shared between both buckets
+        and copied by whichever bucket writes to them first (copy-on-write), so a clone
+        only costs as much as the parts of the bucket that later diverge.  Even reads
+        update a shared store (its field pools are built on first lookup), so a clone
+        used from another thread must not share them (``shared=False``).
+
+        Args:
+            shared (bool, optional): Whether to share the stores copy-on-write, or to copy them all now. Defaults to True.
         """
         real_cls = type(self)
         new_bucket = real_cls.__new__(real_cls)
         new_bucket.api = self.api
-        new_bucket.objects = copy.deepcopy(self.objects)
-        new_bucket.scalars = copy.deepcopy(self.scalars)
         new_bucket.pickle_save_path = self.pickle_save_path
         new_bucket.text_save_path = self.text_save_path
+        if not shared:
+            new_bucket.objects = {name: store.copy() for name, store in self.objects.items()}
+            new_bucket.scalars = {name: {"type": scalar["type"], "values": scalar["values"].copy()} for name, scalar in self.scalars.items()}
+            new_bucket._scalar_types = {type_name: pool.copy() for type_name, pool in self._scalar_type_index().items()}
+            return new_bucket
+
+        new_bucket.objects = dict(self.objects)
+        new_bucket.scalars = dict(self.scalars)
+        new_bucket._scalar_types = dict(self._scalar_type_index())
+
+        self._shared_objects = new_bucket._shared_objects = frozenset(self.objects)
+        self._shared_scalars = new_bucket._shared_scalars = frozenset(self.scalars)
+        self._shared_scalar_types = new_bucket._shared_scalar_types = frozenset(new_bucket._scalar_types)
         return new_bucket
 
+    def _writable_object_store(self, object_name: str) -> ObjectStore:
+        """Returns the object store for *object_name*, copying it first if it is shared with a clone
+
+        Args:
+            object_name (str): The object name (must be in the bucket)
+
+        Returns:
+            ObjectStore: The object store, safe to modify
+        """
+        if object_name in self._shared_objects:
+            self.objects[object_name] = self.objects[object_name].copy()
+            self._shared_objects -= {object_name}
+        return self.objects[object_name]
+
     # ------------------- DELETERS -------------------
     def delete_object_from_bucket(self, object_name: str, object_value: dict):
         """Deletes a specific object entry from the bucket
@@ -363,12 +744,9 @@ class ObjectsBucket:
             object_name (str): The object type name
             object_value (dict): The specific object instance to remove
         """
-        if object_name not in self.objects:
+        if object_name not in self.objects or object_value not in self.objects[object_name]:
             return
-        try:
-            self.objects[object_name].remove(object_value)
-        except ValueError:
-            pass
+        self._writable_object_store(object_name).remove(object_value)
 
     def update_object_in_bucket(self, response_data: dict):
         """Updates an existing object in the bucket with new data from a successful UPDATE mutation response.
@@ -390,10 +768,10 @@ class ObjectsBucket:
             # Try to find and replace the matching entry by id-like fields
             id_value = data.get("id") or data.get("ID")
             if id_value is not None:
-                for i, existing in enumerate(self.objects[operation_output_type]):
-                    if existing.get("id") == id_value or existing.get("ID") == id_value:
-                        self.objects[operation_output_type][i] = data
-                        return
+                existing_index = self.objects[operation_output_type].index_of_id(id_value)
+                if existing_index is not None:
+                    self._writable_object_store(operation_output_type).replace(existing_index, data)
+                    return
             # No match found — just add it
             self.put_object_in_bucket(operation_output_type, data)
 
@@ -402,6 +780,10 @@ class ObjectsBucket:
         """Clears the bucket"""
         self.objects.clear()
         self.scalars.clear()
+        self._scalar_types = {}
+        self._shared_objects = frozenset()
+        self._shared_scalars = frozenset()
+        self._shared_scalar_types = frozenset()
 
     def is_empty(self) -> bool:
         """Checks if the object bucket is empty
@@ -437,17 +819,10 @@ class ObjectsBucket:
         """
         if not config.USE_OBJECTS_BUCKET:
             return ("", None)
-        for k, v in dictionary.items():
-            if k == key:
-                return k, v
-            if isinstance(v, dict):
-                result = self.find_key_in_dict(v, key)
-                if result is not None:
-                    return result
-        return ("", None)
+        return _find_key_in_dict(dictionary, key)
 
     def get_random_scalar_from_bucket_by_type(self, scalar_type: str) -> str | int | float | bool:
-        """Gets a random scalar from the bucket
+        """Gets a uniformly random scalar of the given type (across all scalar names) from the bucket
 
         Args:
             scalar_type (str): The scalar type
@@ -457,10 +832,10 @@ class ObjectsBucket:
         """
         if not config.USE_OBJECTS_BUCKET:
             return ""
-        for scalar_name, scalar in self.scalars.items():
-            if scalar["type"] == scalar_type:
-                return random.choice(list(scalar["values"]))
-        return ""
+        pool = self._scalar_type_index().get(scalar_type)
+        if not pool:
+            return ""
+        return pool.random()
 
     def get_random_scalar_from_bucket_by_name(self, scalar_name) -> str | int | float | bool:
         """Gets a random scalar from the bucket with the name
@@ -476,4 +851,4 @@ class ObjectsBucket:
         if scalar_name not in self.scalars:
             return ""
 
-        return random.choice(list(self.scalars[scalar_name]["values"]))
+        return self.scalars[scalar_name]["values"].random()
@@ -4,7 +4,7 @@ import inspect
 import pathlib
 
 from graphqler import config
-from graphqler.utils import request_utils
+from graphqler.utils import async_request_utils, request_utils
 from graphqler.utils.protocols.request_utils_protocol import RequestUtilsProtocol
 
 # The possible plugins and their map to the original module in GraphQLer
@@ -12,6 +12,12 @@ POSSIBLE_PLUGINS = {
     "request_utils.py": request_utils
 }
 
+# Built-in transports selectable with config.REQUEST_TRANSPORT (used when no request_utils plugin is present)
+REQUEST_TRANSPORTS = {
+    "sync": request_utils,
+    "async": async_request_utils,
+}
+
 
 def get_plugin_path(plugin_name: str) -> pathlib.Path:
     """Gets the plugin path
@@ -66,8 +72,10 @@ def get_request_utils() -> RequestUtilsProtocol:
         RequestUtilsProtocol: The request utils protocol
     """
     plugin_name = "request_utils.py"
-    original_module = POSSIBLE_PLUGINS[plugin_name]
+    original_module = REQUEST_TRANSPORTS.get(config.REQUEST_TRANSPORT, POSSIBLE_PLUGINS[plugin_name])
     new_module = get_plugin(plugin_name)
+    if new_module is POSSIBLE_PLUGINS[plugin_name]:
+        new_module = original_module
 
     original_functions = inspect.getmembers(original_module, inspect.isfunction)
 
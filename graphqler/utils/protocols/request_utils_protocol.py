@@ -25,6 +25,15 @@ class RequestUtilsProtocol(Protocol):
         """Send GraphQL request to the specified endpoint"""
         ...
 
+    def send_graphql_request_with_headers(
+        self,
+        url: str,
+        payload: Union[str, dict, list],
+        headers: dict[str, str]
+    ) -> Tuple[dict, Response]:
+        """Send GraphQL request to the specified endpoint with an explicit headers dict"""
+        ...
+
     def parse_response(self, response_text: str) -> dict:
         """Parse the response and try to jsonify it"""
         ...
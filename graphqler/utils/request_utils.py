@@ -1,8 +1,13 @@
 from urllib3.exceptions import InsecureRequestWarning
 from urllib3 import disable_warnings
+from collections import OrderedDict
 from typing import Callable
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 from graphqler import config
 
+import hashlib
+import re
+import threading
 import time
 import requests
 import json
@@ -12,12 +17,32 @@ import json
 last_request_time = time.time()
 session = None
 
+# Sessions for profile requests (IDOR / UAF / multi-profile), keyed by (merged headers, proxy) so that
+# repeated requests with the same profile reuse keep-alive connections instead of a new TCP/TLS handshake
+profile_sessions: dict[tuple, requests.Session] = {}
+_profile_sessions_lock = threading.Lock()
+
+# Automatic Persisted Queries (USE_PERSISTED_QUERIES): the sha256 hashes of the documents each target URL has
+# registered (least recently used first, at most PERSISTED_QUERIES_MAX_HASHES per URL), and the targets that turned
+# out not to support APQ (they are sent full documents from then on)
+persisted_query_hashes: dict[str, OrderedDict[str, None]] = {}
+persisted_queries_unsupported_urls: set[str] = set()
+_persisted_queries_lock = threading.Lock()
+# Errors of servers that ignore the persistedQuery extension and complain that a hash-only request has no document
+# (e.g. "Must provide query string.", "... must contain a non-empty `query` ...")
+_MISSING_QUERY_PATTERN = re.compile(r"must provide (a |the )?query|non-empty .?query|(query|document) (string )?(is )?(missing|required)|missing (the )?query", re.IGNORECASE)
+
 
 def reset_session() -> None:
-    """Reset the cached HTTP session so new config/auth headers take effect."""
+    """Reset the cached HTTP sessions (global and per-profile) so new config/auth headers take effect."""
     global session, last_request_time
     session = None
     last_request_time = time.time()
+    with _profile_sessions_lock:
+        stale_sessions = list(profile_sessions.values())
+        profile_sessions.clear()
+    for stale_session in stale_sessions:
+        stale_session.close()
 
 
 def get_headers() -> dict:
@@ -37,6 +62,26 @@ def get_headers() -> dict:
     return headers
 
 
+def get_headers_with_overrides(extra_headers: dict[str, str]) -> dict:
+    """Get the headers for a request made on behalf of a specific profile.
+       Merges config.CUSTOM_HEADERS with *extra_headers*; unlike ``get_headers``, config.AUTHORIZATION
+       is not used, and Authorization is only set when it is present (and non-empty) in *extra_headers*.
+
+    Args:
+        extra_headers (dict[str, str]): Per-request headers (e.g. from a RuntimeProfile)
+
+    Returns:
+        dict: The headers for the request
+    """
+    headers: dict[str, str] = {"Content-Type": "application/json"}
+    if config.CUSTOM_HEADERS:
+        headers.update(config.CUSTOM_HEADERS)
+    for key, value in extra_headers.items():
+        if value:
+            headers[key] = value
+    return headers
+
+
 def get_proxies() -> dict:
     """Get the proxies for the request
 
@@ -80,24 +125,22 @@ def send_graphql_request(url: str, payload: str | dict | list, next: Callable[[d
 
     # Make the request and set the last request time
     session = get_or_create_session()
-    response = session.post(
-        url=url,
-        json=body,
-        timeout=config.REQUEST_TIMEOUT,
+    graphql_response, response = send_with_persisted_query(
+        url, body, lambda request_body: _post(session, url, request_body)
     )
     last_request_time = time.time()
 
     if response.status_code != 200:
-        return parse_response(response.text), response
+        return graphql_response, response
 
     # if next:
     #     return next(json.loads(response.text))
 
-    return parse_response(response.text), response
+    return graphql_response, response
 
 
 def send_graphql_request_with_auth(url: str, payload: str | dict | list, auth_override: str) -> tuple[dict, requests.Response]:
-    """Send a GraphQL request using a one-off session with a specific auth token.
+    """Send a GraphQL request using a per-profile session with a specific auth token.
 
     Unlike ``send_graphql_request``, this function does **not** touch the global
     session, so the primary token is never replaced.  Used by the IDOR fuzzer to
@@ -115,12 +158,13 @@ def send_graphql_request_with_auth(url: str, payload: str | dict | list, auth_ov
 
 
 def send_graphql_request_with_headers(url: str, payload: str | dict | list, headers: dict[str, str]) -> tuple[dict, requests.Response]:
-    """Send a GraphQL request using a one-off session with an explicit headers dict.
+    """Send a GraphQL request using a per-profile session with an explicit headers dict.
 
     Merges ``config.CUSTOM_HEADERS`` with the provided *headers* dict, so callers
     can supply any combination of Authorization and additional per-request headers
     without losing API-specific config headers.  Authorization is only set when
-    explicitly present in *headers*.
+    explicitly present in *headers*.  The session is cached per (headers, proxy)
+    and reused until :func:`reset_session` is called.
 
     Args:
         url (str): URL of the GraphQL server.
@@ -141,16 +185,143 @@ def send_graphql_request_with_headers(url: str, payload: str | dict | list, head
     if time_since_last_request < config.TIME_BETWEEN_REQUESTS:
         time.sleep(config.TIME_BETWEEN_REQUESTS - time_since_last_request)
 
-    one_off_session = _create_session_with_headers(headers)
-    try:
-        response = one_off_session.post(url=url, json=body, timeout=config.REQUEST_TIMEOUT)
-    finally:
-        one_off_session.close()
+    profile_session = get_or_create_session_with_headers(headers)
+    graphql_response, response = send_with_persisted_query(url, body, lambda request_body: _post(profile_session, url, request_body))
     last_request_time = time.time()
 
+    return graphql_response, response
+
+
+def _post(session: requests.Session, url: str, body: dict | list) -> tuple[dict, requests.Response]:
+    """Posts the body with the session and parses the response"""
+    response = session.post(url=url, json=body, timeout=config.REQUEST_TIMEOUT)
     return parse_response(response.text), response
 
 
+def send_with_persisted_query(url: str, body: dict | list, post: Callable[[dict | list], tuple[dict, requests.Response]]) -> tuple[dict, requests.Response]:
+    """Sends the body with Automatic Persisted Queries when USE_PERSISTED_QUERIES is enabled: documents the target
+       has already registered are sent as their sha256 hash only, and the full document is sent again when the
+       target doesn't know the hash (PersistedQueryNotFound)
+
+    Args:
+        url (str): URL of the graphql server
+        body (dict | list): The request body
+        post (Callable[[dict | list], tuple[dict, requests.Response]]): Posts a request body and parses its response
+
+    Returns:
+        tuple[dict, requests.Response]: Dictionary of the graphql response, and the request's response
+    """
+    request_body, query_hash = get_persisted_query_body(url, body)
+    graphql_response, response = post(request_body)
+    if query_hash is not None:
+        fallback_body = get_persisted_query_fallback(url, body, request_body, query_hash, graphql_response)
+        if fallback_body is not None and fallback_body is not body:
+            # The full document is sent again along with its hash, so the target registers it like a first request
+            graphql_response, response = post(fallback_body)
+            fallback_body = get_persisted_query_fallback(url, body, fallback_body, query_hash, graphql_response)
+        if fallback_body is not None:
+            graphql_response, response = post(fallback_body)
+    return graphql_response, response
+
+
+def get_persisted_query_body(url: str, body: dict | list) -> tuple[dict | list, str | None]:
+    """Gets the body to send first with Automatic Persisted Queries: only the document's hash if the target has
+       already registered it, or else the full document along with its hash, so the target registers it
+
+    Args:
+        url (str): URL of the graphql server
+        body (dict | list): The request body
+
+    Returns:
+        tuple[dict | list, str | None]: The body to send, and the document's hash (None when APQ isn't used for this request)
+    """
+    if not config.USE_PERSISTED_QUERIES or not isinstance(body, dict) or not isinstance(body.get("query"), str):
+        return body, None
+    with _persisted_queries_lock:
+        if url in persisted_queries_unsupported_urls:
+            return body, None
+        query_hash = hashlib.sha256(body["query"].encode("utf-8")).hexdigest()
+        hashes = persisted_query_hashes.get(url)
+        is_registered = hashes is not None and query_hash in hashes
+        if is_registered:
+            hashes.move_to_end(query_hash)
+
+    extensions = {**(body.get("extensions") or {}), "persistedQuery": {"version": 1, "sha256Hash": query_hash}}
+    if is_registered:
+        return {**{key: value for key, value in body.items() if key != "query"}, "extensions": extensions}, query_hash
+    return {**body, "extensions": extensions}, query_hash
+
+
+def get_persisted_query_fallback(url: str, body: dict, request_body: dict, query_hash: str, graphql_response: dict) -> dict | None:
+    """Updates the registry of persisted queries with the target's response, and gets the body to send again if
+       the target couldn't use the hash
+
+    Args:
+        url (str): URL of the graphql server
+        body (dict): The original request body
+        request_body (dict): The body that was sent (from get_persisted_query_body)
+        query_hash (str): The document's hash
+        graphql_response (dict): The target's response
+
+    Returns:
+        dict | None: The body to send again (the original body when the target doesn't support APQ), or None if the
+                     response can be used as is
+    """
+    error = _get_persisted_query_error(graphql_response)
+    hash_only = "query" not in request_body
+    missing_query = hash_only and error is None and "data" not in graphql_response and _is_missing_query_error(graphql_response)
+    with _persisted_queries_lock:
+        if error == "PersistedQueryNotSupported" or missing_query:
+            # The target doesn't support APQ (or silently ignores it and complains that the query is missing)
+            persisted_queries_unsupported_urls.add(url)
+            persisted_query_hashes.pop(url, None)
+            return body
+        if error == "PersistedQueryNotFound":
+            # e.g. the target restarted or evicted the document from its cache: register it again
+            persisted_query_hashes.get(url, OrderedDict()).pop(query_hash, None)
+            return {**request_body, "query": body["query"]} if hash_only else None
+        if not hash_only and "data" in graphql_response:
+            # Documents that failed to parse or validate (no data at all) aren't registered by the target
+            hashes = persisted_query_hashes.setdefault(url, OrderedDict())
+            hashes[query_hash] = None
+            hashes.move_to_end(query_hash)
+            while len(hashes) > config.PERSISTED_QUERIES_MAX_HASHES:
+                hashes.popitem(last=False)
+    return None
+
+
+def _is_missing_query_error(graphql_response: dict) -> bool:
+    """Whether the response has an error saying the request has no document (see _MISSING_QUERY_PATTERN)"""
+    errors = graphql_response.get("errors")
+    if not isinstance(errors, list):
+        return False
+    return any(isinstance(error, dict) and _MISSING_QUERY_PATTERN.search(str(error.get("message", ""))) for error in errors)
+
+
+def _get_persisted_query_error(graphql_response: dict) -> str | None:
+    """Gets the Automatic Persisted Queries error of a response (PersistedQueryNotFound or PersistedQueryNotSupported), if any"""
+    errors = graphql_response.get("errors") if isinstance(graphql_response, dict) else None
+    if not isinstance(errors, list):
+        return None
+    for error in errors:
+        if not isinstance(error, dict):
+            continue
+        code = str((error.get("extensions") or {}).get("code", ""))
+        message = str(error.get("message", ""))
+        if code == "PERSISTED_QUERY_NOT_FOUND" or "PersistedQueryNotFound" in message:
+            return "PersistedQueryNotFound"
+        if code == "PERSISTED_QUERY_NOT_SUPPORTED" or "PersistedQueryNotSupported" in message:
+            return "PersistedQueryNotSupported"
+    return None
+
+
+def reset_persisted_queries() -> None:
+    """Forget the persisted queries registered by every target"""
+    with _persisted_queries_lock:
+        persisted_query_hashes.clear()
+        persisted_queries_unsupported_urls.clear()
+
+
 def parse_response(response_text: str) -> dict:
     """Parse the response and try to jsonify it
 
@@ -183,6 +354,24 @@ def get_or_create_session() -> requests.Session:
         return session
 
 
+def get_or_create_session_with_headers(extra_headers: dict[str, str]) -> requests.Session:
+    """Gets the cached session for a profile's headers, or creates (and caches) a new one
+
+    Args:
+        extra_headers (dict[str, str]): Per-request headers (e.g. from a RuntimeProfile).
+
+    Returns:
+        requests.Session: The session for these headers and the current proxy settings
+    """
+    key = (tuple(sorted(get_headers_with_overrides(extra_headers).items())), config.PROXY)
+    with _profile_sessions_lock:
+        profile_session = profile_sessions.get(key)
+        if profile_session is None:
+            profile_session = _create_session_with_headers(extra_headers)
+            profile_sessions[key] = profile_session
+        return profile_session
+
+
 def create_new_session() -> requests.Session:
     """Create a new session
 
@@ -191,6 +380,7 @@ def create_new_session() -> requests.Session:
     """
     session = requests.Session()
     session.headers.update(get_headers())
+    _mount_pooled_adapter(session)
 
     # Set proxy if available
     if config.PROXY:
@@ -200,8 +390,22 @@ def create_new_session() -> requests.Session:
     return session
 
 
+def _mount_pooled_adapter(session: requests.Session) -> None:
+    """Size the session's connection pool so concurrently running chains don't discard connections
+
+    Args:
+        session (requests.Session): The session to mount the adapter on
+    """
+    adapter = HTTPAdapter(pool_maxsize=max(DEFAULT_POOLSIZE, config.MAX_CONCURRENT_CHAINS))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+
 def _create_session_with_headers(extra_headers: dict[str, str]) -> requests.Session:
-    """Create a one-off session merging config.CUSTOM_HEADERS with *extra_headers*.
+    """Create a session merging config.CUSTOM_HEADERS with *extra_headers*.
+
+    Used by :func:`get_or_create_session_with_headers`, which caches the session
+    in ``profile_sessions`` keyed by the merged headers and the proxy setting.
 
     Authorization is only included when it is present in *extra_headers* and
     non-empty, so callers that do not supply a token do not accidentally send
@@ -211,16 +415,11 @@ def _create_session_with_headers(extra_headers: dict[str, str]) -> requests.Sess
         extra_headers (dict[str, str]): Per-request headers (e.g. from a RuntimeProfile).
 
     Returns:
-        requests.Session: A fresh session that is NOT stored globally.
+        requests.Session: A new session (cached by the caller, not here).
     """
     one_off = requests.Session()
-    headers: dict[str, str] = {"Content-Type": "application/json"}
-    if config.CUSTOM_HEADERS:
-        headers.update(config.CUSTOM_HEADERS)
-    for key, value in extra_headers.items():
-        if value:
-            headers[key] = value
-    one_off.headers.update(headers)
+    one_off.headers.update(get_headers_with_overrides(extra_headers))
+    _mount_pooled_adapter(one_off)
 
     if config.PROXY:
         one_off.proxies.update(get_proxies())
@@ -0,0 +1,113 @@
+"""Append-only log of endpoint results, and the exporter that renders it as the endpoint_results directory.
+
+Every unique ``Result`` recorded by ``Stats`` is appended exactly once as a JSON line to
+``<output_dir>/endpoint_results.jsonl``, so recording a result is O(1) and a killed run keeps
+everything it has done so far.  The human-readable layout
+
+  <output_dir>/endpoint_results/<node_name>/<success|failure>/<status_code>
+
+is rendered from the log by :func:`export_endpoint_results` at the end of a run, or offline with:
+
+  python -m graphqler.utils.results_log <output_dir>
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+
+from graphqler import config
+
+from .file_utils import recreate_path
+
+if TYPE_CHECKING:
+    from graphqler.fuzzer.engine.types import Result
+
+
+def append_result(log_path: str | Path, node_name: str, result: Result) -> None:
+    """Appends a single result to the results log
+
+    Args:
+        log_path (str | Path): The JSONL log file
+        node_name (str): The name of the node (query / mutation) the result belongs to
+        result (Result): The result
+    """
+    entry = {
+        "node": node_name,
+        "success": result.success,
+        "status_code": result.status_code,
+        "payload": str(result.payload),
+        "response": result.graphql_response,
+    }
+    with open(log_path, "a") as f:
+        f.write(json.dumps(entry, default=str) + "\n")
+
+
+def read_results(log_path: str | Path) -> Iterator[dict]:
+    """Reads the entries of a results log, skipping a truncated last line (e.g. from a killed run)
+
+    Args:
+        log_path (str | Path): The JSONL log file
+
+    Yields:
+        dict: Each logged result
+    """
+    log_path = Path(log_path)
+    if not log_path.exists():
+        return
+    with open(log_path, "r") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def _safe_node_name(node_name: str) -> str:
+    """Makes the node name usable as a directory name"""
+    node_name = node_name.replace("/", "_")
+    if os.name == "nt":
+        # Replace characters that are invalid in Windows filenames
+        node_name = re.sub(r'[\\/:*?"<>|]', "_", node_name)
+    return node_name
+
+
+def export_endpoint_results(log_path: str | Path, endpoint_results_dir: str | Path) -> None:
+    """Renders the results log as the endpoint results directory: for each node, a directory per result type,
+       a file per response code, and each unique payload with its (first seen) response.
+       The directory is recreated, so exporting is idempotent.
+
+    Args:
+        log_path (str | Path): The JSONL log file
+        endpoint_results_dir (str | Path): The endpoint results directory to (re)create
+    """
+    unique_results: dict[Path, dict[str, object]] = {}
+    for entry in read_results(log_path):
+        result_type = "success" if entry["success"] else "failure"
+        result_file_path = Path(endpoint_results_dir) / _safe_node_name(entry["node"]) / result_type / f"{entry['status_code']}"
+        payloads = unique_results.setdefault(result_file_path, {})
+        if entry["payload"] not in payloads:
+            payloads[entry["payload"]] = entry["response"]
+
+    recreate_path(Path(endpoint_results_dir))
+    for result_file_path, payloads in unique_results.items():
+        result_file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(result_file_path, "w") as f:
+            for payload, response in payloads.items():
+                f.write("------------------Payload:-------------------\n")
+                f.write(f"{payload}\n")
+                f.write("------------------Response:-------------------\n")
+                f.write(f"{response}\n")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python -m graphqler.utils.results_log <output_dir>")
+        sys.exit(1)
+    output_dir = Path(sys.argv[1])
+    export_endpoint_results(output_dir / config.ENDPOINT_RESULTS_LOG_FILE_NAME, output_dir / config.ENDPOINT_RESULTS_DIR_NAME)
+    print(f"Exported endpoint results to {output_dir / config.ENDPOINT_RESULTS_DIR_NAME}")
@@ -0,0 +1,166 @@
+"""Per-run state, so several runs (e.g. against different targets) can share one process
+
+GraphQLer keeps its settings in the ``graphqler.config`` module and its run state in process-wide singletons
+(``Stats``, ``ObjectsBucket``, ``FEngine``, ``Logger``). A ``RunContext`` gives a run its own copy of both:
+
+- config: reading ``config.X`` inside an active context returns the context's value for X if it has one, and setting
+  ``config.X`` (e.g. through ``set_config`` or a CLI flag) only sets it for the context
+- singletons: ``Stats()``, ``ObjectsBucket()``, ... return the context's own instances
+
+The active context is held in a ``contextvars.ContextVar``, so it follows the code that runs in it through the
+compiler, fuzzer, engines and detectors without being passed around. Threads don't inherit it by themselves: work
+handed to another thread is wrapped with ``in_current_context`` (a forked fuzzer process keeps it).
+
+    with RunContext(OUTPUT_DIRECTORY="out/a", MAX_TIME=600).activate():
+        Fuzzer("out/a", url).run()
+
+Outside of any context, everything behaves as before: one global config and one instance of each singleton.
+"""
+
+import contextvars
+import functools
+import importlib
+import itertools
+import sys
+import threading
+import types
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, TypeVar
+
+from graphqler import config
+
+_T = TypeVar("_T")
+
+_current_run_context: contextvars.ContextVar["RunContext | None"] = contextvars.ContextVar("graphqler_run_context", default=None)
+_run_ids = itertools.count(1)
+
+
+class RunContext:
+    """The config overrides and singleton instances of one run"""
+
+    def __init__(self, name: str | None = None, **config_overrides: Any):
+        """Creates a run context
+
+        Args:
+            name (str | None, optional): Name of the run, used to keep its loggers apart. Defaults to "run-<n>".
+            **config_overrides: Config values for this run (e.g. ``OUTPUT_DIRECTORY="out/a"``); other settings
+                fall back to the global config
+        """
+        self.name = name or f"run-{next(_run_ids)}"
+        self.config: dict[str, Any] = dict(config_overrides)
+        self.instances: dict[type, Any] = {}  # Singleton class -> this run's instance
+        self._activations = 0  # Nested / concurrent activate() blocks currently open
+        self._activations_lock = threading.Lock()
+
+    @contextmanager
+    def activate(self) -> Iterator["RunContext"]:
+        """Makes this the active context of the current thread (or coroutine) until the block exits. When the last
+        open block exits, the run's loggers are closed (they are created again if the context is activated again)
+
+        Yields:
+            RunContext: This context
+        """
+        with self._activations_lock:
+            self._activations += 1
+        token = _current_run_context.set(self)
+        try:
+            yield self
+        finally:
+            _current_run_context.reset(token)
+            with self._activations_lock:
+                self._activations -= 1
+                if self._activations == 0:
+                    self._close_loggers()
+
+    def _close_loggers(self):
+        """Closes this run's loggers, which hold open log files for the life of the process otherwise"""
+        from graphqler.utils.logging_utils import Logger
+
+        logger = self.instances.pop(Logger.__wrapped__, None)
+        if logger is not None:
+            logger.close()
+
+    def run(self, fn: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """Calls a function with this context active
+
+        Args:
+            fn (Callable[..., _T]): The function
+
+        Returns:
+            _T: The function's return value
+        """
+        with self.activate():
+            return fn(*args, **kwargs)
+
+    @property
+    def stats(self):
+        """This run's Stats"""
+        from graphqler.utils.stats import Stats
+
+        return self.run(Stats)
+
+    @property
+    def objects_bucket(self):
+        """This run's global ObjectsBucket"""
+        from graphqler.utils.objects_bucket import ObjectsBucket
+
+        return self.run(ObjectsBucket)
+
+    @property
+    def logger(self):
+        """This run's Logger"""
+        from graphqler.utils.logging_utils import Logger
+
+        return self.run(Logger)
+
+
+def get_current_run_context() -> RunContext | None:
+    """Gets the active run context
+
+    Returns:
+        RunContext | None: The active context, or None when running with the global config and singletons
+    """
+    return _current_run_context.get()
+
+
+def in_current_context(fn: Callable[..., _T]) -> Callable[..., _T]:
+    """Binds a function to the context it is wrapped in, for running it on another thread (e.g. a thread pool)
+
+    Args:
+        fn (Callable[..., _T]): The function
+
+    Returns:
+        Callable[..., _T]: A function calling fn in (a copy of) the current context, wherever it is called from
+    """
+    context = contextvars.copy_context()
+
+    @functools.wraps(fn)
+    def _run(*args: Any, **kwargs: Any) -> _T:
+        # A context can only be entered by one thread at a time, so each call runs in its own copy
+        return context.copy().run(fn, *args, **kwargs)
+
+    return _run
+
+
+class _RunConfigModule(types.ModuleType):
+    """Module type of ``graphqler.config``: resolves settings in the active run context first"""
+
+    def __getattribute__(self, name: str) -> Any:
+        run_context = _current_run_context.get()
+        if run_context is not None and name in run_context.config:
+            return run_context.config[name]
+        return super().__getattribute__(name)
+
+    def __setattr__(self, name: str, value: Any):
+        run_context = _current_run_context.get()
+        if run_context is not None and name.isupper():
+            run_context.config[name] = value
+        else:
+            super().__setattr__(name, value)
+
+    def __reduce__(self):
+        # Pickled by reference, like any other module (cloudpickle only recognizes plain modules)
+        return importlib.import_module, (self.__name__,)
+
+
+sys.modules[config.__name__].__class__ = _RunConfigModule
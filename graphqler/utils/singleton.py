@@ -1,5 +1,7 @@
 from typing import Any, Generic, TypeVar
 
+from .run_context import get_current_run_context
+
 _T = TypeVar("_T")
 
 
@@ -8,20 +10,26 @@ class _SingletonCallable(Generic[_T]):
 
     Exposes the original class as ``__wrapped__`` and provides a ``reset()``
     helper that clears the cached instance (useful for test isolation).
+    Inside an active RunContext, the instance belongs to the context.
     """
 
     def __init__(self, cls: type[_T]) -> None:
         self.__wrapped__: type[_T] = cls
         self._instances: dict[type[_T], _T] = {}
 
+    def _get_instances(self) -> dict:
+        run_context = get_current_run_context()
+        return self._instances if run_context is None else run_context.instances
+
     def __call__(self, *args: Any, **kwargs: Any) -> _T:
-        if self.__wrapped__ not in self._instances:
-            self._instances[self.__wrapped__] = self.__wrapped__(*args, **kwargs)
-        return self._instances[self.__wrapped__]
+        instances = self._get_instances()
+        if self.__wrapped__ not in instances:
+            instances[self.__wrapped__] = self.__wrapped__(*args, **kwargs)
+        return instances[self.__wrapped__]
 
     def reset(self) -> None:
         """Clear the cached instance so the next call creates a fresh one."""
-        self._instances.pop(self.__wrapped__, None)
+        self._get_instances().pop(self.__wrapped__, None)
 
 
 def singleton(myClass: type[_T]) -> _SingletonCallable[_T]:
@@ -1,8 +1,10 @@
+import copy
 import json
 import cloudpickle as pickle
 import pprint
 import shutil
 import sys
+import threading
 import time
 from pathlib import Path
 from typing import Self
@@ -12,10 +14,29 @@ from graphqler.fuzzer.engine.types import Result
 from graphqler.graph import Node
 from graphqler.fuzzer.engine.types import ResultEnum
 
-from .file_utils import initialize_file, intialize_file_if_not_exists, recreate_path, get_or_create_file
+from .file_utils import initialize_file, recreate_path, get_or_create_file
+from .results_log import append_result, export_endpoint_results
 from .singleton import singleton
-import os
-import re
+
+
+# Attributes holding output file locations, which belong to the current run rather than to the stats themselves
+_PATH_ATTRIBUTES = frozenset({
+    "file_path", "json_file_path", "eval_dir", "endpoint_results_dir", "results_log_path",
+    "unique_responses_file_path", "pickle_save_path",
+})
+
+
+def get_failure_signature(result: Result) -> str:
+    """Gets how a result failed, regardless of the (random) payload that was sent: its status code and error messages
+
+    Args:
+        result (Result): The failed result
+
+    Returns:
+        str: The failure signature
+    """
+    messages = sorted({str(error.get("message", error)) if isinstance(error, dict) else str(error) for error in result.errors or []})
+    return f"{result.status_code}|{messages}"
 
 
 @singleton
@@ -28,6 +49,7 @@ class Stats :
     http_status_codes: dict[str, dict[str, int]] = {}
     successful_nodes: dict[str, int] = {}
     failed_nodes: dict[str, int] = {}
+    failure_signatures: dict[str, set[str]] = {}  # Mapping of node key to the distinct ways it failed (status code and error messages)
     results: dict[str, set[Result]] = {}    # Mapping of query/mutation to results for that node
     unique_responses: dict[str, list[str]] = {}  # Mapping of response to endpoints (query/mutation)
     number_of_queries: int = 0
@@ -59,6 +81,7 @@ class Stats :
         self.http_status_codes = {}
         self.successful_nodes = {}
         self.failed_nodes = {}
+        self.failure_signatures = {}
         self.results = {}
         self.unique_responses = {}
         self.number_of_queries = 0
@@ -79,25 +102,116 @@ class Stats :
         self.dep_retry_total = 0
         self.dep_retry_completed = 0
         self.pickle_save_path = Path(config.OUTPUT_DIRECTORY) / config.SERIALIZED_DIR_NAME / config.STATS_PICKLE_FILE_NAME
+        # Guards counter updates and saves when chains run concurrently (see MAX_CONCURRENT_CHAINS)
+        self._lock = threading.RLock()
+        # Batched persistence: updates only mark the stats dirty, saves happen every STATS_SAVE_INTERVAL seconds
+        self._dirty = False
+        self._last_save_time = 0.0
+
+    # ------------------- Pickle -------------------
+    def __getstate__(self):
+        # Locks can't be pickled; drop it and recreate it on load
+        state = self.__dict__.copy()
+        state.pop("_lock", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
 
     def load(self) -> Self:
         """Loads the stats from the pickle file"""
         self.__load_pickle()
         return self
 
+    def snapshot(self) -> dict:
+        """Returns a copy of the stats, consistent even while chain worker threads are updating them
+
+        Returns:
+            dict: The stats' state, which can be given back to restore()
+        """
+        with self._lock:
+            return copy.deepcopy(self.__getstate__())
+
+    def restore(self, state: dict):
+        """Restores the stats from a snapshot(), keeping the current output file paths
+
+        Args:
+            state (dict): The state returned by snapshot()
+        """
+        with self._lock:
+            self.__dict__.update({key: value for key, value in state.items() if key not in _PATH_ATTRIBUTES})
+
+    def merge(self, state: dict):
+        """Adds the stats of another run (e.g. a distributed fuzzing worker) to these stats
+
+        Args:
+            state (dict): The other run's state, as returned by its snapshot()
+        """
+        with self._lock:
+            for status_code, payloads in state.get("http_status_codes", {}).items():
+                merged_payloads = self.http_status_codes.setdefault(status_code, {})
+                for payload_name, count in payloads.items():
+                    merged_payloads[payload_name] = merged_payloads.get(payload_name, 0) + count
+            for attribute in ("successful_nodes", "failed_nodes"):
+                merged_counts = getattr(self, attribute)
+                for key, count in state.get(attribute, {}).items():
+                    merged_counts[key] = merged_counts.get(key, 0) + count
+            # New results are appended to the results log, as in update_stats_from_result
+            results_log_path = getattr(self, "results_log_path", None)
+            for key, signatures in state.get("failure_signatures", {}).items():
+                self.failure_signatures.setdefault(key, set()).update(signatures)
+            for node_name, results in state.get("results", {}).items():
+                merged_results = self.results.setdefault(node_name, set())
+                for result in results:
+                    if result not in merged_results:
+                        merged_results.add(result)
+                        if config.SAVE_ENDPOINT_RESULTS and results_log_path is not None:
+                            append_result(results_log_path, node_name, result)
+            for response, node_names in state.get("unique_responses", {}).items():
+                self.unique_responses.setdefault(response, []).extend(node_names)
+            for key, timings in state.get("node_timings", {}).items():
+                self.node_timings.setdefault(key, []).extend(timings)
+            self.number_of_successes += state.get("number_of_successes", 0)
+            self.number_of_failures += state.get("number_of_failures", 0)
+            self.chains_total += state.get("chains_total", 0)
+            self.chains_completed += state.get("chains_completed", 0)
+            # Every worker compiled the same API, so these are the same for all of them
+            self.number_of_queries = max(self.number_of_queries, state.get("number_of_queries", 0))
+            self.number_of_mutations = max(self.number_of_mutations, state.get("number_of_mutations", 0))
+            self.number_of_objects = max(self.number_of_objects, state.get("number_of_objects", 0))
+            self.is_introspection_available |= state.get("is_introspection_available", False)
+            for vulnerability_name, nodes in state.get("vulnerabilities", {}).items():
+                for node_name, finding in nodes.items():
+                    self.add_vulnerability(
+                        vulnerability_name,
+                        node_name,
+                        is_vulnerable=finding["is_vulnerable"],
+                        potentially_vulnerable=finding["potentially_vulnerable"],
+                        payload=finding.get("payload", ""),
+                        evidence=finding.get("evidence", ""),
+                    )
+            self._dirty = True
+
+    def add_completed_chain(self):
+        """Counts a finished chain towards the current iteration's progress (safe to call from chain worker threads)"""
+        with self._lock:
+            self.chains_completed += 1
+
     def add_successful_node(self, node: Node):
         """Adds a new successful node to the succesful stats
 
         Args:
             node (Node): A graphqler node
         """
-        key_name = f"{node.graphql_type}|{node.name}"
-        self.number_of_successes += 1
-        if key_name in self.successful_nodes:
-            self.successful_nodes[key_name] += 1
-        else:
-            self.successful_nodes[key_name] = 1
-        self.save()
+        with self._lock:
+            key_name = f"{node.graphql_type}|{node.name}"
+            self.number_of_successes += 1
+            if key_name in self.successful_nodes:
+                self.successful_nodes[key_name] += 1
+            else:
+                self.successful_nodes[key_name] = 1
+            self.mark_dirty()
 
     def add_failed_node(self, node: Node):
         """Adds a new failed node to the internal failed stats
@@ -105,13 +219,14 @@ class Stats :
         Args:
             node (Node): A graphqler node
         """
-        key_name = f"{node.graphql_type}|{node.name}"
-        self.number_of_failures += 1
-        if key_name in self.failed_nodes:
-            self.failed_nodes[key_name] += 1
-        else:
-            self.failed_nodes[key_name] = 1
-        self.save()
+        with self._lock:
+            key_name = f"{node.graphql_type}|{node.name}"
+            self.number_of_failures += 1
+            if key_name in self.failed_nodes:
+                self.failed_nodes[key_name] += 1
+            else:
+                self.failed_nodes[key_name] = 1
+            self.mark_dirty()
 
     def add_http_status_code(self, payload_name: str, status_code: int | None):
         """Adds the http status code to stats
@@ -120,23 +235,55 @@ class Stats :
             payload_name (str): The name of the query or mutation
             status_code (int): The status code
         """
-        if status_code is None:
-            return
-        status_code_str = str(status_code)
-        if status_code_str in self.http_status_codes.keys():
-            if payload_name in self.http_status_codes[status_code_str]:
-                self.http_status_codes[status_code_str][payload_name] += 1
+        with self._lock:
+            if status_code is None:
+                return
+            status_code_str = str(status_code)
+            if status_code_str in self.http_status_codes.keys():
+                if payload_name in self.http_status_codes[status_code_str]:
+                    self.http_status_codes[status_code_str][payload_name] += 1
+                else:
+                    self.http_status_codes[status_code_str][payload_name] = 1
             else:
-                self.http_status_codes[status_code_str][payload_name] = 1
-        else:
-            self.http_status_codes[status_code_str] = {payload_name: 1}
-        self.save()
+                self.http_status_codes[status_code_str] = {payload_name: 1}
+            self.mark_dirty()
+
+    def mark_dirty(self):
+        """Marks the stats as changed since the last save, saving them if STATS_SAVE_INTERVAL has elapsed"""
+        with self._lock:
+            self._dirty = True
+            self.flush_if_due()
+
+    def flush_if_due(self):
+        """Saves the stats if they changed and at least STATS_SAVE_INTERVAL seconds passed since the last save"""
+        with self._lock:
+            if self._dirty and time.time() - self._last_save_time >= config.STATS_SAVE_INTERVAL:
+                self.save()
+
+    def flush(self):
+        """Saves the stats if they changed since the last save"""
+        with self._lock:
+            if self._dirty:
+                self.save()
+
+    def set_phase(self, phase: str):
+        """Sets the current fuzzing phase and flushes any pending stats
 
-    def set_file_paths(self, working_dir: str):
+        Args:
+            phase (str): The phase ("chains" | "islands" | "dep_retry" | "detections")
+        """
+        with self._lock:
+            self.phase = phase
+            self.flush()
+
+    def set_file_paths(self, working_dir: str, resume: bool = False):
         """
 
         Args:
             working_dir (str): _description_
+            resume (bool, optional): Whether the run continues an interrupted one (see Fuzzer.run), in which case the
+                                     endpoint results log is kept: the results restored from the checkpoint are
+                                     already in it and are never logged again. Defaults to False.
         """
         # Do the stats file first
         initialize_file(Path(working_dir) / config.STATS_FILE_NAME)
@@ -150,10 +297,12 @@ class Stats :
         # Eval/ablation directory (written only when ablation flags are active)
         self.eval_dir = Path(working_dir) / config.EVAL_DIR_NAME
 
-        # Do the endpoint results directory
+        # Do the endpoint results directory, and the append-only log it is rendered from
         self.endpoint_results_dir = Path(working_dir) / config.ENDPOINT_RESULTS_DIR_NAME
-        if config.SAVE_ENDPOINT_RESULTS:
+        self.results_log_path = Path(working_dir) / config.ENDPOINT_RESULTS_LOG_FILE_NAME
+        if config.SAVE_ENDPOINT_RESULTS and not (resume and self.results_log_path.exists()):
             recreate_path(self.endpoint_results_dir)
+            initialize_file(self.results_log_path)
 
         # Do the unique responses file
         self.unique_responses_file_path = Path(working_dir) / config.UNIQUE_RESPONSES_FILE_NAME
@@ -223,26 +372,28 @@ class Stats :
             evidence (str): Human-readable description of what specific indicator was matched,
                 e.g. "matched SQL error pattern: 'sql syntax'".  Empty string means not yet determined.
         """
-        if vulnerability_name not in self.vulnerabilities:
-            self.vulnerabilities[vulnerability_name] = {}
-
-        if node_name in self.vulnerabilities[vulnerability_name]:
-            existing = self.vulnerabilities[vulnerability_name][node_name]
-            existing["potentially_vulnerable"] = potentially_vulnerable | existing["potentially_vulnerable"]
-            existing["is_vulnerable"] = is_vulnerable | existing["is_vulnerable"]
-            # Prefer the confirmed finding's payload/evidence over a potential one
-            if is_vulnerable or (not existing["is_vulnerable"] and potentially_vulnerable):
-                if payload:
-                    existing["payload"] = payload
-                if evidence:
-                    existing["evidence"] = evidence
-        else:
-            self.vulnerabilities[vulnerability_name][node_name] = {
-                "potentially_vulnerable": potentially_vulnerable,
-                "is_vulnerable": is_vulnerable,
-                "payload": payload,
-                "evidence": evidence,
-            }
+        with self._lock:
+            if vulnerability_name not in self.vulnerabilities:
+                self.vulnerabilities[vulnerability_name] = {}
+
+            if node_name in self.vulnerabilities[vulnerability_name]:
+                existing = self.vulnerabilities[vulnerability_name][node_name]
+                existing["potentially_vulnerable"] = potentially_vulnerable | existing["potentially_vulnerable"]
+                existing["is_vulnerable"] = is_vulnerable | existing["is_vulnerable"]
+                # Prefer the confirmed finding's payload/evidence over a potential one
+                if is_vulnerable or (not existing["is_vulnerable"] and potentially_vulnerable):
+                    if payload:
+                        existing["payload"] = payload
+                    if evidence:
+                        existing["evidence"] = evidence
+            else:
+                self.vulnerabilities[vulnerability_name][node_name] = {
+                    "potentially_vulnerable": potentially_vulnerable,
+                    "is_vulnerable": is_vulnerable,
+                    "payload": payload,
+                    "evidence": evidence,
+                }
+            self._dirty = True
 
     def get_formatted_vulnerabilites(self) -> str:
         """Returns the formatted vulnerabilities
@@ -292,10 +443,12 @@ class Stats :
             node (Node): The node that was executed
             elapsed_seconds (float): Time taken in seconds
         """
-        key_name = f"{node.graphql_type}|{node.name}"
-        if key_name not in self.node_timings:
-            self.node_timings[key_name] = []
-        self.node_timings[key_name].append(elapsed_seconds)
+        with self._lock:
+            key_name = f"{node.graphql_type}|{node.name}"
+            if key_name not in self.node_timings:
+                self.node_timings[key_name] = []
+            self.node_timings[key_name].append(elapsed_seconds)
+            self._dirty = True
 
     def update_stats_from_result(self, node, result: Result) -> None:
         """Parses the result and adds it to the stats
@@ -303,29 +456,34 @@ class Stats :
         Args:
             result (Result): the result
         """
-        # Hard dependency not met means the node was never executed — skip all tracking
-        if result.result_enum == ResultEnum.HARD_DEPENDENCY_NOT_MET:
-            return
+        with self._lock:
+            # Hard dependency not met means the node was never executed — skip all tracking
+            if result.result_enum == ResultEnum.HARD_DEPENDENCY_NOT_MET:
+                return
 
-        result_status = result.success
+            result_status = result.success
 
-        # Update success / fail stats first
-        if result_status:
-            self.add_successful_node(node)
-        else:
-            self.add_failed_node(node)
-
-        # Update results
-        if node.name in self.results:
-            self.results[node.name].add(result)
-        else:
-            self.results[node.name] = {result}
-
-        # Update unique responses
-        if str(result.graphql_response) in self.unique_responses:
-            self.unique_responses[str(result.graphql_response)].append(node.name)
-        else:
-            self.unique_responses[str(result.graphql_response)] = [node.name]
+            # Update success / fail stats first
+            if result_status:
+                self.add_successful_node(node)
+            else:
+                self.add_failed_node(node)
+                self.failure_signatures.setdefault(f"{node.graphql_type}|{node.name}", set()).add(get_failure_signature(result))
+
+            # Update results, appending each new result to the results log exactly once
+            if node.name not in self.results:
+                self.results[node.name] = set()
+            if result not in self.results[node.name]:
+                self.results[node.name].add(result)
+                results_log_path = getattr(self, "results_log_path", None)
+                if config.SAVE_ENDPOINT_RESULTS and results_log_path is not None:
+                    append_result(results_log_path, node.name, result)
+
+            # Update unique responses
+            if str(result.graphql_response) in self.unique_responses:
+                self.unique_responses[str(result.graphql_response)].append(node.name)
+            else:
+                self.unique_responses[str(result.graphql_response)] = [node.name]
 
     def get_number_of_successful_mutations_and_queries(self) -> tuple[int, int]:
         """Returns the number of successful mutations and queries"""
@@ -372,38 +530,39 @@ class Stats :
     def save(self):
         """Saves the stats into the stats text file
         """
-        covered, total, coverage_frac = self.get_coverage_rate()
-        failed, _, negative_frac = self.get_negative_coverage_rate()
-        with open(self.file_path, "w") as f:
-            f.write("\n===================HTTP Status Codes===================\n")
-            f.write(json.dumps(self.http_status_codes, indent=4))
-            f.write("\n===================Successful Nodes===================\n")
-            f.write(json.dumps(self.successful_nodes, indent=4))
-            f.write("\n===================Failed Nodes===================\n")
-            f.write(json.dumps(self.failed_nodes, indent=4))
-            f.write("\n===================General stats ===================\n")
-            f.write(f"\nTime taken: {str(time.time() - self.start_time)} seconds")
-            # Operation coverage: operations with >=1 success (HTTP 200, no GraphQL 'errors' field)
-            f.write(f"\nOperation coverage (successful):  {covered}/{total} ({coverage_frac * 100:.1f}%)")
-            # Kept for backward compatibility with test utilities
-            f.write(f"\nNumber of unique query/mutation successes: {covered}/{total}")
-            # Negative coverage: operations with >=1 failure (any non-success result)
-            f.write(f"\nNegative coverage (failed):       {failed}/{total} ({negative_frac * 100:.1f}%)")
-            f.write(f"\nNumber of queries: {self.number_of_queries}")
-            f.write(f"\nNumber of mutations: {self.number_of_mutations}")
-            f.write(f"\nNumber of objects: {self.number_of_objects}")
-            f.write(f"\nNumber of successes: {self.number_of_successes}")
-            f.write(f"\nNumber of failures: {self.number_of_failures}")
-            if len(self.vulnerabilities) > 0:
-                f.write("\n===================Detected Vulnerabilities===================\n")
-                f.write(json.dumps(self.vulnerabilities, indent=4))
-        if config.SAVE_ENDPOINT_RESULTS:
-            self.save_endpoint_results()
-        self.save_unique_response()
-        self.save_json()
-
-        # Saves the pickle file as well
-        self.__save_pickle()
+        with self._lock:
+            self._dirty = False
+            self._last_save_time = time.time()
+            covered, total, coverage_frac = self.get_coverage_rate()
+            failed, _, negative_frac = self.get_negative_coverage_rate()
+            with open(self.file_path, "w") as f:
+                f.write("\n===================HTTP Status Codes===================\n")
+                f.write(json.dumps(self.http_status_codes, indent=4))
+                f.write("\n===================Successful Nodes===================\n")
+                f.write(json.dumps(self.successful_nodes, indent=4))
+                f.write("\n===================Failed Nodes===================\n")
+                f.write(json.dumps(self.failed_nodes, indent=4))
+                f.write("\n===================General stats ===================\n")
+                f.write(f"\nTime taken: {str(time.time() - self.start_time)} seconds")
+                # Operation coverage: operations with >=1 success (HTTP 200, no GraphQL 'errors' field)
+                f.write(f"\nOperation coverage (successful):  {covered}/{total} ({coverage_frac * 100:.1f}%)")
+                # Kept for backward compatibility with test utilities
+                f.write(f"\nNumber of unique query/mutation successes: {covered}/{total}")
+                # Negative coverage: operations with >=1 failure (any non-success result)
+                f.write(f"\nNegative coverage (failed):       {failed}/{total} ({negative_frac * 100:.1f}%)")
+                f.write(f"\nNumber of queries: {self.number_of_queries}")
+                f.write(f"\nNumber of mutations: {self.number_of_mutations}")
+                f.write(f"\nNumber of objects: {self.number_of_objects}")
+                f.write(f"\nNumber of successes: {self.number_of_successes}")
+                f.write(f"\nNumber of failures: {self.number_of_failures}")
+                if len(self.vulnerabilities) > 0:
+                    f.write("\n===================Detected Vulnerabilities===================\n")
+                    f.write(json.dumps(self.vulnerabilities, indent=4))
+            self.save_unique_response()
+            self.save_json()
+
+            # Saves the pickle file as well
+            self.__save_pickle()
 
     def save_json(self):
         """Saves a machine-readable JSON report alongside the text stats file"""
@@ -508,39 +667,14 @@ class Stats :
                 f.write(f"  Vulnerabilities: {list(self.vulnerabilities.keys())}\n")
 
     def save_endpoint_results(self):
-        """Reads the results, for each node in the node name -> results, create a directory for the
-           result type, then a file for the response code, and append the payload and the response to the file.
+        """Renders the results log into the endpoint results directory: for each node, a directory per result type,
+           a file per response code, and each unique payload with its response. Results are appended to the log as
+           they are recorded, so this only needs to run once at the end of a run.
         """
-        unique_results = {}
-        # Filter out for only unique results
-        for node_name, results in self.results.items():
-            # If the node name has slashes, replace them with underscores
-            node_name = node_name.replace("/", "_")
-
-            if os.name == "nt":
-                # Replace characters that are invalid in Windows filenames
-                node_name = re.sub(r'[\\/:*?"<>|]', "_", node_name)
-
-            for result in results:
-                result_type = "success" if result.success else "failure"
-                result_file_path = Path(self.endpoint_results_dir) / node_name / result_type / f"{result.status_code}"
-
-                payload_string = str(result.payload)
-                if result_file_path not in unique_results:
-                    unique_results[result_file_path] = {payload_string: result.graphql_response}
-                else:
-                    if payload_string not in unique_results[result_file_path]:
-                        unique_results[result_file_path][payload_string] = result.graphql_response
-
-        # Write the unique results to the file
-        for result_file_path, payloads in unique_results.items():
-            intialize_file_if_not_exists(result_file_path)
-            for payload, response in payloads.items():
-                with open(result_file_path, "a") as f:
-                    f.write("------------------Payload:-------------------\n")
-                    f.write(f"{payload}\n")
-                    f.write("------------------Response:-------------------\n")
-                    f.write(f"{response}\n")
+        results_log_path = getattr(self, "results_log_path", None)
+        if not config.SAVE_ENDPOINT_RESULTS or results_log_path is None:
+            return
+        export_endpoint_results(results_log_path, self.endpoint_results_dir)
 
     def save_unique_response(self):
         """Saves the unique responses to a file"""
@@ -1,6 +1,7 @@
 """Unit tests for the compiler chains module."""
 
 import networkx
+import yaml
 
 from graphqler.chains.chain import Chain, ChainStep
 from graphqler.chains.chain_generator import ChainGenerator
@@ -213,6 +214,41 @@ class TestChainGenerator:
         for chain in gen.chains:
             assert isinstance(chain, Chain)
 
+    def test_identical_chains_from_the_three_passes_are_deduplicated(self):
+        # No UPDATE/DELETE/UNKNOWN mutations, so all three passes emit the same chains
+        graph, nodes = _linear_graph("A", "B")
+        gen = ChainGenerator()
+        chains = gen.generate_with_strategy(TopologicalChainStrategy(), graph, [nodes[0]], [])
+        assert sorted(_names(c) for c in chains) == [["A"], ["A", "B"]]
+        assert gen._results[0][2] == {"duplicates": 4, "prefixes": 0}
+
+    def test_drop_prefix_chains(self, monkeypatch):
+        monkeypatch.setattr(config, "DROP_PREFIX_CHAINS", True)
+        graph, nodes = _linear_graph("A", "B", "C")
+        gen = ChainGenerator()
+        chains = gen.generate_with_strategy(TopologicalChainStrategy(), graph, [nodes[0]], [])
+        assert [_names(c) for c in chains] == [["A", "B", "C"]]
+        assert gen._results[0][2] == {"duplicates": 6, "prefixes": 2}
+
+    def test_save_reports_removed_chains_and_round_trips(self, tmp_path):
+        graph, nodes = _linear_graph("A", "B")
+        gen = ChainGenerator()
+        chains = gen.generate_with_strategy(TopologicalChainStrategy(), graph, [nodes[0]], [])
+        gen.save_to_yaml(str(tmp_path))
+
+        data = yaml.safe_load((tmp_path / config.CHAINS_DIR_NAME / "regular.yml").read_text())
+        assert data["removed_chains"] == {"duplicates": 4, "prefixes": 0}
+        loaded = ChainGenerator().load_from_yaml(str(tmp_path), graph)
+        assert [_names(c) for c in loaded] == [_names(c) for c in chains]
+
+    def test_load_accepts_plain_list_files(self, tmp_path):
+        graph, nodes = _linear_graph("A", "B")
+        chains_dir = tmp_path / config.CHAINS_DIR_NAME
+        chains_dir.mkdir(parents=True)
+        (chains_dir / "regular.yml").write_text(yaml.dump([{"id": "1", "steps": [{"node": "A", "profile": "primary"}]}]))
+        loaded = ChainGenerator().load_from_yaml(str(tmp_path), graph)
+        assert [_names(c) for c in loaded] == [["A"]]
+
 
 # ---------------------------------------------------------------------------
 # TopologicalChainStrategy
@@ -314,3 +350,35 @@ class TestTopologicalChainStrategy:
                     assert node.graphql_type != "Mutation"
         finally:
             config.DISABLE_MUTATIONS = original
+
+    def test_chains_match_networkx_ancestors_on_random_graphs(self):
+        """The bitset ancestor DP yields the same node sets as networkx.ancestors, in dependency order."""
+        import random
+
+        rng = random.Random(7)
+        mutation_types = ["CREATE", "UPDATE", "DELETE", "UNKNOWN"]
+        for _ in range(5):
+            nodes = []
+            for i in range(40):
+                if rng.random() < 0.4:
+                    nodes.append(_make_node(f"m{i}", graphql_type="Mutation", mutation_type=rng.choice(mutation_types)))
+                else:
+                    nodes.append(_make_node(f"n{i}", graphql_type=rng.choice(["Query", "Object"])))
+            graph = networkx.DiGraph()
+            graph.add_nodes_from(nodes)
+            for _ in range(80):
+                a, b = rng.sample(nodes, 2)
+                graph.add_edge(a, b)
+
+            excluded = {"DELETE", "UNKNOWN"}
+            chains = self._strategy()._generate_with_filter(graph, [], filter_mutation_type=list(excluded))
+            for chain in chains:
+                target = chain.nodes[-1]
+                expected = {a for a in networkx.ancestors(graph, target) if a.mutation_type not in excluded} | {target}
+                assert set(chain.nodes) == expected
+                # Dependencies between different SCCs always come first
+                scc = {n: i for i, comp in enumerate(networkx.strongly_connected_components(graph)) for n in comp}
+                position = {n: i for i, n in enumerate(chain.nodes)}
+                for u, v in graph.subgraph(chain.nodes).edges:
+                    if scc[u] != scc[v]:
+                        assert position[u] < position[v]
@@ -0,0 +1,89 @@
+"""Unit tests for the schema-level selection set cache used by Materializer.materialize_output."""
+
+from unittest.mock import MagicMock, patch
+
+from graphqler import config
+from graphqler.fuzzer.engine.materializers.getter import Getter
+from graphqler.fuzzer.engine.materializers.materializer import Materializer
+from graphqler.fuzzer.engine.materializers.utils.selection_set_cache import get_selection_set_cache
+
+
+def _scalar(name: str) -> dict:
+    return {"name": name, "kind": "SCALAR", "type": "String", "ofType": None, "inputs": {}}
+
+
+def _object_field(name: str, type_name: str, inputs: dict | None = None) -> dict:
+    return {"name": name, "kind": "OBJECT", "type": type_name, "ofType": None, "inputs": inputs or {}}
+
+
+def _make_api(user_fields: list[dict]) -> MagicMock:
+    api = MagicMock()
+    api.objects = {
+        "User": {"name": "User", "fields": user_fields},
+        "Post": {"name": "Post", "fields": [_scalar("title")]},
+    }
+    api.input_objects = {}
+    api.enums = {}
+    api.unions = {}
+    api.interfaces = {}
+    return api
+
+
+def _make_materializer(api) -> Materializer:
+    m = Materializer.__new__(Materializer)
+    m.api = api
+    m.fail_on_hard_dependency_not_met = False
+    m.used_objects = {}
+    m.max_depth = 5
+    m.getter = Getter()
+    m.logger = MagicMock()
+    return m
+
+
+OUTPUT = {"name": None, "kind": "OBJECT", "type": "User", "ofType": None}
+
+
+def test_selection_without_arguments_is_walked_once_per_api():
+    api = _make_api([_scalar("id"), _object_field("post", "Post")])
+    first = _make_materializer(api)
+    selectors = first.materialize_output({}, OUTPUT, MagicMock(), max_depth=2)
+    assert "post" in selectors and "title" in selectors
+
+    # A new materializer for the same API reuses the cached selection set
+    second = _make_materializer(api)
+    with patch.object(Materializer, "materialize_output_recursive") as walk:
+        assert second.materialize_output({}, OUTPUT, MagicMock(), max_depth=2) == selectors
+    walk.assert_not_called()
+
+
+def test_cache_key_includes_depth_and_minimal_materialization():
+    api = _make_api([_scalar("id"), _object_field("post", "Post")])
+    m = _make_materializer(api)
+    full = m.materialize_output({}, OUTPUT, MagicMock(), max_depth=2)
+    minimal = m.materialize_output({}, OUTPUT, MagicMock(), max_depth=2, minimal_materialization=True)
+    assert "post" in full
+    assert "post" not in minimal
+
+
+def test_selection_with_arguments_is_rematerialized():
+    post_inputs = {"first": {"name": "first", "kind": "SCALAR", "type": "Int", "ofType": None}}
+    api = _make_api([_scalar("id"), _object_field("post", "Post", post_inputs)])
+    m = _make_materializer(api)
+    m.materialize_output({}, OUTPUT, MagicMock(), max_depth=2)
+
+    cached = get_selection_set_cache(api).get(get_selection_set_cache(api).make_key(OUTPUT, 2, False))
+    assert cached is not None and cached.selectors is None
+
+    with patch.object(Materializer, "materialize_input_fields", return_value="first: 7") as inputs:
+        assert "post(first: 7)" in m.materialize_output({}, OUTPUT, MagicMock(), max_depth=2)
+    inputs.assert_called()
+
+
+def test_retry_depth_is_cached():
+    # Only reachable through an object at depth 1, so max_depth=0 yields nothing and needs a retry
+    api = _make_api([_object_field("post", "Post")])
+    m = _make_materializer(api)
+    with patch.object(config, "HARD_CUTOFF_DEPTH", 20):
+        selectors = m.materialize_output({}, OUTPUT, MagicMock(), max_depth=0)
+        assert "title" in selectors
+        assert get_selection_set_cache(api).get(get_selection_set_cache(api).make_key(OUTPUT, 0, False)).depth > 0
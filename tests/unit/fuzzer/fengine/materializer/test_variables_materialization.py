@@ -0,0 +1,101 @@
+"""Unit tests for USE_GRAPHQL_VARIABLES: parameterized operation documents cached per operation, with the inputs in variables."""
+
+from unittest.mock import MagicMock, patch
+
+from graphql import parse
+
+from graphqler.fuzzer.engine.materializers.getter import Getter
+from graphqler.fuzzer.engine.materializers.regular_payload_materializer import RegularPayloadMaterializer
+from graphqler.fuzzer.engine.materializers.utils import materialization_utils
+
+
+def _scalar(name: str, type_name: str = "String") -> dict:
+    return {"name": name, "kind": "SCALAR", "type": type_name, "ofType": None, "inputs": {}}
+
+
+def _non_null(field: dict) -> dict:
+    return {"name": field["name"], "kind": "NON_NULL", "type": None, "ofType": field}
+
+
+def _make_api() -> MagicMock:
+    api = MagicMock()
+    api.objects = {"User": {"name": "User", "fields": [_scalar("id", "ID"), _scalar("name")]}}
+    api.input_objects = {
+        "UserFilter": {"name": "UserFilter", "inputFields": {"role": {"name": "role", "kind": "ENUM", "type": "Role", "ofType": None}}},
+    }
+    api.enums = {"Role": {"name": "Role", "enumValues": [{"name": "ADMIN"}]}}
+    api.unions = {}
+    api.interfaces = {}
+    api.queries = {
+        "users": {
+            "name": "users",
+            "inputs": {
+                "name": _non_null(_scalar("name")),
+                "filter": {"name": "filter", "kind": "INPUT_OBJECT", "type": "UserFilter", "ofType": None},
+            },
+            "output": {"name": None, "kind": "OBJECT", "type": "User", "ofType": None},
+            "hardDependsOn": {},
+            "softDependsOn": {},
+        }
+    }
+    api.mutations = {}
+    return api
+
+
+def _make_materializer(api) -> RegularPayloadMaterializer:
+    m = RegularPayloadMaterializer.__new__(RegularPayloadMaterializer)
+    m.api = api
+    m.fail_on_hard_dependency_not_met = False
+    m.used_objects = {}
+    m.max_depth = 5
+    m.getter = Getter()
+    m.logger = MagicMock()
+    m.use_variables = True
+    return m
+
+
+def test_type_string_of_wrapped_types():
+    ids = _non_null({"name": "ids", "kind": "LIST", "type": None, "ofType": _non_null(_scalar("id", "ID"))})
+    assert materialization_utils.get_type_string(ids) == "[ID!]!"
+
+
+def test_inputs_are_sent_as_variables():
+    api = _make_api()
+    payload, _ = _make_materializer(api).get_payload("users", MagicMock(), "Query")
+
+    assert "$name: String!" in payload["query"] and "$filter: UserFilter" in payload["query"]
+    assert "users(name: $name, filter: $filter)" in payload["query"]
+    assert isinstance(payload["variables"]["name"], str)
+    assert payload["variables"]["filter"] == {"role": "ADMIN"}
+    parse(payload["query"])
+
+
+def test_document_is_built_once_per_operation():
+    api = _make_api()
+    first, _ = _make_materializer(api).get_payload("users", MagicMock(), "Query")
+
+    # A new materializer for the same API reuses the document, only the variables are materialized again
+    with patch("graphqler.fuzzer.engine.materializers.materializer.prettify_graphql_payload") as prettify:
+        second, _ = _make_materializer(api).get_payload("users", MagicMock(), "Query")
+    prettify.assert_not_called()
+    assert second["query"] is first["query"]
+
+
+def test_inline_payloads_when_disabled():
+    m = _make_materializer(_make_api())
+    m.use_variables = False
+    payload, _ = m.get_payload("users", MagicMock(), "Query")
+    assert isinstance(payload, str) and "$" not in payload
+
+
+def test_values_are_not_round_tripped_through_literals():
+    m = _make_materializer(_make_api())
+    m.getter = MagicMock(wraps=Getter())
+    m.getter.get_random_scalar.return_value = '"a"b\nc"'  # Not a valid GraphQL literal
+    payload, _ = m.get_payload("users", MagicMock(), "Query")
+    assert payload["variables"]["name"] == 'a"b\nc'
+
+
+def test_scalar_literals_become_json_values():
+    to_value = materialization_utils.scalar_literal_to_value
+    assert [to_value(literal) for literal in ['"abc"', '"{$gt: \\"\\"}"', "12", "1.5", "true", "null", "{}"]] == ["abc", '{$gt: ""}', 12, 1.5, True, None, {}]
@@ -0,0 +1,32 @@
+from unittest.mock import MagicMock, patch
+
+from graphqler.fuzzer.engine.retrier.retrier import Retrier
+
+QUERY = """query {
+  user {
+    id
+    payer {
+      name
+    }
+  }
+}"""
+
+
+@patch("graphqler.fuzzer.engine.retrier.retrier.plugins_handler")
+def test_variables_payload_is_retried_with_its_variables(mock_ph):
+    send = mock_ph.get_request_utils.return_value.send_graphql_request
+    send.return_value = ({"data": {"user": {"id": "1"}}}, MagicMock())
+    error_response = {"errors": [{"message": "Cannot return null for non-nullable field User.payer.", "locations": [{"line": 4, "column": 5}]}]}
+
+    payload = {"query": QUERY, "variables": {"id": "1"}}
+    response, success = Retrier(MagicMock()).retry("http://localhost/graphql", payload, error_response, 0)
+
+    assert success and response == {"data": {"user": {"id": "1"}}}
+    retried = send.call_args.args[1]
+    assert retried["variables"] == {"id": "1"}
+    assert "payer" not in retried["query"] and "id" in retried["query"]
+
+
+def test_batched_payloads_are_not_retried():
+    error_response = {"errors": [{"message": "Cannot return null for non-nullable field User.payer.", "locations": [{"line": 4, "column": 5}]}]}
+    assert Retrier(MagicMock()).retry("http://localhost/graphql", [{"query": QUERY}], error_response, 0) == (error_response, False)
@@ -0,0 +1,121 @@
+"""Unit tests for alias-batched probing in the field-fuzzing detectors."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from graphql import parse
+
+from graphqler import config
+from graphqler.fuzzer.engine.detectors.field_fuzzing.alias_batching import build_aliased_payload, reset_aliases_refused, send_probes, split_aliased_response
+from graphqler.fuzzer.engine.detectors.field_fuzzing.id_enumeration_detector import IDEnumerationDetector
+
+PAYLOADS = [f"query {{ user(id: {i}) {{ id }} }}" for i in range(1, 5)]
+
+
+@pytest.fixture(autouse=True)
+def _no_refused_aliases():
+    reset_aliases_refused()
+    yield
+    reset_aliases_refused()
+
+
+def _response(status_code: int = 200) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.text = "{}"
+    return response
+
+
+def test_probes_are_aliased_into_one_operation():
+    payload = build_aliased_payload(PAYLOADS[:2])
+    selections = parse(payload).definitions[0].selection_set.selections
+    assert [(selection.alias.value, selection.arguments[0].value.value) for selection in selections] == [("probe_0", "1"), ("probe_1", "2")]
+
+
+def test_response_is_attributed_to_each_probe():
+    response = {
+        "data": {"probe_0": {"id": "1"}, "probe_1": None},
+        "errors": [{"message": "Not found", "path": ["probe_1"]}],
+    }
+    first, second = split_aliased_response(response, "user", 2)
+    assert first == {"data": {"user": {"id": "1"}}}
+    assert second == {"data": {"user": None}, "errors": [{"message": "Not found", "path": ["user"]}]}
+
+
+@patch("graphqler.fuzzer.engine.detectors.field_fuzzing.alias_batching.Stats")
+@patch("graphqler.fuzzer.engine.detectors.field_fuzzing.alias_batching.plugins_handler")
+def test_one_request_per_batch(mock_ph, _mock_stats):
+    def fake_send(url, payload):
+        aliases = [selection.alias.value for selection in parse(payload).definitions[0].selection_set.selections]
+        return {"data": {alias: {"id": alias} for alias in aliases}}, _response()
+
+    send = mock_ph.get_request_utils.return_value.send_graphql_request
+    send.side_effect = fake_send
+    responses = send_probes("http://localhost/graphql", "user", PAYLOADS, batch_size=4)
+
+    assert send.call_count == 1
+    assert [response.graphql_response["data"]["user"] for response in responses] == [{"id": f"probe_{i}"} for i in range(4)]
+
+
+@patch("graphqler.fuzzer.engine.detectors.field_fuzzing.alias_batching.Stats")
+@patch("graphqler.fuzzer.engine.detectors.field_fuzzing.alias_batching.plugins_handler")
+def test_rejected_batches_fall_back_to_single_requests(mock_ph, _mock_stats):
+    def fake_send(url, payload):
+        if "probe_" in payload:
+            return {"errors": [{"message": "Query is too complex"}]}, _response(400)
+        return {"data": {"user": {"id": "1"}}}, _response()
+
+    send = mock_ph.get_request_utils.return_value.send_graphql_request
+    send.side_effect = fake_send
+    responses = send_probes("http://localhost/graphql", "user", PAYLOADS, batch_size=4)
+
+    # One batch of 4, two of 2, then the 4 probes alone
+    assert send.call_count == 7
+    assert all(response is not None and response.graphql_response["data"]["user"] == {"id": "1"} for response in responses)
+
+
+@patch("graphqler.fuzzer.engine.detectors.field_fuzzing.alias_batching.Stats")
+@patch("graphqler.fuzzer.engine.detectors.field_fuzzing.alias_batching.plugins_handler")
+def test_refused_aliases_are_not_retried(mock_ph, _mock_stats):
+    def fake_send(url, payload):
+        if "probe_" in payload:
+            return {"errors": [{"message": "Aliases are not allowed"}]}, _response(400)
+        return {"data": {"user": {"id": "1"}}}, _response()
+
+    send = mock_ph.get_request_utils.return_value.send_graphql_request
+    send.side_effect = fake_send
+    responses = send_probes("http://localhost/graphql", "user", PAYLOADS + PAYLOADS, batch_size=4)
+
+    # The first batch is refused, then its probes and the next batch's are sent alone, without splitting the batches
+    assert send.call_count == 1 + 8
+    assert all(response is not None and response.graphql_response["data"]["user"] == {"id": "1"} for response in responses)
+
+    send.reset_mock()
+    send_probes("http://localhost/graphql", "user", PAYLOADS, batch_size=4)
+    assert send.call_count == 4  # Later calls remember the operation refuses aliases
+
+
+@patch("graphqler.fuzzer.engine.detectors.field_fuzzing.alias_batching.Stats")
+@patch("graphqler.fuzzer.engine.detectors.field_fuzzing.alias_batching.plugins_handler")
+def test_id_enumeration_counts_hits_per_alias(mock_ph, _mock_stats):
+    api = MagicMock()
+    api.url = "http://localhost/graphql"
+    api.queries = {"user": {"inputs": {"id": {"name": "id", "kind": "SCALAR", "type": "Int", "ofType": None}}, "hardDependsOn": {}, "softDependsOn": {}}}
+    node = MagicMock()
+    node.name = "user"
+    detector = IDEnumerationDetector(api=api, node=node, objects_bucket=MagicMock(), graphql_type="Query")
+    detector._build_payload = lambda field_name, value: f"query {{ user(id: {value}) {{ id }} }}"
+
+    # Only even IDs exist
+    def fake_send(url, payload):
+        fields = parse(payload).definitions[0].selection_set.selections
+        return {"data": {field.alias.value: {"id": "x"} if int(field.arguments[0].value.value) % 2 == 0 else None for field in fields}}, _response()
+
+    send = mock_ph.get_request_utils.return_value.send_graphql_request
+    send.side_effect = fake_send
+    with patch.object(config, "ENUMERATION_ALIAS_BATCH_SIZE", 5), patch.object(config, "ID_ENUMERATION_COUNT", 10):
+        success_count, payloads_used = detector._probe_ids("id")
+
+    assert send.call_count == 2
+    assert success_count == 5
+    assert len(payloads_used) == 10
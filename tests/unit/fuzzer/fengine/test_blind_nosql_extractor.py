@@ -152,3 +152,50 @@ class TestBlindNoSQLExtractor(unittest.TestCase):
         result = extractor.extract()
         self.assertEqual(result, "")
         mock_plugins.get_request_utils.return_value.send_graphql_request.assert_not_called()
+
+
+class TestBinaryExtraction(unittest.TestCase):
+    """Binary-search strategy: character classes narrow each position down."""
+
+    SECRET = "4f5-e"
+
+    def setUp(self):
+        self._patches = [
+            patch.object(config, "NOSQLI_BLIND_EXTRACTION", True),
+            patch.object(config, "NOSQLI_EXTRACTION_CHARSET", "0123456789abcdef-"),
+            patch.object(config, "NOSQLI_MAX_EXTRACTION_LENGTH", 64),
+            patch.object(config, "NOSQLI_EXTRACTION_STRATEGY", "binary"),
+        ]
+        for p in self._patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self._patches:
+            p.stop()
+
+    def _oracle(self, url, payload):
+        import re
+        # Undo the GraphQL string and JSON escaping to get the regex back
+        m = re.search(r'\\"\^(.*)\\"\}"', payload)
+        pattern = m.group(1).replace("\\\\\\\\", "\\") if m else ""
+        if re.match("^" + pattern, self.SECRET):
+            return ({"data": {"doctors": [{"id": "x"}]}}, MagicMock(status_code=200))
+        return ({"data": {"doctors": []}}, MagicMock(status_code=200))
+
+    @patch("graphqler.fuzzer.engine.detectors.nosql_injection.blind_nosql_extractor.plugins_handler")
+    def test_extracts_with_fewer_requests(self, mock_plugins):
+        send = mock_plugins.get_request_utils.return_value.send_graphql_request
+        send.side_effect = self._oracle
+        self.assertEqual(BlindNoSQLExtractor("http://localhost/graphql", SAMPLE_PAYLOAD).extract(), self.SECRET)
+        # About log2(17) requests per character, plus the final check that nothing follows
+        self.assertLessEqual(send.call_count, 6 * (len(self.SECRET) + 1))
+
+    @patch("graphqler.fuzzer.engine.detectors.nosql_injection.blind_nosql_extractor.plugins_handler")
+    def test_concurrent_probes(self, mock_plugins):
+        request_utils = mock_plugins.get_request_utils.return_value
+        request_utils.send_graphql_request.side_effect = self._oracle
+        request_utils.send_graphql_requests_concurrently.side_effect = lambda url, payloads: [self._oracle(url, p) for p in payloads]
+        with patch.object(config, "NOSQLI_EXTRACTION_CONCURRENCY", 4):
+            result = BlindNoSQLExtractor("http://localhost/graphql", SAMPLE_PAYLOAD).extract()
+        self.assertEqual(result, self.SECRET)
+        request_utils.send_graphql_requests_concurrently.assert_called()
@@ -0,0 +1,126 @@
+"""Unit tests for DEngine: once-only detections when chains run in parallel threads."""
+
+import threading
+from contextlib import ExitStack
+from unittest.mock import MagicMock, patch
+
+from graphqler import config
+from graphqler.fuzzer.engine.dengine import DEngine
+
+
+def _make_detector_class(detect):
+    class _Detector:
+        DETECTION_NAME = "fake"
+        detect_only_once_for_node = True
+        detect_only_once_for_api = False
+        runs_in_background = False
+
+        def __init__(self, api, node, objects_bucket, graphql_type):
+            self.objects_bucket = objects_bucket
+
+        def detect(self):
+            return detect()
+
+    return _Detector
+
+
+def _only_injection_detector(detector_class):
+    return (
+        patch("graphqler.fuzzer.engine.dengine.injection_detectors", [detector_class]),
+        patch.object(config, "SKIP_INJECTION_ATTACKS", False),
+        patch.object(config, "SKIP_MISC_ATTACKS", True),
+        patch.object(config, "SKIP_ENUMERATION_ATTACKS", True),
+    )
+
+
+def _make_node(name: str = "searchUser"):
+    node = MagicMock()
+    node.name = name
+    return node
+
+
+def test_concurrent_chains_run_a_once_only_detection_once():
+    calls = []
+    barrier = threading.Barrier(4)
+    started = threading.Event()
+    release = threading.Event()
+
+    def detect():
+        calls.append(threading.get_ident())
+        started.set()
+        release.wait(5)
+        return (False, False)
+
+    dengine = DEngine(api=MagicMock())
+    detector_class = _make_detector_class(detect)
+    node = _make_node()
+
+    def _chain():
+        barrier.wait()
+        dengine.run_detections_on_graphql_object(node, MagicMock(), "Query")
+
+    with ExitStack() as stack:
+        for patcher in _only_injection_detector(detector_class):
+            stack.enter_context(patcher)
+        threads = [threading.Thread(target=_chain) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        assert started.wait(5)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+    assert len(calls) == 1
+    assert dengine.nodes_ran == {"searchUser": {"fake": True}}
+
+
+def test_failed_detection_runs_again():
+    outcomes = [RuntimeError("boom"), (False, False)]
+
+    def detect():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    dengine = DEngine(api=MagicMock())
+    detector_class = _make_detector_class(detect)
+    node = _make_node()
+
+    with ExitStack() as stack:
+        for patcher in _only_injection_detector(detector_class):
+            stack.enter_context(patcher)
+        dengine.run_detections_on_graphql_object(node, MagicMock(), "Query")
+        assert dengine.nodes_ran == {}
+        dengine.run_detections_on_graphql_object(node, MagicMock(), "Query")
+    assert dengine.nodes_ran == {"searchUser": {"fake": True}}
+    assert outcomes == []
+
+
+def test_running_detections_are_reported_until_they_finish():
+    started = threading.Event()
+    release = threading.Event()
+
+    def detect():
+        started.set()
+        release.wait(5)
+        return (False, False)
+
+    dengine = DEngine(api=MagicMock())
+    detector_class = _make_detector_class(detect)
+    detector_class.runs_in_background = True
+    node = _make_node()
+
+    with ExitStack() as stack:
+        for patcher in _only_injection_detector(detector_class):
+            stack.enter_context(patcher)
+        stack.enter_context(patch.object(config, "TIME_BASED_SQL_PARALLEL_PROBES", 1))
+        dengine.run_detection_on_graphql_object(node, MagicMock(), "Query", "fake")
+        assert started.wait(5)
+        assert dengine.get_running_detections() == [("searchUser", "fake")]
+        assert dengine.get_nodes_ran() == {}
+        release.set()
+        dengine.wait_for_background_detections()
+
+    assert dengine.get_running_detections() == []
+    assert dengine.get_nodes_ran() == {"searchUser": {"fake": True}}
@@ -1,5 +1,6 @@
 import unittest
 from unittest.mock import MagicMock, patch
+import threading
 import time
 
 from graphqler.fuzzer.engine.detectors.time_sql_injection.time_sql_injection_materializer import (
@@ -176,3 +177,148 @@ class TestTimeSQLInjectionDetector(unittest.TestCase):
 
         self.assertTrue(confirmed)
         self.assertFalse(potential)
+
+
+# ---------------------------------------------------------------------------
+# Robust baseline (median / MAD) and background runs
+# ---------------------------------------------------------------------------
+
+class TestRobustBaseline(unittest.TestCase):
+    def setUp(self):
+        self._orig = (config.TIME_BASED_SQL_SLEEP_SECONDS, config.TIME_BASED_SQL_THRESHOLD_RATIO, config.TIME_BASED_SQL_MAD_FACTOR)
+        config.TIME_BASED_SQL_SLEEP_SECONDS = 3
+        config.TIME_BASED_SQL_THRESHOLD_RATIO = 0.8  # threshold = 2.4s
+        config.TIME_BASED_SQL_MAD_FACTOR = 3.0
+
+    def tearDown(self):
+        config.TIME_BASED_SQL_SLEEP_SECONDS, config.TIME_BASED_SQL_THRESHOLD_RATIO, config.TIME_BASED_SQL_MAD_FACTOR = self._orig
+
+    def test_noisy_baseline_suppresses_finding(self):
+        det = _make_detector(elapsed=2.6, baseline=0.1)
+        det.baseline_mad = 1.0  # 3 * 1.4826 * 1.0 ≈ 4.4s of noise
+        self.assertFalse(det._is_vulnerable(None, MagicMock()))
+        self.assertFalse(det._is_potentially_vulnerable(None, MagicMock()))
+        self.assertEqual(det._get_evidence(None, MagicMock()), "")
+
+    def test_steady_baseline_keeps_finding(self):
+        det = _make_detector(elapsed=2.6, baseline=0.1)
+        det.baseline_mad = 0.05
+        self.assertTrue(det._is_vulnerable(None, MagicMock()))
+        self.assertIn("MAD 0.05s", det._get_evidence(None, MagicMock()))
+
+    @patch("graphqler.fuzzer.engine.detectors.time_sql_injection.time_sql_injection_detector.RegularPayloadMaterializer")
+    @patch("graphqler.fuzzer.engine.detectors.time_sql_injection.time_sql_injection_detector.plugins_handler")
+    @patch("graphqler.fuzzer.engine.detectors.time_sql_injection.time_sql_injection_detector.Stats")
+    def test_detect_uses_median_and_mad_of_samples(self, mock_stats, mock_plugins, mock_materializer):
+        response = MagicMock()
+        response.status_code = 200
+        response.text = '{"data": {"searchUser": null}}'
+        mock_plugins.get_request_utils.return_value.send_graphql_request.return_value = ({"data": {"searchUser": None}}, response)
+        mock_materializer.return_value.get_payload.return_value = ("{ searchUser { id } }", True)
+
+        det = _make_detector(elapsed=0.0)
+        # One outlier among the baseline samples doesn't move the median
+        with patch.object(det, "_sample_baseline", return_value=[0.1, 0.2, 0.3, 5.0]), \
+             patch("graphqler.fuzzer.engine.detectors.time_sql_injection.time_sql_injection_detector.time.monotonic", side_effect=[1000.0, 1003.0]):
+            confirmed, _ = det.detect()
+
+        self.assertAlmostEqual(det.baseline_time, 0.25)
+        self.assertAlmostEqual(det.baseline_mad, 0.1)
+        self.assertTrue(confirmed)
+
+    @patch("graphqler.fuzzer.engine.detectors.time_sql_injection.time_sql_injection_detector.RegularPayloadMaterializer")
+    @patch("graphqler.fuzzer.engine.detectors.time_sql_injection.time_sql_injection_detector.plugins_handler")
+    def test_baseline_samples_are_sent_concurrently(self, mock_plugins, mock_materializer):
+        mock_materializer.return_value.get_payload.return_value = ("{ searchUser { id } }", True)
+        send = mock_plugins.get_request_utils.return_value.send_graphql_request
+        send.side_effect = [({}, MagicMock()), ({}, MagicMock()), OSError("reset"), ({}, MagicMock()), ({}, MagicMock())]
+
+        det = _make_detector(elapsed=0.0)
+        with patch.object(config, "TIME_BASED_SQL_BASELINE_SAMPLES", 5):
+            samples = det._sample_baseline()
+
+        self.assertEqual(send.call_count, 5)
+        self.assertEqual(len(samples), 4)  # The failed request isn't a sample
+
+    def test_runs_in_background_only_with_parallel_probes(self):
+        det = _make_detector(elapsed=0.0)
+        with patch.object(config, "TIME_BASED_SQL_PARALLEL_PROBES", 0):
+            self.assertFalse(det.runs_in_background)
+        with patch.object(config, "TIME_BASED_SQL_PARALLEL_PROBES", 2):
+            self.assertTrue(det.runs_in_background)
+
+    def test_dengine_runs_background_detections_on_a_bucket_copy(self):
+        from graphqler.fuzzer.engine.dengine import DEngine
+
+        started = threading.Event()
+        release = threading.Event()
+        seen_buckets = []
+
+        class _SlowDetector:
+            DETECTION_NAME = "slow"
+            detect_only_once_for_node = True
+            detect_only_once_for_api = False
+            runs_in_background = True
+
+            def __init__(self, api, node, objects_bucket, graphql_type):
+                self.objects_bucket = objects_bucket
+
+            def detect(self):
+                seen_buckets.append(self.objects_bucket)
+                started.set()
+                release.wait(5)
+                return (False, False)
+
+        node = MagicMock()
+        node.name = "searchUser"
+        objects_bucket = MagicMock()
+        dengine = DEngine(api=MagicMock())
+        with patch("graphqler.fuzzer.engine.dengine.injection_detectors", [_SlowDetector]), \
+             patch.object(config, "SKIP_INJECTION_ATTACKS", False), patch.object(config, "SKIP_MISC_ATTACKS", True), \
+             patch.object(config, "SKIP_ENUMERATION_ATTACKS", True), patch.object(config, "TIME_BASED_SQL_PARALLEL_PROBES", 1):
+            dengine.run_detections_on_graphql_object(node, objects_bucket, "Query")
+            self.assertTrue(started.wait(5))
+            # The call returned while the detection is still running: the node isn't scheduled again, but the
+            # detection only counts as ran (e.g. in checkpoints) once it finishes
+            self.assertEqual(dengine.get_nodes_ran(), {})
+            dengine.run_detections_on_graphql_object(node, objects_bucket, "Query")
+            release.set()
+            dengine.wait_for_background_detections()
+
+        self.assertEqual(seen_buckets, [objects_bucket.clone.return_value])
+        self.assertEqual(dengine.get_nodes_ran(), {"searchUser": {"slow": True}})
+
+    def test_failed_background_detection_runs_again(self):
+        from graphqler.fuzzer.engine.dengine import DEngine
+
+        outcomes = [RuntimeError("timed out"), (True, False)]
+
+        class _FlakyDetector:
+            DETECTION_NAME = "flaky"
+            detect_only_once_for_node = True
+            detect_only_once_for_api = False
+            runs_in_background = True
+
+            def __init__(self, api, node, objects_bucket, graphql_type):
+                self.objects_bucket = objects_bucket
+
+            def detect(self):
+                outcome = outcomes.pop(0)
+                if isinstance(outcome, Exception):
+                    raise outcome
+                return outcome
+
+        node = MagicMock()
+        node.name = "searchUser"
+        dengine = DEngine(api=MagicMock())
+        with patch("graphqler.fuzzer.engine.dengine.injection_detectors", [_FlakyDetector]), \
+             patch.object(config, "SKIP_INJECTION_ATTACKS", False), patch.object(config, "SKIP_MISC_ATTACKS", True), \
+             patch.object(config, "SKIP_ENUMERATION_ATTACKS", True), patch.object(config, "TIME_BASED_SQL_PARALLEL_PROBES", 1):
+            dengine.run_detections_on_graphql_object(node, MagicMock(), "Query")
+            dengine.wait_for_background_detections()
+            self.assertEqual(dengine.get_nodes_ran(), {})
+            dengine.run_detections_on_graphql_object(node, MagicMock(), "Query")
+            dengine.wait_for_background_detections()
+
+        self.assertEqual(outcomes, [])
+        self.assertEqual(dengine.get_nodes_ran(), {"searchUser": {"flaky": True}})
@@ -0,0 +1,96 @@
+"""Unit tests for coverage-guided chain scheduling (CHAIN_SCHEDULING = "coverage")."""
+
+from unittest.mock import patch
+
+import pytest
+
+from graphqler import config
+from graphqler.chains import Chain, ChainStep
+from graphqler.fuzzer.chain_scheduler import (
+    COVERED,
+    SATURATED,
+    UNCOVERED,
+    UNCOVERED_DEP_BLOCKED,
+    get_chain_cost,
+    get_chain_rank,
+    schedule_chains,
+)
+from graphqler.fuzzer.engine.types import Result, ResultEnum
+from graphqler.graph.node import Node
+from graphqler.utils.stats import Stats
+
+CREATE = Node("Mutation", "createUser", {})
+USER = Node("Object", "User", {})
+GET = Node("Query", "getUser", {})
+LIST = Node("Query", "listUsers", {})
+SEARCH = Node("Query", "searchUsers", {})
+
+
+def _chain(*nodes: Node) -> Chain:
+    return Chain(steps=[ChainStep(node=node) for node in nodes], id="->".join(node.name for node in nodes))
+
+
+def _stats() -> Stats:
+    return Stats.__wrapped__()  # ty: ignore[unresolved-attribute]
+
+
+@pytest.fixture(autouse=True)
+def _coverage_scheduling():
+    with patch.object(config, "CHAIN_SCHEDULING", "coverage"), patch.object(config, "CHAIN_SATURATION_COUNT", 3):
+        yield
+
+
+class TestRank:
+    def test_ranks_follow_target_coverage(self):
+        stats = _stats()
+        stats.successful_nodes = {"Query|listUsers": 1, "Query|searchUsers": 3}
+        assert get_chain_rank(_chain(CREATE, USER, GET), stats, set()) == UNCOVERED
+        assert get_chain_rank(_chain(CREATE, USER, GET), stats, {GET}) == UNCOVERED_DEP_BLOCKED
+        assert get_chain_rank(_chain(LIST), stats, set()) == COVERED
+        assert get_chain_rank(_chain(SEARCH), stats, set()) == SATURATED
+
+    def test_target_failing_the_same_way_is_saturated(self):
+        stats = _stats()
+        errors = [{"message": "Not authorized"}]
+        with patch.object(stats, "save"):
+            # Each attempt sends a different (random) payload, but the target fails the same way
+            for payload in ("query { getUser(id: 1) { id } }", "query { getUser(id: 2) { id } }", "query { getUser(id: 3) { id } }"):
+                stats.update_stats_from_result(GET, Result(ResultEnum.EXTERNAL_FAILURE, payload=payload, status_code=200, errors=errors))
+        assert get_chain_rank(_chain(GET), stats, set()) == SATURATED
+
+        # Different failures mean the target still reacts to what it is sent
+        with patch.object(stats, "save"):
+            stats.update_stats_from_result(GET, Result(ResultEnum.EXTERNAL_FAILURE, payload="query { getUser(id: 4) { id } }", status_code=400))
+        assert get_chain_rank(_chain(GET), stats, set()) == UNCOVERED
+
+    def test_failures_of_a_same_named_node_of_another_type_do_not_count(self):
+        stats = _stats()
+        stats.failed_nodes = {"Query|getUser": 3}
+        stats.failure_signatures = {"Query|getUser": {"200|[]"}, "Mutation|getUser": {"500|[]"}}
+        assert get_chain_rank(_chain(GET), stats, set()) == SATURATED
+
+
+class TestSchedule:
+    def test_cost_uses_mean_timings_and_skips_objects(self):
+        stats = _stats()
+        stats.node_timings = {"Mutation|createUser": [1.0, 3.0], "Object|User": [5.0]}
+        assert get_chain_cost(_chain(CREATE, USER, GET), stats, default_step_cost=0.5) == 2.5
+
+    def test_uncovered_cheap_chains_run_first(self):
+        stats = _stats()
+        stats.successful_nodes = {"Query|listUsers": 5}
+        stats.node_timings = {"Mutation|createUser": [4.0], "Query|getUser": [1.0], "Query|searchUsers": [0.5]}
+        saturated, expensive, cheap = _chain(LIST), _chain(CREATE, USER, GET), _chain(SEARCH)
+
+        assert schedule_chains([saturated, expensive, cheap], stats, set()) == [cheap, expensive, saturated]
+
+    def test_file_order_is_kept_by_default(self):
+        stats = _stats()
+        stats.successful_nodes = {"Query|listUsers": 5}
+        chains = [_chain(LIST), _chain(SEARCH)]
+        with patch.object(config, "CHAIN_SCHEDULING", "file"):
+            assert schedule_chains(chains, stats, set()) == chains
+
+    def test_ties_keep_file_order(self):
+        chains = [_chain(GET), _chain(LIST), _chain(SEARCH)]
+        assert schedule_chains(chains, _stats(), set()) == chains
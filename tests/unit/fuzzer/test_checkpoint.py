@@ -0,0 +1,151 @@
+"""Unit tests for resumable fuzzing runs (checkpoints and --resume)."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import networkx
+import pytest
+
+from graphqler import config
+from graphqler.chains import Chain, ChainStep
+from graphqler.fuzzer.checkpoint import ChainProgress, Checkpoint, get_chains_digest, load_checkpoint, save_checkpoint
+from graphqler.fuzzer.engine.types import Result, ResultEnum
+from graphqler.fuzzer.fuzzer import Fuzzer
+from graphqler.graph.node import Node
+from graphqler.utils.objects_bucket import ObjectsBucket
+
+
+def _chains(*names: str) -> list[Chain]:
+    return [Chain(steps=[ChainStep(node=Node("Query", name, {}))], id=name) for name in names]
+
+
+class TestCheckpointFile:
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "checkpoint.pkl"
+        save_checkpoint(Checkpoint(chains_digest="abc", phase="islands", phase_nodes=[("Query", "users")], node_index=1), path)
+        checkpoint = load_checkpoint(path)
+        assert checkpoint is not None
+        assert (checkpoint.phase, checkpoint.phase_nodes, checkpoint.node_index) == ("islands", [("Query", "users")], 1)
+
+    def test_missing_or_corrupt_checkpoint_is_ignored(self, tmp_path):
+        path = tmp_path / "checkpoint.pkl"
+        assert load_checkpoint(path) is None
+        path.write_bytes(b"not a pickle")
+        assert load_checkpoint(path) is None
+
+    def test_chains_digest_depends_on_ids_and_steps(self):
+        assert get_chains_digest(_chains("a", "b")) == get_chains_digest(_chains("a", "b"))
+        assert get_chains_digest(_chains("a", "b")) != get_chains_digest(_chains("b", "a"))
+
+
+class TestChainProgress:
+    def test_index_only_moves_past_contiguous_completed_chains(self):
+        chains = _chains("a", "b", "c", "d")
+        progress = ChainProgress(chains, start_index=1)
+        assert progress.complete(chains[2]) == 1
+        assert progress.complete(chains[1]) == 3
+        assert progress.complete(chains[3]) == 4
+
+
+def _make_fuzzer(chains: list[Chain]) -> Fuzzer:
+    fuzzer = Fuzzer.__new__(Fuzzer)
+    fuzzer.chains = chains
+    fuzzer.dependency_graph = networkx.DiGraph()
+    fuzzer.dependency_graph.add_nodes_from(step.node for chain in chains for step in chain.steps)
+    fuzzer.api = None
+    fuzzer.stats = MagicMock()
+    fuzzer.stats.successful_nodes = {}
+    fuzzer.stats.snapshot.return_value = {"number_of_successes": 3}
+    fuzzer.logger = MagicMock()
+    fuzzer.dengine = MagicMock()
+    fuzzer.dengine.nodes_ran = {}
+    fuzzer.dengine.get_nodes_ran.return_value = {}
+    fuzzer.dengine.get_running_detections.return_value = []
+    fuzzer.fengine = MagicMock()
+    fuzzer.fengine.run_minimal_payload.return_value = ({}, Result(ResultEnum.GENERAL_SUCCESS))
+    fuzzer.objects_bucket = ObjectsBucket.__wrapped__(None)
+    fuzzer._dep_blocked_nodes = set()
+    fuzzer._checkpoint = None
+    fuzzer._checkpoint_lock = threading.RLock()
+    fuzzer._last_checkpoint_time = 0.0
+    return fuzzer
+
+
+@pytest.fixture
+def _checkpointing(tmp_path):
+    with (
+        patch.object(config, "OUTPUT_DIRECTORY", str(tmp_path)),
+        patch.object(config, "CHECKPOINT_INTERVAL", 1e-9),
+        patch.object(config, "MAX_FUZZING_ITERATIONS", 1),
+        patch.object(config, "MAX_CONCURRENT_CHAINS", 1),
+        patch.object(config, "SHARE_CHAIN_PREFIXES", False),
+    ):
+        yield
+
+
+def _run_fuzz(fuzzer: Fuzzer, resume: bool, fail_on: Chain | None = None) -> list[Chain]:
+    ran = []
+
+    def _run_chain(chain):
+        if chain is fail_on:
+            raise RuntimeError("interrupted")
+        ran.append(chain)
+
+    with (
+        patch.object(fuzzer, "_Fuzzer__run_chain", side_effect=_run_chain),
+        patch.object(fuzzer, "_Fuzzer__run_nodes"),
+    ):
+        if fail_on is None:
+            fuzzer._Fuzzer__run_fuzz(MagicMock(), resume)
+        else:
+            with pytest.raises(RuntimeError):
+                fuzzer._Fuzzer__run_fuzz(MagicMock(), resume)
+    return ran
+
+
+@pytest.mark.usefixtures("_checkpointing")
+class TestResume:
+    def test_resume_continues_at_the_interrupted_chain(self):
+        chains = _chains("a", "b", "c", "d")
+        first = _make_fuzzer(chains)
+        first._dep_blocked_nodes = {chains[1].steps[0].node}
+        assert _run_fuzz(first, resume=False, fail_on=chains[2]) == chains[:2]
+
+        second = _make_fuzzer(chains)
+        assert _run_fuzz(second, resume=True) == chains[2:]
+        assert second._dep_blocked_nodes == {chains[1].steps[0].node}
+        second.fengine.run_minimal_payload.assert_called_once_with("b", second.objects_bucket, "Query", check_hard_depends_on=False)
+        second.stats.restore.assert_called_once_with({"number_of_successes": 3})
+        assert second.stats.chains_completed == 4
+        assert load_checkpoint().phase == "done"
+
+    def test_detections_still_running_are_run_again_on_resume(self):
+        chains = _chains("a", "b", "c")
+        first = _make_fuzzer(chains)
+        first.dengine.get_running_detections.return_value = [("b", "slow")]
+        _run_fuzz(first, resume=False, fail_on=chains[2])
+        assert load_checkpoint().pending_detections == [("b", "slow")]
+
+        second = _make_fuzzer(chains)
+        _run_fuzz(second, resume=True)
+        node = chains[1].steps[0].node
+        second.dengine.run_detection_on_graphql_object.assert_called_once_with(node, second.objects_bucket, "Query", "slow")
+
+    def test_without_resume_starts_over(self):
+        chains = _chains("a", "b", "c")
+        _run_fuzz(_make_fuzzer(chains), resume=False, fail_on=chains[1])
+        assert _run_fuzz(_make_fuzzer(chains), resume=False) == chains
+
+    def test_checkpoint_from_other_chains_is_ignored(self):
+        _run_fuzz(_make_fuzzer(_chains("a", "b", "c")), resume=False, fail_on=None)
+        chains = _chains("x", "y")
+        fuzzer = _make_fuzzer(chains)
+        assert _run_fuzz(fuzzer, resume=True) == chains
+        fuzzer.stats.restore.assert_not_called()
+
+    def test_completed_run_is_not_repeated(self):
+        chains = _chains("a", "b")
+        _run_fuzz(_make_fuzzer(chains), resume=False)
+        fuzzer = _make_fuzzer(chains)
+        assert _run_fuzz(fuzzer, resume=True) == []
+        fuzzer.dengine.run_detections_on_api.assert_not_called()
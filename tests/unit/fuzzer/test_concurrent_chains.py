@@ -0,0 +1,120 @@
+"""Unit tests for concurrent chain execution in the Fuzzer (MAX_CONCURRENT_CHAINS).
+
+Tests cover:
+- All chains run (once each) with both the sequential and thread-pool executors
+- Chains actually overlap when MAX_CONCURRENT_CHAINS > 1
+- Per-chain log handlers only receive records from their own thread
+- Stats counters stay consistent under concurrent updates
+"""
+
+import logging
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from graphqler import config
+from graphqler.fuzzer.fuzzer import Fuzzer, _ThreadFilter
+from graphqler.utils.stats import Stats
+
+
+def _make_fuzzer():
+    fuzzer = Fuzzer.__new__(Fuzzer)
+    fuzzer.stats = MagicMock()
+    fuzzer.stats.chains_completed = 0
+    fuzzer.logger = MagicMock()
+    return fuzzer
+
+
+def _make_node(name: str, graphql_type: str = "Query"):
+    node = MagicMock()
+    node.name = name
+    node.graphql_type = graphql_type
+    return node
+
+
+class TestRunChains:
+    def test_sequential_runs_every_chain_in_order(self):
+        fuzzer = _make_fuzzer()
+        chains = [MagicMock(id=str(i)) for i in range(5)]
+        ran = []
+
+        with patch.object(config, "MAX_CONCURRENT_CHAINS", 1), patch.object(fuzzer, "_Fuzzer__run_chain", side_effect=ran.append):
+            fuzzer._Fuzzer__run_chains(chains)
+
+        assert ran == chains
+        assert fuzzer.stats.chains_completed == 5
+
+    def test_concurrent_runs_every_chain_once(self):
+        fuzzer = _make_fuzzer()
+        chains = [MagicMock(id=str(i)) for i in range(20)]
+        ran = []
+        lock = threading.Lock()
+
+        def _run(chain):
+            with lock:
+                ran.append(chain)
+
+        with patch.object(config, "MAX_CONCURRENT_CHAINS", 4), patch.object(fuzzer, "_Fuzzer__run_chain", side_effect=_run):
+            fuzzer._Fuzzer__run_chains(chains)
+
+        assert sorted(c.id for c in ran) == sorted(c.id for c in chains)
+        assert fuzzer.stats.chains_completed == 20
+
+    def test_concurrent_chains_overlap(self):
+        fuzzer = _make_fuzzer()
+        chains = [MagicMock(id=str(i)) for i in range(4)]
+        in_flight = 0
+        max_in_flight = 0
+        lock = threading.Lock()
+
+        def _run(_chain):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+
+        with patch.object(config, "MAX_CONCURRENT_CHAINS", 4), patch.object(fuzzer, "_Fuzzer__run_chain", side_effect=_run):
+            fuzzer._Fuzzer__run_chains(chains)
+
+        assert max_in_flight > 1
+
+
+class TestThreadFilter:
+    def test_only_accepts_records_from_owner_thread(self):
+        log_filter = _ThreadFilter(threading.get_ident())
+        own = logging.LogRecord("fuzzer", logging.INFO, __file__, 1, "mine", None, None)
+        assert log_filter.filter(own) is True
+
+        other_records = []
+        worker = threading.Thread(target=lambda: other_records.append(logging.LogRecord("fuzzer", logging.INFO, __file__, 1, "theirs", None, None)))
+        worker.start()
+        worker.join()
+        assert log_filter.filter(other_records[0]) is False
+
+
+class TestStatsConcurrency:
+    def test_counters_are_consistent_under_threads(self):
+        stats_cls = Stats.__wrapped__  # ty: ignore[unresolved-attribute]
+        stats = stats_cls()
+        node = _make_node("users")
+
+        def _hammer():
+            for _ in range(200):
+                stats.add_successful_node(node)
+                stats.add_http_status_code("users", 200)
+                stats.record_node_timing(node, 0.01)
+
+        with patch.object(stats_cls, "save"):
+            threads = [threading.Thread(target=_hammer) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert stats.number_of_successes == 1600
+        assert stats.successful_nodes["Query|users"] == 1600
+        assert stats.http_status_codes["200"]["users"] == 1600
+        assert len(stats.node_timings["Query|users"]) == 1600
@@ -0,0 +1,123 @@
+"""Unit tests for distributed fuzzing (workers sharded by chain, merged by a coordinator)."""
+
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from graphqler import config
+from graphqler.fuzzer.distributed import merge_worker_results, read_worker_reports, shard, write_worker_report
+from graphqler.fuzzer.engine.types import Result, ResultEnum
+from graphqler.utils.stats import Stats
+
+
+def _stats() -> Stats:
+    return Stats.__wrapped__()  # ty: ignore[unresolved-attribute]
+
+
+class TestShard:
+    def test_shards_are_disjoint_and_cover_all_items(self):
+        items = list(range(7))
+        shards = []
+        for worker_index in range(3):
+            with patch.object(config, "NUM_WORKERS", 3), patch.object(config, "WORKER_INDEX", worker_index):
+                shards.append(shard(items))
+        assert shards == [[0, 3, 6], [1, 4], [2, 5]]
+
+    def test_single_worker_gets_everything(self):
+        assert shard([1, 2, 3]) == [1, 2, 3]
+
+
+class TestStatsMerge:
+    def test_counts_are_summed_and_results_unioned(self):
+        first, second = _stats(), _stats()
+        for stats, status_code in ((first, 200), (second, 500)):
+            stats.http_status_codes = {"200": {"minimal": 2}}
+            stats.successful_nodes = {"Query|users": 1}
+            stats.results = {"users": {Result(ResultEnum.GENERAL_SUCCESS, status_code=status_code)}}
+            stats.number_of_successes = 1
+            stats.number_of_queries = 4
+        second.add_vulnerability("SQLi", "users", is_vulnerable=True, payload="' OR 1=1")
+
+        merged = _stats()
+        merged.merge(first.snapshot())
+        merged.merge(second.snapshot())
+        assert merged.http_status_codes == {"200": {"minimal": 4}}
+        assert merged.successful_nodes == {"Query|users": 2}
+        assert len(merged.results["users"]) == 2
+        assert merged.number_of_successes == 2
+        assert merged.number_of_queries == 4
+        assert merged.vulnerabilities["SQLi"]["users"]["is_vulnerable"]
+
+
+def _write_report(tmp_path: Path, worker_index: int, stats: Stats, detections: dict[str, str], chains_digest: str = "abc", finished: bool = True, exited: bool = True):
+    output_dir = tmp_path / f"worker{worker_index}"
+    for relative_path, contents in detections.items():
+        path = output_dir / config.DETECTIONS_DIR_NAME / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(contents)
+    with (
+        patch.object(config, "OUTPUT_DIRECTORY", str(output_dir)),
+        patch.object(config, "NUM_WORKERS", 2),
+        patch.object(config, "WORKER_INDEX", worker_index),
+        patch.object(config, "SHARED_DIR", str(tmp_path / "shared")),
+    ):
+        write_worker_report(stats, chains_digest, finished, exited)
+
+
+class TestCoordinator:
+    def test_merges_workers_stats_and_detections(self, tmp_path):
+        first, second = _stats(), _stats()
+        first.successful_nodes = {"Query|users": 1}
+        second.successful_nodes = {"Query|posts": 1}
+        _write_report(tmp_path, 0, first, {
+            "SQLi/users/raw_log.txt": "first\n",
+            "SQLi/users/summary.txt": "Status        : CONFIRMED\n",
+        })
+        _write_report(tmp_path, 1, second, {
+            "SQLi/users/raw_log.txt": "second\n",
+            "SQLi/users/summary.txt": "Status        : POTENTIAL\n",
+        })
+
+        merged_dir = tmp_path / "merged"
+        with patch.object(config, "OUTPUT_DIRECTORY", str(merged_dir)), patch("graphqler.fuzzer.distributed.Stats", return_value=_stats()):
+            merged = merge_worker_results(tmp_path / "shared", 2, timeout=0, since=0)
+        assert merged.successful_nodes == {"Query|users": 1, "Query|posts": 1}
+        detection_dir = merged_dir / config.DETECTIONS_DIR_NAME / "SQLi" / "users"
+        assert (detection_dir / "raw_log.txt").read_text() == "first\nsecond\n"
+        assert "CONFIRMED" in (detection_dir / "summary.txt").read_text()
+
+    def test_waits_only_until_the_timeout(self, tmp_path):
+        _write_report(tmp_path, 0, _stats(), {}, finished=False, exited=False)
+        reports = read_worker_reports(tmp_path / "shared", 2, timeout=0)
+        assert list(reports) == [0]
+        assert not reports[0].finished
+
+    def test_stops_waiting_once_every_worker_exited(self, tmp_path):
+        _write_report(tmp_path, 0, _stats(), {})
+        _write_report(tmp_path, 1, _stats(), {}, finished=False)  # Stopped at MAX_TIME
+        start = time.time()
+        reports = read_worker_reports(tmp_path / "shared", 2, timeout=60, poll_interval=0.01)
+        assert time.time() - start < 5
+        assert reports[0].finished and not reports[1].finished
+
+    def test_reports_from_an_earlier_campaign_are_ignored(self, tmp_path):
+        _write_report(tmp_path, 0, _stats(), {})
+        _write_report(tmp_path, 1, _stats(), {})
+        reports = read_worker_reports(tmp_path / "shared", 2, timeout=0, since=time.time() + 1)
+        assert reports == {}
+
+    def test_waits_for_a_worker_that_only_reported_its_start(self, tmp_path):
+        _write_report(tmp_path, 0, _stats(), {})
+        _write_report(tmp_path, 1, _stats(), {}, finished=False, exited=False)
+        start = time.time()
+        reports = read_worker_reports(tmp_path / "shared", 2, timeout=0.2, poll_interval=0.01)
+        assert time.time() - start >= 0.2
+        assert not reports[1].exited
+
+    def test_workers_with_different_chains_are_refused(self, tmp_path):
+        _write_report(tmp_path, 0, _stats(), {}, chains_digest="abc")
+        _write_report(tmp_path, 1, _stats(), {}, chains_digest="def")
+        with patch.object(config, "OUTPUT_DIRECTORY", str(tmp_path / "merged")), pytest.raises(ValueError):
+            merge_worker_results(tmp_path / "shared", 2, timeout=0, since=0)
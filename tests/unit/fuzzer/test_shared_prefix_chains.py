@@ -0,0 +1,116 @@
+"""Unit tests for prefix-sharing chain execution (SHARE_CHAIN_PREFIXES)."""
+
+from unittest.mock import MagicMock, patch
+
+from graphqler import config
+from graphqler.chains import Chain, ChainStep, build_prefix_trie
+from graphqler.fuzzer.engine.types import Result, ResultEnum
+from graphqler.fuzzer.fuzzer import Fuzzer
+from graphqler.graph.node import Node
+
+
+def _node(name: str, graphql_type: str = "Query", mutation_type: str | None = None) -> Node:
+    node = Node(graphql_type, name, {})
+    node.mutation_type = mutation_type
+    return node
+
+
+def _chain(*nodes: Node, profiles: list[str] | None = None) -> Chain:
+    profiles = profiles or ["primary"] * len(nodes)
+    return Chain(steps=[ChainStep(node=n, profile_name=p) for n, p in zip(nodes, profiles)])
+
+
+def _make_fuzzer():
+    fuzzer = Fuzzer.__new__(Fuzzer)
+    fuzzer.api = MagicMock()
+    fuzzer.stats = MagicMock()
+    fuzzer.logger = MagicMock()
+    fuzzer._dep_blocked_nodes = set()
+    return fuzzer
+
+
+CREATE = _node("createUser", "Mutation", "CREATE")
+USER = _node("User", "Object")
+GET = _node("getUser")
+LIST = _node("listUsers")
+DELETE = _node("deleteUser", "Mutation", "DELETE")
+
+
+class TestShareablePrefix:
+    def test_last_primary_step_is_never_shared(self):
+        assert Fuzzer._shareable_prefix_length(_chain(CREATE, USER, GET)) == 2
+        assert Fuzzer._shareable_prefix_length(_chain(GET)) == 0
+
+    def test_stops_before_non_primary_and_pre_delete_steps(self):
+        idor = _chain(CREATE, USER, GET, GET, profiles=["primary", "primary", "primary", "secondary"])
+        assert Fuzzer._shareable_prefix_length(idor) == 2
+        uaf = _chain(CREATE, USER, DELETE, GET, profiles=["primary", "primary", "primary", "post_delete"])
+        assert Fuzzer._shareable_prefix_length(uaf) == 2
+
+
+class TestPrefixTrie:
+    def test_common_prefixes_are_merged(self):
+        chains = [_chain(CREATE, USER, GET), _chain(CREATE, USER, LIST), _chain(CREATE, DELETE)]
+        root = build_prefix_trie(chains, [2, 2, 1])
+
+        assert len(root.children) == 1
+        create_node = next(iter(root.children.values()))
+        assert create_node.chains == [chains[2]]
+        user_node = next(iter(create_node.children.values()))
+        assert user_node.depth == 2
+        assert user_node.chains == chains[:2]
+        assert root.num_chains() == 3
+
+
+class TestRunWithSharedPrefixes:
+    def _run(self, fuzzer, chains, evaluate):
+        calls = []
+
+        def _record_chain(chain, objects_bucket=None, prefix_results=None, start_index=0):
+            calls.append((chain, objects_bucket, list(prefix_results or []), start_index))
+
+        with (
+            patch.object(config, "SHARE_CHAIN_PREFIXES", True),
+            patch.object(config, "MAX_CONCURRENT_CHAINS", 1),
+            patch.object(fuzzer, "_Fuzzer__evaluate", side_effect=evaluate) as evaluate_mock,
+            patch.object(fuzzer, "_Fuzzer__run_chain", side_effect=_record_chain),
+        ):
+            fuzzer._Fuzzer__run_chains(chains)
+        return calls, evaluate_mock
+
+    def test_shared_prefix_runs_once_and_forks_bucket(self):
+        fuzzer = _make_fuzzer()
+        chains = [_chain(CREATE, USER, GET), _chain(CREATE, USER, LIST), _chain(GET)]
+
+        def _evaluate(node, visit_path, objects_bucket=None):
+            objects_bucket.put_object_in_bucket("User", {"id": "1"})
+            return [], Result(ResultEnum.GENERAL_SUCCESS)
+
+        calls, evaluate = self._run(fuzzer, chains, _evaluate)
+
+        # createUser and User are run once for both chains that start with them
+        assert [c.args[0].name for c in evaluate.call_args_list] == ["createUser", "User"]
+        by_chain = {id(chain): (bucket, results, start) for chain, bucket, results, start in calls}
+        assert len(calls) == 3
+        for chain in chains[:2]:
+            bucket, results, start = by_chain[id(chain)]
+            assert start == 2
+            assert [step.node.name for step, _ in results] == ["createUser", "User"]
+            assert bucket.get_num_objects() == 1
+        assert by_chain[id(chains[0])][0] is not by_chain[id(chains[1])][0]
+        assert by_chain[id(chains[2])][2] == 0
+        assert fuzzer.stats.add_completed_chain.call_count == 3
+
+    def test_failed_shared_step_stops_every_chain_below_it(self):
+        fuzzer = _make_fuzzer()
+        chains = [_chain(CREATE, USER, GET), _chain(CREATE, USER, LIST)]
+
+        def _evaluate(node, visit_path, objects_bucket=None):
+            return [], Result(ResultEnum.EXTERNAL_FAILURE)
+
+        calls, evaluate = self._run(fuzzer, chains, _evaluate)
+
+        assert evaluate.call_count == 1
+        assert [start for _, _, _, start in calls] == [3, 3]
+        assert fuzzer._dep_blocked_nodes == {GET, LIST}
+        assert fuzzer.stats.add_completed_chain.call_count == 2
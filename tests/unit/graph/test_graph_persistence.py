@@ -0,0 +1,77 @@
+"""Unit tests for saving / reloading the dependency graph built by GraphGenerator."""
+
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from graphqler import config
+from graphqler.graph import GraphGenerator
+from graphqler.utils.compiled_cache import clear_memory_cache
+
+QUERIES = {
+    "users": {"name": "users", "hardDependsOn": {}, "softDependsOn": {}},
+    "user": {"name": "user", "hardDependsOn": {"id": "User"}, "softDependsOn": {}},
+}
+OBJECTS = {"User": {"name": "User", "associatedQueries": ["users"], "associatedMutatations": []}}
+MUTATIONS = {
+    "deleteUser": {"name": "deleteUser", "mutationType": "DELETE", "hardDependsOn": {"id": "User"}, "softDependsOn": {}},
+}
+
+
+def _write_compiled(path, queries=QUERIES):
+    compiled_dir = path / config.COMPILED_DIR_NAME
+    compiled_dir.mkdir(parents=True, exist_ok=True)
+    (path / config.COMPILED_QUERIES_FILE_NAME).write_text(yaml.dump(queries))
+    (path / config.COMPILED_OBJECTS_FILE_NAME).write_text(yaml.dump(OBJECTS))
+    (path / config.COMPILED_MUTATIONS_FILE_NAME).write_text(yaml.dump(MUTATIONS))
+    (path / config.COMPILED_SUBSCRIPTIONS_FILE_NAME).write_text(yaml.dump({}))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_compiled_cache():
+    clear_memory_cache()
+    yield
+    clear_memory_cache()
+
+
+def test_graph_is_saved_and_reloaded_without_rebuilding(tmp_path):
+    _write_compiled(tmp_path)
+    graph = GraphGenerator(str(tmp_path)).get_dependency_graph()
+    assert (tmp_path / config.DEPENDENCY_GRAPH_FILE_NAME).exists()
+
+    with patch.object(GraphGenerator, "run") as run:
+        reloaded = GraphGenerator(str(tmp_path)).get_dependency_graph()
+    run.assert_not_called()
+
+    assert sorted(n.name for n in reloaded.nodes) == sorted(n.name for n in graph.nodes)
+    assert len(reloaded.edges) == len(graph.edges)
+    delete_node = next(n for n in reloaded.nodes if n.name == "deleteUser")
+    assert delete_node.mutation_type == "DELETE"
+
+
+def test_changed_compiled_files_trigger_a_rebuild(tmp_path):
+    _write_compiled(tmp_path)
+    GraphGenerator(str(tmp_path)).get_dependency_graph()
+
+    _write_compiled(tmp_path, queries={**QUERIES, "posts": {"name": "posts", "hardDependsOn": {}, "softDependsOn": {}}})
+    graph = GraphGenerator(str(tmp_path)).get_dependency_graph()
+    assert "posts" in {n.name for n in graph.nodes}
+
+
+def test_config_that_changes_the_graph_invalidates_it(tmp_path):
+    _write_compiled(tmp_path)
+    GraphGenerator(str(tmp_path)).get_dependency_graph()
+    with patch.object(config, "SKIP_SUBSCRIPTIONS", not config.SKIP_SUBSCRIPTIONS):
+        assert GraphGenerator(str(tmp_path)).load_dependency_graph() is None
+
+
+def test_corrupt_pickle_fails_integrity_check(tmp_path):
+    _write_compiled(tmp_path)
+    GraphGenerator(str(tmp_path)).get_dependency_graph()
+    graph_path = tmp_path / config.DEPENDENCY_GRAPH_FILE_NAME
+    graph_path.write_bytes(graph_path.read_bytes()[:-10])
+
+    generator = GraphGenerator(str(tmp_path))
+    assert generator.load_dependency_graph() is None
+    assert len(generator.get_dependency_graph().nodes) == 4
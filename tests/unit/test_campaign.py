@@ -0,0 +1,103 @@
+"""Unit tests for multi-target campaigns."""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from graphqler import config
+from graphqler.campaign import CampaignTarget, load_campaign, run_campaign, run_target
+
+
+def _fake_compile_and_fuzz(path: str, url: str) -> dict:
+    stats = MagicMock()
+    stats.get_coverage_rate.return_value = (3, 4, 0.75)
+    stats.number_of_successes = 3
+    stats.number_of_failures = 1
+    stats.vulnerabilities = {"SQLi": {"users": {"is_vulnerable": True, "potentially_vulnerable": True}}} if "users" in url else {}
+    # Report the config the target ran with, to check it ran in its own context
+    stats.seen_config = (config.OUTPUT_DIRECTORY, config.MAX_TIME, config.AUTHORIZATION)
+    return {"stats": stats}
+
+
+class TestLoadCampaign:
+    def test_defaults(self, tmp_path):
+        campaign = load_campaign({
+            "output": str(tmp_path),
+            "targets": [{"url": "http://users.internal/graphql", "config": {"MAX_TIME": 60}}, {"url": "http://posts.internal/graphql", "name": "posts"}],
+        })
+        users, posts = campaign.targets
+        assert users.name == "users.internal_graphql"
+        assert users.path == str(tmp_path / "users.internal_graphql")
+        assert users.max_time == 60
+        assert posts.max_time == config.MAX_TIME
+        assert campaign.processes == config.CAMPAIGN_PROCESSES
+
+    def test_targets_must_have_distinct_paths(self):
+        with pytest.raises(ValueError):
+            load_campaign({"targets": [{"url": "http://a/graphql", "path": "out"}, {"url": "http://b/graphql", "path": "out"}]})
+
+
+class TestRunTarget:
+    def test_runs_in_its_own_context(self, tmp_path):
+        target = CampaignTarget(url="http://users.internal/graphql", path=str(tmp_path / "users"), name="users", max_time=600, config={"AUTHORIZATION": "Bearer a"})
+        results = []
+
+        def _compile_and_fuzz(path, url):
+            results.append(_fake_compile_and_fuzz(path, url))
+            return results[-1]
+
+        with patch("graphqler.campaign.compile_and_fuzz", side_effect=_compile_and_fuzz):
+            summary = run_target(target, deadline=time.time() + 60)
+        assert summary["status"] == "completed"
+        assert summary["max_time"] <= 60  # Capped by the global budget
+        assert results[0]["stats"].seen_config == (str(tmp_path / "users"), summary["max_time"], "Bearer a")
+        assert config.AUTHORIZATION != "Bearer a"
+        assert summary["vulnerabilities"] == {"SQLi": ["users"]}
+
+    def test_config_max_time_and_output_directory_are_overridden(self, tmp_path):
+        target = load_campaign({
+            "output": str(tmp_path),
+            "targets": [{"url": "http://users.internal/graphql", "name": "users", "config": {"MAX_TIME": 30, "OUTPUT_DIRECTORY": "elsewhere"}}],
+        }).targets[0]
+        results = []
+
+        def _compile_and_fuzz(path, url):
+            results.append(_fake_compile_and_fuzz(path, url))
+            return results[-1]
+
+        with patch("graphqler.campaign.compile_and_fuzz", side_effect=_compile_and_fuzz):
+            summary = run_target(target, deadline=time.time() + 600)
+        assert summary["status"] == "completed"
+        assert summary["max_time"] == 30
+        assert results[0]["stats"].seen_config[:2] == (str(tmp_path / "users"), 30)
+
+    def test_skipped_when_the_budget_ran_out(self, tmp_path):
+        target = CampaignTarget(url="http://a/graphql", path=str(tmp_path), name="a", max_time=600)
+        with patch("graphqler.campaign.compile_and_fuzz") as compile_and_fuzz:
+            assert run_target(target, deadline=time.time() - 1)["status"] == "skipped"
+        compile_and_fuzz.assert_not_called()
+
+
+class TestRunCampaign:
+    def test_writes_merged_summary_in_manifest_order(self, tmp_path):
+        campaign = load_campaign({
+            "output": str(tmp_path),
+            "targets": [{"url": "http://users.internal/graphql"}, {"url": "http://broken.internal/graphql"}, {"url": "http://posts.internal/graphql"}],
+        })
+
+        def _compile_and_fuzz(path, url):
+            if "broken" in url:
+                raise ConnectionError("refused")
+            return _fake_compile_and_fuzz(path, url)
+
+        with patch("graphqler.campaign.ProcessPoolExecutor", ThreadPoolExecutor), patch("graphqler.campaign.compile_and_fuzz", side_effect=_compile_and_fuzz):
+            summary = run_campaign(campaign)
+
+        assert [target["status"] for target in summary["targets"]] == ["completed", "error", "completed"]
+        assert summary["totals"]["covered"] == 6
+        assert summary["totals"]["confirmed_vulnerabilities"] == 1
+        with open(tmp_path / config.CAMPAIGN_SUMMARY_FILE_NAME) as f:
+            assert json.load(f)["totals"] == summary["totals"]
@@ -0,0 +1,115 @@
+"""Unit tests for the asyncio-based HTTP transport (async_request_utils)."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from graphqler import config
+from graphqler.utils import async_request_utils, plugins_handler
+from graphqler.utils.protocols.request_utils_protocol import RequestUtilsProtocol
+
+
+def _mock_client(handler):
+    """Returns a create_new_session replacement that serves requests with *handler*."""
+    def _create():
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return _create
+
+
+@pytest.fixture(autouse=True)
+def _fresh_transport():
+    async_request_utils.reset_session()
+    async_request_utils._host_semaphores.clear()
+    yield
+    async_request_utils.reset_session()
+    async_request_utils._host_semaphores.clear()
+
+
+def test_send_graphql_request_parses_response():
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["body"] = json.loads(request.content)
+        seen["auth"] = request.headers.get("Authorization")
+        return httpx.Response(200, json={"data": {"hello": "world"}})
+
+    with patch.object(async_request_utils, "create_new_session", _mock_client(handler)), patch.object(config, "AUTHORIZATION", "Bearer primary"):
+        graphql_response, response = async_request_utils.send_graphql_request("http://example.com/graphql", "query { hello }")
+
+    assert graphql_response == {"data": {"hello": "world"}}
+    assert response.status_code == 200
+    assert seen["body"] == {"query": "query { hello }"}
+    assert seen["auth"] == "Bearer primary"
+
+
+def test_send_with_headers_does_not_use_primary_auth():
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["auth"] = request.headers.get("Authorization")
+        return httpx.Response(200, json={"data": {}})
+
+    with patch.object(async_request_utils, "create_new_session", _mock_client(handler)), patch.object(config, "AUTHORIZATION", "Bearer primary"):
+        async_request_utils.send_graphql_request_with_headers("http://example.com/graphql", "query { a }", {})
+        assert seen["auth"] is None
+        async_request_utils.send_graphql_request_with_headers("http://example.com/graphql", "query { a }", {"Authorization": "Bearer secondary"})
+        assert seen["auth"] == "Bearer secondary"
+
+
+def test_non_json_response_is_wrapped_as_error():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500, text="Internal Server Error")
+
+    with patch.object(async_request_utils, "create_new_session", _mock_client(handler)):
+        graphql_response, response = async_request_utils.send_graphql_request("http://example.com/graphql", "query { a }")
+
+    assert response.status_code == 500
+    assert graphql_response == {"errors": ["Internal Server Error"]}
+
+
+def test_concurrent_requests_respect_per_host_limit():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        return httpx.Response(200, json={"data": {"n": json.loads(request.content)["query"]}})
+
+    payloads = [f"query {{ n{i} }}" for i in range(12)]
+    with (
+        patch.object(async_request_utils, "create_new_session", _mock_client(handler)),
+        patch.object(config, "ASYNC_MAX_CONNECTIONS_PER_HOST", 3),
+        patch.object(config, "TIME_BETWEEN_REQUESTS", 0),
+    ):
+        results = async_request_utils.send_graphql_requests_concurrently("http://example.com/graphql", payloads)
+
+    assert [r[0]["data"]["n"] for r in results] == payloads
+    assert 1 < max_in_flight <= 3
+
+
+def test_run_coroutine_rejects_calls_from_loop_thread():
+    async def _nested():
+        return async_request_utils.run_coroutine(asyncio.sleep(0))
+
+    with pytest.raises(RuntimeError):
+        async_request_utils.run_coroutine(_nested())
+
+
+def test_get_request_utils_selects_async_transport():
+    with patch.object(config, "REQUEST_TRANSPORT", "async"), patch("graphqler.utils.plugins_handler.does_plugin_exist", return_value=False):
+        utils = plugins_handler.get_request_utils()
+    assert utils is async_request_utils
+    assert isinstance(utils, RequestUtilsProtocol)
+
+
+def test_get_request_utils_defaults_to_sync_transport():
+    with patch("graphqler.utils.plugins_handler.does_plugin_exist", return_value=False):
+        utils = plugins_handler.get_request_utils()
+    assert utils is plugins_handler.POSSIBLE_PLUGINS["request_utils.py"]
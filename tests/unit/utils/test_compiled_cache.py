@@ -0,0 +1,73 @@
+"""Unit tests for the binary cache of compiled YAML artifacts."""
+
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from graphqler.utils import compiled_cache
+from graphqler.utils.compiled_cache import clear_memory_cache, get_cache_path, read_compiled_yaml
+
+
+@pytest.fixture(autouse=True)
+def _fresh_memory_cache():
+    clear_memory_cache()
+    yield
+    clear_memory_cache()
+
+
+def _write_yaml(path, data):
+    path.write_text(yaml.dump(data))
+    return path
+
+
+def test_first_read_parses_yaml_and_writes_cache(tmp_path):
+    yaml_path = _write_yaml(tmp_path / "compiled_queries.yml", {"users": {"name": "users"}})
+    assert read_compiled_yaml(yaml_path) == {"users": {"name": "users"}}
+    assert get_cache_path(yaml_path).exists()
+
+
+def test_cache_file_is_used_by_a_new_process(tmp_path):
+    yaml_path = _write_yaml(tmp_path / "compiled_queries.yml", {"users": {"name": "users"}})
+    read_compiled_yaml(yaml_path)
+    clear_memory_cache()  # Simulates a new process
+
+    with patch.object(compiled_cache.yaml, "safe_load") as safe_load:
+        assert read_compiled_yaml(yaml_path) == {"users": {"name": "users"}}
+    safe_load.assert_not_called()
+
+
+def test_memory_cache_returns_independent_copies(tmp_path):
+    yaml_path = _write_yaml(tmp_path / "compiled_objects.yml", {"User": {"fields": []}})
+    first = read_compiled_yaml(yaml_path)
+    first["User"]["fields"].append("mutated")
+
+    with patch.object(compiled_cache.yaml, "safe_load") as safe_load:
+        assert read_compiled_yaml(yaml_path) == {"User": {"fields": []}}
+    safe_load.assert_not_called()
+
+
+def test_changed_yaml_invalidates_cache(tmp_path):
+    yaml_path = _write_yaml(tmp_path / "compiled_queries.yml", {"users": {}})
+    read_compiled_yaml(yaml_path)
+    _write_yaml(yaml_path, {"posts": {}})
+    assert read_compiled_yaml(yaml_path) == {"posts": {}}
+
+    clear_memory_cache()
+    assert read_compiled_yaml(yaml_path) == {"posts": {}}
+
+
+def test_corrupt_cache_falls_back_to_yaml(tmp_path):
+    yaml_path = _write_yaml(tmp_path / "compiled_queries.yml", {"users": {}})
+    read_compiled_yaml(yaml_path)
+    clear_memory_cache()
+    cache_path = get_cache_path(yaml_path)
+    cache_path.write_bytes(cache_path.read_bytes().splitlines()[0] + b"\nnot a pickle")
+
+    assert read_compiled_yaml(yaml_path) == {"users": {}}
+
+
+def test_empty_yaml_returns_none(tmp_path):
+    yaml_path = tmp_path / "compiled_subscriptions.yml"
+    yaml_path.write_text("")
+    assert read_compiled_yaml(yaml_path) is None
@@ -0,0 +1,210 @@
+"""Unit tests for the hash-indexed object storage of ObjectsBucket."""
+
+import random
+from unittest.mock import MagicMock
+
+import cloudpickle as pickle
+
+from graphqler.utils.objects_bucket import ObjectsBucket, ObjectStore, ScalarPool
+
+
+def _build_bucket():
+    real_cls = ObjectsBucket.__wrapped__  # type: ignore
+    bucket = real_cls.__new__(real_cls)
+    bucket.api = MagicMock()
+    bucket.objects = {}
+    bucket.scalars = {}
+    bucket.pickle_save_path = bucket.text_save_path = None
+    return bucket
+
+
+class TestObjectStore:
+    def test_duplicates_are_ignored_regardless_of_key_order(self):
+        store = ObjectStore()
+        assert store.add({"id": "1", "name": "France"}) is True
+        assert store.add({"name": "France", "id": "1"}) is False
+        assert store.add({"id": "2", "name": "Germany"}) is True
+        assert len(store) == 2
+        assert {"name": "France", "id": "1"} in store
+
+    def test_behaves_like_a_list(self):
+        store = ObjectStore([{"id": 1}, {"id": 2}, {"id": 3}])
+        assert store[0] == {"id": 1}
+        assert store[:2] == [{"id": 1}, {"id": 2}]
+        assert store == [{"id": 1}, {"id": 2}, {"id": 3}]
+        assert random.choice(store) in store
+
+    def test_remove_keeps_order_and_indexes(self):
+        store = ObjectStore([{"id": 1}, {"id": 2}, {"id": 3}])
+        store.remove({"id": 2})
+        assert list(store) == [{"id": 1}, {"id": 3}]
+        assert store.index_of_id(3) == 1
+        assert store.index_of_id(2) is None
+        assert store.add({"id": 2}) is True
+
+    def test_index_of_id_checks_both_id_fields(self):
+        store = ObjectStore([{"name": "a"}, {"ID": 7, "name": "b"}, {"id": 7, "name": "c"}])
+        assert store.index_of_id(7) == 1
+        assert store.index_of_id(8) is None
+
+    def test_replace_updates_indexes(self):
+        store = ObjectStore([{"id": 1, "name": "old"}, {"id": 2, "name": "other"}])
+        store.replace(0, {"id": 1, "name": "new"})
+        assert store[0] == {"id": 1, "name": "new"}
+        assert {"id": 1, "name": "old"} not in store
+        assert store.index_of_id(1) == 0
+
+    def test_replace_with_existing_object_drops_the_duplicate(self):
+        store = ObjectStore([{"id": 1, "name": "old"}, {"id": 1, "name": "new"}])
+        store.replace(0, {"id": 1, "name": "new"})
+        assert list(store) == [{"id": 1, "name": "new"}]
+
+    def test_random_field_value_only_samples_non_null_values(self):
+        store = ObjectStore([{"id": i, "code": None} for i in range(20)] + [{"id": 99, "code": "FR"}])
+        assert all(store.random_field_value("code") == "FR" for _ in range(10))
+        assert store.random_field_value("missing") is None
+
+    def test_random_field_value_searches_nested_objects(self):
+        store = ObjectStore([{"id": 1, "owner": {"email": "a@b.c"}}])
+        assert store.random_field_value("email") == "a@b.c"
+
+    def test_field_index_is_maintained_incrementally(self):
+        store = ObjectStore([{"id": 1, "code": "FR"}])
+        assert store.random_field_value("code") == "FR"
+
+        store.add({"id": 2, "code": "DE"})
+        store.remove({"id": 1, "code": "FR"})
+        assert store.random_field_value("code") == "DE"
+
+        store.replace(0, {"id": 2, "code": None})
+        assert store.random_field_value("code") is None
+
+
+class TestObjectsBucketStorage:
+    def test_put_object_dedups(self):
+        bucket = _build_bucket()
+        for _ in range(3):
+            bucket.put_object_in_bucket("Country", {"id": "1", "name": "France"})
+        assert bucket.get_num_objects() == 1
+        assert bucket.get_random_object("Country") == {"id": "1", "name": "France"}
+
+    def test_update_replaces_object_with_same_id(self):
+        bucket = _build_bucket()
+        bucket.api.get_operation.return_value = {"output": {"kind": "OBJECT", "name": "Country", "type": "Country", "ofType": None}}
+        bucket.put_object_in_bucket("Country", {"id": "1", "name": "France"})
+        bucket.update_object_in_bucket({"updateCountry": {"id": "1", "name": "Republic of France"}})
+        assert list(bucket.objects["Country"]) == [{"id": "1", "name": "Republic of France"}]
+
+    def test_old_pickles_with_plain_lists_are_upgraded(self):
+        bucket = _build_bucket()
+        bucket.api = None
+        bucket.objects = {"Country": [{"id": "1"}, {"id": "2"}]}
+        restored = pickle.loads(pickle.dumps(bucket))
+        assert isinstance(restored.objects["Country"], ObjectStore)
+        assert restored.objects["Country"].index_of_id("2") == 1
+
+    def test_get_random_object_field_value(self):
+        bucket = _build_bucket()
+        bucket.put_object_in_bucket("Country", {"id": "1", "name": None})
+        bucket.put_object_in_bucket("Country", {"id": "2", "name": "Germany"})
+        assert bucket.get_random_object_field_value("Country", "name") == "Germany"
+        assert bucket.get_random_object_field_value("Country", "capital") is None
+
+
+class TestCopyOnWriteClone:
+    def test_clone_shares_segments_until_written(self):
+        bucket = _build_bucket()
+        bucket.put_object_in_bucket("Country", {"id": "1"})
+        bucket.put_object_in_bucket("City", {"id": "10"})
+        bucket.put_scalar_in_bucket("code", "String", "FR")
+
+        snapshot = bucket.clone()
+        assert snapshot.objects["Country"] is bucket.objects["Country"]
+        assert snapshot.scalars["code"] is bucket.scalars["code"]
+
+        bucket.delete_object_from_bucket("Country", {"id": "1"})
+        bucket.put_scalar_in_bucket("code", "String", "DE")
+
+        assert list(snapshot.objects["Country"]) == [{"id": "1"}]
+        assert snapshot.scalars["code"]["values"] == {"FR"}
+        assert list(bucket.objects["Country"]) == []
+        assert bucket.scalars["code"]["values"] == {"FR", "DE"}
+        # Untouched segments stay shared
+        assert snapshot.objects["City"] is bucket.objects["City"]
+
+    def test_writes_to_clone_do_not_leak_into_original(self):
+        bucket = _build_bucket()
+        bucket.put_object_in_bucket("Country", {"id": "1", "code": "FR"})
+        assert bucket.get_random_object_field_value("Country", "code") == "FR"
+
+        snapshot = bucket.clone()
+        snapshot.put_object_in_bucket("Country", {"id": "2", "code": "DE"})
+        snapshot.delete_object_from_bucket("Country", {"id": "1", "code": "FR"})
+
+        assert list(bucket.objects["Country"]) == [{"id": "1", "code": "FR"}]
+        assert bucket.get_random_object_field_value("Country", "code") == "FR"
+        assert snapshot.get_random_object_field_value("Country", "code") == "DE"
+
+    def test_duplicate_put_does_not_copy_shared_store(self):
+        bucket = _build_bucket()
+        bucket.put_object_in_bucket("Country", {"id": "1"})
+        snapshot = bucket.clone()
+        bucket.put_object_in_bucket("Country", {"id": "1"})
+        assert snapshot.objects["Country"] is bucket.objects["Country"]
+
+    def test_unshared_clone_copies_every_store(self):
+        bucket = _build_bucket()
+        bucket.put_object_in_bucket("Country", {"id": "1", "code": "FR"})
+        bucket.put_scalar_in_bucket("code", "String", "FR")
+
+        snapshot = bucket.clone(shared=False)
+        assert snapshot.objects["Country"] is not bucket.objects["Country"]
+        assert snapshot.scalars["code"]["values"] is not bucket.scalars["code"]["values"]
+
+        # Reading builds the field pool of the clone's own store only
+        assert snapshot.get_random_object_field_value("Country", "code") == "FR"
+        assert bucket.objects["Country"]._field_pools == {}
+        snapshot.put_scalar_in_bucket("code", "String", "DE")
+        assert bucket.scalars["code"]["values"] == {"FR"}
+        assert bucket.get_random_scalar_from_bucket_by_type("String") == "FR"
+
+
+class TestScalarPools:
+    def test_scalar_pool_is_a_set_with_o1_sampling(self):
+        pool = ScalarPool(["a", "b", "a"])
+        assert len(pool) == 2
+        assert pool == {"a", "b"}
+        assert pool.random() in {"a", "b"}
+
+    def test_by_type_samples_across_all_names(self):
+        bucket = _build_bucket()
+        bucket.put_scalar_in_bucket("first", "String", "only-first")
+        for i in range(50):
+            bucket.put_scalar_in_bucket("second", "String", f"v{i}")
+        bucket.put_scalar_in_bucket("count", "Int", 3)
+
+        seen = {bucket.get_random_scalar_from_bucket_by_type("String") for _ in range(200)}
+        assert len(seen) > 1
+        assert bucket.get_random_scalar_from_bucket_by_type("Int") == 3
+        assert bucket.get_random_scalar_from_bucket_by_type("ID") == ""
+
+    def test_by_name(self):
+        bucket = _build_bucket()
+        bucket.put_scalar_in_bucket("code", "String", "FR")
+        assert bucket.get_random_scalar_from_bucket_by_name("code") == "FR"
+        assert bucket.get_random_scalar_from_bucket_by_name("missing") == ""
+
+    def test_type_index_is_rebuilt_for_old_pickles(self):
+        bucket = _build_bucket()
+        bucket.api = None
+        bucket.scalars = {"code": {"type": "String", "values": {"FR", "DE"}}}
+        restored = pickle.loads(pickle.dumps(bucket))
+        assert isinstance(restored.scalars["code"]["values"], ScalarPool)
+        assert restored.get_random_scalar_from_bucket_by_type("String") in {"FR", "DE"}
+
+    def test_type_pools_are_copy_on_write(self):
+        bucket = _build_bucket()
+        bucket.put_scalar_in_bucket("code", "String", "FR")
+        snapshot = bucket.clone()
+        bucket.put_scalar_in_bucket("other", "String", "DE")
+        assert snapshot.get_random_scalar_from_bucket_by_type("String") == "FR"
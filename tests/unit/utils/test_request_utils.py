@@ -0,0 +1,132 @@
+"""Unit tests for the per-profile session cache in request_utils."""
+
+from collections import OrderedDict
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from graphqler import config
+from graphqler.utils import request_utils
+
+
+def _fake_response(text: str = '{"data": {}}') -> MagicMock:
+    response = MagicMock(spec=requests.Response)
+    response.status_code = 200
+    response.text = text
+    return response
+
+
+@pytest.fixture(autouse=True)
+def _fresh_sessions():
+    request_utils.reset_session()
+    yield
+    request_utils.reset_session()
+
+
+def test_same_profile_headers_reuse_session():
+    with patch.object(requests.Session, "post", return_value=_fake_response()) as post:
+        request_utils.send_graphql_request_with_headers("http://example.com/graphql", "query { a }", {"Authorization": "Bearer secondary"})
+        request_utils.send_graphql_request_with_headers("http://example.com/graphql", "query { b }", {"Authorization": "Bearer secondary"})
+
+    assert post.call_count == 2
+    assert len(request_utils.profile_sessions) == 1
+
+
+def test_different_profiles_get_different_sessions():
+    first = request_utils.get_or_create_session_with_headers({"Authorization": "Bearer one"})
+    second = request_utils.get_or_create_session_with_headers({"Authorization": "Bearer two"})
+
+    assert first is not second
+    assert first.headers["Authorization"] == "Bearer one"
+    assert second.headers["Authorization"] == "Bearer two"
+
+
+def test_empty_authorization_is_not_sent():
+    profile_session = request_utils.get_or_create_session_with_headers({"Authorization": ""})
+    assert "Authorization" not in profile_session.headers
+
+
+def test_proxy_change_creates_new_session():
+    first = request_utils.get_or_create_session_with_headers({"Authorization": "Bearer one"})
+    with patch.object(config, "PROXY", "http://127.0.0.1:8080"):
+        proxied = request_utils.get_or_create_session_with_headers({"Authorization": "Bearer one"})
+
+    assert first is not proxied
+    assert proxied.verify is False
+
+
+def test_reset_session_invalidates_profile_sessions():
+    first = request_utils.get_or_create_session_with_headers({"Authorization": "Bearer one"})
+    with patch.object(first, "close") as close:
+        request_utils.reset_session()
+        close.assert_called_once()
+
+    assert request_utils.profile_sessions == {}
+    assert request_utils.get_or_create_session_with_headers({"Authorization": "Bearer one"}) is not first
+
+
+class TestPersistedQueries:
+    URL = "http://example.com/graphql"
+
+    @pytest.fixture(autouse=True)
+    def _apq(self):
+        request_utils.reset_persisted_queries()
+        with patch.object(config, "USE_PERSISTED_QUERIES", True):
+            yield
+        request_utils.reset_persisted_queries()
+
+    def test_registered_documents_are_sent_as_their_hash(self):
+        with patch.object(requests.Session, "post", return_value=_fake_response()) as post:
+            request_utils.send_graphql_request(self.URL, "query { a }")
+            request_utils.send_graphql_request(self.URL, "query { a }")
+
+        first, second = (call.kwargs["json"] for call in post.call_args_list)
+        assert first["query"] == "query { a }"
+        assert "query" not in second
+        assert second["extensions"]["persistedQuery"] == first["extensions"]["persistedQuery"]
+
+    def test_unknown_hash_falls_back_to_the_full_document(self):
+        request_utils.persisted_query_hashes[self.URL] = OrderedDict.fromkeys([request_utils.hashlib.sha256(b"query { a }").hexdigest()])
+        not_found = _fake_response('{"errors": [{"message": "PersistedQueryNotFound", "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"}}]}')
+        with patch.object(requests.Session, "post", side_effect=[not_found, _fake_response('{"data": {"a": 1}}')]) as post:
+            graphql_response, _ = request_utils.send_graphql_request(self.URL, "query { a }")
+
+        assert graphql_response == {"data": {"a": 1}}
+        assert "query" not in post.call_args_list[0].kwargs["json"]
+        assert post.call_args_list[1].kwargs["json"]["query"] == "query { a }"
+        assert request_utils.get_persisted_query_body(self.URL, {"query": "query { a }"})[0].get("query") is None
+
+    def test_least_recently_used_hashes_are_forgotten(self):
+        with patch.object(config, "PERSISTED_QUERIES_MAX_HASHES", 2), patch.object(requests.Session, "post", return_value=_fake_response()):
+            for query in ["query { a }", "query { b }", "query { a }", "query { c }"]:
+                request_utils.send_graphql_request(self.URL, query)
+
+        registered = [request_utils.get_persisted_query_body(self.URL, {"query": query})[0].get("query") is None for query in ["query { a }", "query { b }", "query { c }"]]
+        assert registered == [True, False, True]
+
+    def test_targets_without_apq_get_plain_documents(self):
+        not_supported = _fake_response('{"errors": [{"message": "PersistedQueryNotSupported"}]}')
+        with patch.object(requests.Session, "post", side_effect=[not_supported, _fake_response(), _fake_response()]) as post:
+            request_utils.send_graphql_request(self.URL, "query { a }")
+            request_utils.send_graphql_request(self.URL, "query { a }")
+
+        assert [call.kwargs["json"] for call in post.call_args_list[1:]] == [{"query": "query { a }"}] * 2
+
+    def test_invalid_documents_do_not_turn_apq_off(self):
+        invalid = '{"errors": [{"message": "Cannot query field \\"b\\" on type \\"Query\\"."}]}'
+        with patch.object(requests.Session, "post", side_effect=[_fake_response(invalid), _fake_response(invalid)]) as post:
+            request_utils.send_graphql_request(self.URL, "query { b }")
+            request_utils.send_graphql_request(self.URL, "query { b }")
+
+        # Not registered (no data), so the full document is sent again, and APQ stays on for the target
+        assert all(call.kwargs["json"]["query"] == "query { b }" for call in post.call_args_list)
+        assert self.URL not in request_utils.persisted_queries_unsupported_urls
+
+    def test_missing_query_error_turns_apq_off(self):
+        request_utils.persisted_query_hashes[self.URL] = OrderedDict.fromkeys([request_utils.hashlib.sha256(b"query { a }").hexdigest()])
+        missing = _fake_response('{"errors": [{"message": "Must provide query string."}]}')
+        with patch.object(requests.Session, "post", side_effect=[missing, _fake_response()]):
+            request_utils.send_graphql_request(self.URL, "query { a }")
+
+        assert self.URL in request_utils.persisted_queries_unsupported_urls
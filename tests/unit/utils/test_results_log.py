@@ -0,0 +1,97 @@
+"""Unit tests for the append-only endpoint results log and its exporter."""
+
+from unittest.mock import MagicMock, patch
+
+from graphqler import config
+from graphqler.fuzzer.engine.types import Result, ResultEnum
+from graphqler.utils.results_log import append_result, export_endpoint_results, read_results
+from graphqler.utils.stats import Stats
+
+
+def _result(payload: str, status_code: int = 200, result_enum: ResultEnum = ResultEnum.GENERAL_SUCCESS, response: dict | None = None) -> Result:
+    return Result(result_enum=result_enum, payload=payload, status_code=status_code, graphql_response=response or {"data": {"q": 1}})
+
+
+def _make_node(name: str = "users", graphql_type: str = "Query"):
+    node = MagicMock()
+    node.name = name
+    node.graphql_type = graphql_type
+    return node
+
+
+def test_append_and_read_round_trip(tmp_path):
+    log_path = tmp_path / "endpoint_results.jsonl"
+    append_result(log_path, "users", _result("query { users { id } }"))
+    append_result(log_path, "users", _result("query { users { name } }", 500, ResultEnum.EXTERNAL_FAILURE))
+
+    entries = list(read_results(log_path))
+    assert [e["payload"] for e in entries] == ["query { users { id } }", "query { users { name } }"]
+    assert entries[0]["success"] is True
+    assert entries[1]["status_code"] == 500
+
+
+def test_read_skips_truncated_last_line(tmp_path):
+    log_path = tmp_path / "endpoint_results.jsonl"
+    append_result(log_path, "users", _result("query { users { id } }"))
+    with open(log_path, "a") as f:
+        f.write('{"node": "users", "succ')
+
+    assert len(list(read_results(log_path))) == 1
+
+
+def test_export_renders_directory_layout(tmp_path):
+    log_path = tmp_path / "endpoint_results.jsonl"
+    out_dir = tmp_path / "endpoint_results"
+    append_result(log_path, "users", _result("query A", response={"data": {"first": 1}}))
+    append_result(log_path, "users", _result("query A", response={"data": {"second": 2}}))
+    append_result(log_path, "users", _result("query B"))
+    append_result(log_path, "a/b", _result("mutation C", 400, ResultEnum.EXTERNAL_FAILURE))
+
+    export_endpoint_results(log_path, out_dir)
+    # Exporting twice must not duplicate entries
+    export_endpoint_results(log_path, out_dir)
+
+    success_file = (out_dir / "users" / "success" / "200").read_text()
+    assert success_file.count("------------------Payload:-------------------") == 2
+    assert "'first': 1" in success_file
+    assert "'second': 2" not in success_file
+    assert (out_dir / "a_b" / "failure" / "400").exists()
+
+
+def test_stats_appends_each_unique_result_once(tmp_path):
+    stats = Stats.__wrapped__()  # ty: ignore[unresolved-attribute]
+    with patch.object(config, "SAVE_ENDPOINT_RESULTS", True):
+        stats.set_file_paths(str(tmp_path))
+        with patch.object(stats, "save"):
+            node = _make_node()
+            stats.update_stats_from_result(node, _result("query A"))
+            stats.update_stats_from_result(node, _result("query A"))
+            stats.update_stats_from_result(node, _result("query B"))
+
+        assert len(list(read_results(stats.results_log_path))) == 2
+        stats.save_endpoint_results()
+
+    assert (tmp_path / config.ENDPOINT_RESULTS_DIR_NAME / "users" / "success" / "200").exists()
+
+
+def test_resumed_run_keeps_earlier_results(tmp_path):
+    with patch.object(config, "SAVE_ENDPOINT_RESULTS", True):
+        # The interrupted run
+        stats = Stats.__wrapped__()  # ty: ignore[unresolved-attribute]
+        stats.set_file_paths(str(tmp_path))
+        with patch.object(stats, "save"):
+            stats.update_stats_from_result(_make_node(), _result("query A"))
+        snapshot = stats.snapshot()  # As saved in the checkpoint
+
+        # The resumed run
+        resumed = Stats.__wrapped__()  # ty: ignore[unresolved-attribute]
+        resumed.set_file_paths(str(tmp_path), resume=True)
+        resumed.restore(snapshot)
+        with patch.object(resumed, "save"):
+            resumed.update_stats_from_result(_make_node(), _result("query A"))
+            resumed.update_stats_from_result(_make_node(), _result("query B"))
+        resumed.save_endpoint_results()
+
+    assert [entry["payload"] for entry in read_results(resumed.results_log_path)] == ["query A", "query B"]
+    success_file = (tmp_path / config.ENDPOINT_RESULTS_DIR_NAME / "users" / "success" / "200").read_text()
+    assert "query A" in success_file and "query B" in success_file
@@ -0,0 +1,94 @@
+"""Unit tests for RunContext: per-run config and singletons."""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from graphqler import config
+from graphqler.utils.logging_utils import Logger
+from graphqler.utils.run_context import RunContext, get_current_run_context, in_current_context
+from graphqler.utils.stats import Stats
+
+
+class TestConfig:
+    def test_overrides_only_apply_inside_the_context(self):
+        default_max_time = config.MAX_TIME
+        with RunContext(MAX_TIME=5).activate():
+            assert config.MAX_TIME == 5
+            assert config.DEBUG is False  # Settings without an override fall back to the global config
+        assert config.MAX_TIME == default_max_time
+
+    def test_setting_config_inside_a_context_does_not_leak(self):
+        default_output_directory = config.OUTPUT_DIRECTORY
+        run_context = RunContext()
+        with run_context.activate():
+            config.OUTPUT_DIRECTORY = "/tmp/run-a"
+            assert config.OUTPUT_DIRECTORY == "/tmp/run-a"
+        assert config.OUTPUT_DIRECTORY == default_output_directory
+        assert run_context.config == {"OUTPUT_DIRECTORY": "/tmp/run-a"}
+
+    def test_concurrent_runs_see_their_own_config(self):
+        barrier = threading.Barrier(2)
+        seen = {}
+
+        def _run(max_time: int):
+            with RunContext(MAX_TIME=max_time).activate():
+                barrier.wait()
+                seen[max_time] = config.MAX_TIME
+
+        threads = [threading.Thread(target=_run, args=(max_time,)) for max_time in (10, 20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert seen == {10: 10, 20: 20}
+
+
+class TestSingletons:
+    def test_each_context_has_its_own_instances(self):
+        first, second = RunContext(), RunContext()
+        assert first.stats is first.stats
+        assert first.stats is not second.stats
+        assert first.stats is not Stats()
+
+    def test_reset_only_clears_the_active_context(self):
+        run_context = RunContext()
+        stats = run_context.stats
+        global_stats = Stats()
+        with run_context.activate():
+            Stats.reset()  # ty: ignore[unresolved-attribute]
+            assert Stats() is not stats
+        assert Stats() is global_stats
+
+
+class TestThreads:
+    def test_in_current_context_carries_the_context_to_pool_threads(self):
+        run_context = RunContext(MAX_TIME=7)
+        with run_context.activate():
+            task = in_current_context(lambda: (get_current_run_context(), config.MAX_TIME))
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = [future.result() for future in [executor.submit(task) for _ in range(4)]]
+        assert results == [(run_context, 7)] * 4
+
+
+class TestLoggers:
+    def test_loggers_are_closed_when_the_context_exits(self, tmp_path):
+        def _open_handlers() -> list[logging.Handler]:
+            loggers = [logger for logger in logging.root.manager.loggerDict.values() if isinstance(logger, logging.Logger)]
+            return [handler for logger in loggers for handler in logger.handlers if isinstance(handler, logging.FileHandler)]
+
+        handlers_before = len(_open_handlers())
+        for i in range(20):
+            run_context = RunContext(OUTPUT_DIRECTORY=str(tmp_path / f"run-{i}"))
+            with run_context.activate():
+                Logger().get_fuzzer_logger().info("fuzzing")
+                with run_context.activate():  # A nested block doesn't close the loggers the outer one still uses
+                    pass
+                fuzzer_logger = Logger().get_fuzzer_logger()
+                assert fuzzer_logger.handlers
+                Logger().get_detector_logger().info("detecting")
+            assert not any(name.startswith(f"{run_context.name}.") for name in logging.root.manager.loggerDict)
+            assert not fuzzer_logger.handlers
+
+        assert len(_open_handlers()) == handlers_before
+        assert "fuzzing" in (tmp_path / "run-0" / config.FUZZER_LOG_FILE_PATH).read_text()
@@ -0,0 +1,105 @@
+"""Unit tests for batched Stats persistence (STATS_SAVE_INTERVAL)."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+from graphqler import config
+from graphqler.utils.stats import Stats
+
+
+def _make_node(name: str = "users", graphql_type: str = "Query"):
+    node = MagicMock()
+    node.name = name
+    node.graphql_type = graphql_type
+    return node
+
+
+def _patched_save(stats_obj):
+    """Replace save() with a mock that mimics the dirty/timestamp bookkeeping of the real save()."""
+    def _save():
+        stats_obj._dirty = False
+        stats_obj._last_save_time = time.time()
+    return patch.object(stats_obj, "save", side_effect=_save)
+
+
+def _fresh_stats():
+    return Stats.__wrapped__()  # ty: ignore[unresolved-attribute]
+
+
+class TestBatchedSave:
+    def test_updates_within_interval_are_batched(self):
+        stats = _fresh_stats()
+        with patch.object(config, "STATS_SAVE_INTERVAL", 60), _patched_save(stats) as save:
+            for _ in range(50):
+                stats.add_successful_node(_make_node())
+                stats.add_http_status_code("users", 200)
+
+        # Only the very first update is flushed immediately; the rest wait for the interval
+        assert save.call_count == 1
+        assert stats._dirty is True
+        assert stats.number_of_successes == 50
+
+    def test_zero_interval_saves_every_update(self):
+        stats = _fresh_stats()
+        with patch.object(config, "STATS_SAVE_INTERVAL", 0), _patched_save(stats) as save:
+            for _ in range(5):
+                stats.add_failed_node(_make_node())
+
+        assert save.call_count == 5
+
+    def test_flush_if_due_saves_after_interval(self):
+        stats = _fresh_stats()
+        with patch.object(config, "STATS_SAVE_INTERVAL", 60), _patched_save(stats) as save:
+            stats.add_successful_node(_make_node())
+            stats.add_successful_node(_make_node())
+            assert save.call_count == 1
+
+            stats.flush_if_due()
+            assert save.call_count == 1
+
+            stats._last_save_time -= 61
+            stats.flush_if_due()
+            assert save.call_count == 2
+            assert stats._dirty is False
+
+    def test_flush_only_saves_when_dirty(self):
+        stats = _fresh_stats()
+        with _patched_save(stats) as save:
+            stats.flush()
+            assert save.call_count == 0
+
+            stats.record_node_timing(_make_node(), 0.5)
+            stats.flush()
+            assert save.call_count == 1
+
+    def test_set_phase_flushes_pending_updates(self):
+        stats = _fresh_stats()
+        with patch.object(config, "STATS_SAVE_INTERVAL", 60), _patched_save(stats) as save:
+            stats.add_successful_node(_make_node())
+            stats.add_successful_node(_make_node())
+            stats.set_phase("islands")
+
+        assert stats.phase == "islands"
+        assert save.call_count == 2
+        assert stats._dirty is False
+
+    def test_vulnerabilities_mark_stats_dirty(self):
+        stats = _fresh_stats()
+        stats.add_vulnerability("SQL_INJECTION", "users", is_vulnerable=True)
+        assert stats._dirty is True
+
+
+class TestSnapshot:
+    def test_restore_brings_back_counters_but_keeps_current_paths(self, tmp_path):
+        stats = _fresh_stats()
+        with patch.object(config, "STATS_SAVE_INTERVAL", 60), _patched_save(stats):
+            stats.add_successful_node(_make_node())
+        snapshot = stats.snapshot()
+        stats.add_successful_node(_make_node("posts"))  # The snapshot is a copy, not a view
+
+        restored = _fresh_stats()
+        restored.set_file_paths(str(tmp_path))
+        restored.restore(snapshot)
+        assert restored.number_of_successes == 1
+        assert restored.successful_nodes == {"Query|users": 1}
+        assert restored.file_path == tmp_path / config.STATS_FILE_NAME